@@ -22,18 +22,13 @@ Example:
     >>> history = client.hyperliquid.orderbook.history("ETH", start="2024-01-01", end="2024-01-02")
 """
 
+import importlib
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
 from .client import Client
 from .exchanges import HyperliquidClient, Hip3Client, LighterClient
 from .resources.orderbook import LighterGranularity
-from .orderbook_reconstructor import (
-    OrderBookReconstructor,
-    OrderbookDelta,
-    TickData,
-    ReconstructedOrderBook,
-    ReconstructOptions,
-    reconstruct_orderbook,
-    reconstruct_final,
-)
 from .types import (
     OrderBook,
     Trade,
@@ -84,14 +79,79 @@ from .types import (
     TimestampedRecord,
 )
 
-# WebSocket client (optional import - requires websockets package)
-try:
+if TYPE_CHECKING:
+    from .liquidation_arrays import LiquidationArrays
+    from .orderbook_reconstructor import (
+        SIDE_ASK,
+        SIDE_BID,
+        DeltaArrays,
+        NumericPriceLevel,
+        NumericReconstructedOrderBook,
+        OrderBookArray,
+        OrderbookDelta,
+        OrderBookReconstructor,
+        ReconstructedOrderBook,
+        ReconstructedOrderBookView,
+        ReconstructOptions,
+        SnapshotArrays,
+        TickData,
+        reconstruct_final,
+        reconstruct_many,
+        reconstruct_orderbook,
+    )
+    from .resample import candles_from_trades, resample_candles
     from .websocket import OxArchiveWs, WsOptions
-    _HAS_WEBSOCKET = True
-except ImportError:
-    _HAS_WEBSOCKET = False
-    OxArchiveWs = None  # type: ignore
-    WsOptions = None  # type: ignore
+
+# Loaded on first attribute access (PEP 562) so that `import oxarchive` stays
+# cheap for code that only uses the REST client.
+_LAZY = {
+    "OrderBookReconstructor": ".orderbook_reconstructor",
+    "OrderbookDelta": ".orderbook_reconstructor",
+    "DeltaArrays": ".orderbook_reconstructor",
+    "OrderBookArray": ".orderbook_reconstructor",
+    "TickData": ".orderbook_reconstructor",
+    "ReconstructedOrderBook": ".orderbook_reconstructor",
+    "ReconstructedOrderBookView": ".orderbook_reconstructor",
+    "ReconstructOptions": ".orderbook_reconstructor",
+    "SnapshotArrays": ".orderbook_reconstructor",
+    "NumericPriceLevel": ".orderbook_reconstructor",
+    "NumericReconstructedOrderBook": ".orderbook_reconstructor",
+    "SIDE_BID": ".orderbook_reconstructor",
+    "SIDE_ASK": ".orderbook_reconstructor",
+    "reconstruct_orderbook": ".orderbook_reconstructor",
+    "reconstruct_final": ".orderbook_reconstructor",
+    "reconstruct_many": ".orderbook_reconstructor",
+    # Columnar liquidations (requires numpy)
+    "LiquidationArrays": ".liquidation_arrays",
+    # OHLCV aggregation (requires numpy)
+    "candles_from_trades": ".resample",
+    "resample_candles": ".resample",
+    # WebSocket client (optional - requires websockets package)
+    "OxArchiveWs": ".websocket",
+    "WsOptions": ".websocket",
+}
+
+_HAS_WEBSOCKET = find_spec("websockets") is not None
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if module_name != ".websocket":
+            raise
+        # websockets is not installed
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __version__ = "0.9.2"
 
@@ -108,11 +168,25 @@ __all__ = [
     # Orderbook Reconstructor (Enterprise tier)
     "OrderBookReconstructor",
     "OrderbookDelta",
+    "DeltaArrays",
+    "OrderBookArray",
     "TickData",
     "ReconstructedOrderBook",
+    "ReconstructedOrderBookView",
     "ReconstructOptions",
+    "SnapshotArrays",
+    "NumericPriceLevel",
+    "NumericReconstructedOrderBook",
+    "SIDE_BID",
+    "SIDE_ASK",
     "reconstruct_orderbook",
     "reconstruct_final",
+    "reconstruct_many",
+    # Columnar liquidations
+    "LiquidationArrays",
+    # OHLCV aggregation
+    "candles_from_trades",
+    "resample_candles",
     # Types
     "OrderBook",
     "Trade",
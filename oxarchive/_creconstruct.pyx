@@ -0,0 +1,98 @@
+# cython: language_level=3
+# distutils: language = c++
+# distutils: extra_compile_args = -O3
+"""
+Compiled book side for the orderbook reconstructor.
+
+``CBookSide`` keeps one side of the book in a C++ ``std::map[double, double]``
+(key -> size, O(log M) updates) and implements the subset of the
+``SortedDict`` API that :class:`~oxarchive.orderbook_reconstructor.OrderBookReconstructor`
+relies on. When this module has been compiled it is picked up automatically
+in place of ``SortedDict``/``_ArrayBookSide``; every reconstruction method
+then runs its level updates without Python-level tree or bisect work.
+
+The package ships as pure Python, so this extension is opt-in. Build it in
+place with::
+
+    pip install cython
+    cythonize -i oxarchive/_creconstruct.pyx
+
+Add ``-march=native`` to the compile flags (``CFLAGS``) for a local build
+that does not need to be portable.
+"""
+
+from cython.operator cimport dereference as deref, preincrement as inc, predecrement as dec
+from libcpp.map cimport map as cpp_map
+
+
+ctypedef cpp_map[double, double] Levels
+
+
+cdef class _ItemIterator:
+    """Ascending (key, size) iterator over a ``CBookSide``."""
+
+    cdef object _owner
+    cdef Levels* _levels
+    cdef Levels.iterator _it
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._it == self._levels.end():
+            raise StopIteration
+        item = (deref(self._it).first, deref(self._it).second)
+        inc(self._it)
+        return item
+
+
+cdef class CBookSide:
+    """Sorted key -> size map backed by ``std::map``."""
+
+    cdef Levels _levels
+
+    def __init__(self, items=()):
+        cdef double key, size
+        for key, size in items:
+            self._levels[key] = size
+
+    def __len__(self):
+        return self._levels.size()
+
+    def __setitem__(self, double key, double size):
+        self._levels[key] = size
+
+    def pop(self, double key, default=None):
+        cdef Levels.iterator it = self._levels.find(key)
+        if it == self._levels.end():
+            return default
+        size = deref(it).second
+        self._levels.erase(it)
+        return size
+
+    def peekitem(self, Py_ssize_t index=-1):
+        cdef Py_ssize_t n = self._levels.size()
+        cdef Levels.iterator it
+        if index < 0:
+            index += n
+        if index < 0 or index >= n:
+            raise IndexError("book side index out of range")
+        if index == n - 1:
+            it = self._levels.end()
+            dec(it)
+        else:
+            it = self._levels.begin()
+            while index > 0:
+                inc(it)
+                index -= 1
+        return deref(it).first, deref(it).second
+
+    def items(self):
+        cdef _ItemIterator items = _ItemIterator.__new__(_ItemIterator)
+        items._owner = self
+        items._levels = &self._levels
+        items._it = self._levels.begin()
+        return items
+
+    def clear(self):
+        self._levels.clear()
@@ -0,0 +1,64 @@
+"""Response envelopes shared by the API resources.
+
+API responses wrap their payload as ``{"data": ..., "meta": {...}}``.
+Validating the raw body against one envelope model lets pydantic-core parse
+and check the whole response in a single pass, without an intermediate dict.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Generic, Optional, TypeVar, cast
+
+from .types import CursorResponse, _Model
+
+T = TypeVar("T")
+
+
+class _PageMeta(_Model):
+    # Only the cursor is read; other meta fields are ignored, not required
+    next_cursor: Optional[str] = None
+
+
+class _Envelope(_Model, Generic[T]):
+    data: T
+
+
+class _Page(_Model, Generic[T]):
+    data: list[T]
+    meta: Optional[_PageMeta] = None
+
+
+# One parametrized model per payload type, built on first use
+_ENVELOPES: dict[Any, type[_Envelope[Any]]] = {}
+_PAGES: dict[Any, type[_Page[Any]]] = {}
+
+
+def _envelope(item: Any) -> type[_Envelope[Any]]:
+    model = _ENVELOPES.get(item)
+    if model is None:
+        model = _ENVELOPES[item] = _Envelope[item]
+    return model
+
+
+def _page(item: Any) -> type[_Page[Any]]:
+    model = _PAGES.get(item)
+    if model is None:
+        model = _PAGES[item] = _Page[item]
+    return model
+
+
+def parse_data(raw: bytes, item: type[T]) -> T:
+    """Validate a response body and return its ``data`` as one ``item``."""
+    return cast(T, _envelope(item).model_validate_json(raw).data)
+
+
+def parse_list(raw: bytes, item: type[T]) -> list[T]:
+    """Validate a response body whose ``data`` is a list of ``item``."""
+    return cast("list[T]", _page(item).model_validate_json(raw).data)
+
+
+def parse_page(raw: bytes, item: type[T]) -> CursorResponse[list[T]]:
+    """Validate a paginated response body into a CursorResponse of ``item`` values."""
+    page = _page(item).model_validate_json(raw)
+    next_cursor = page.meta.next_cursor if page.meta is not None else None
+    return CursorResponse(data=page.data, next_cursor=next_cursor)
@@ -0,0 +1,121 @@
+"""
+Numba-compiled kernel for per-delta orderbook reconstruction.
+
+Used by :class:`~oxarchive.orderbook_reconstructor.OrderBookReconstructor`
+when ``numba`` is installed and every intermediate snapshot is requested
+with a bounded depth. Each book side is held as a key-sorted array
+(bids keyed by negated price), so an update is a binary search plus a
+memmove, and the top ``depth`` levels are copied out after every delta.
+
+Requires the ``fast`` extra (``pip install oxarchive[fast]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    raise ImportError(
+        "Compiled reconstruction requires numpy and numba. "
+        "Install with: pip install oxarchive[fast]"
+    )
+
+
+@njit(cache=True)  # type: ignore[untyped-decorator]
+def _upsert(
+    keys: Any, sizes: Any, orders: Any, count: int, key: float, size: float
+) -> int:
+    """Insert, update or remove one level in a key-sorted side; returns the new count."""
+    pos = np.searchsorted(keys[:count], key)
+    if pos < count and keys[pos] == key:
+        if size == 0.0:
+            keys[pos : count - 1] = keys[pos + 1 : count]
+            sizes[pos : count - 1] = sizes[pos + 1 : count]
+            orders[pos : count - 1] = orders[pos + 1 : count]
+            return count - 1
+        sizes[pos] = size
+        orders[pos] = 1
+        return count
+
+    if size == 0.0:
+        return count
+
+    keys[pos + 1 : count + 1] = keys[pos:count].copy()
+    sizes[pos + 1 : count + 1] = sizes[pos:count].copy()
+    orders[pos + 1 : count + 1] = orders[pos:count].copy()
+    keys[pos] = key
+    sizes[pos] = size
+    orders[pos] = 1
+    return count + 1
+
+
+@njit(cache=True)  # type: ignore[untyped-decorator]
+def _emit_top(
+    keys: Any,
+    sizes: Any,
+    orders: Any,
+    count: int,
+    sign: float,
+    step: int,
+    out_px: Any,
+    out_sz: Any,
+    out_n: Any,
+    out_count: Any,
+) -> None:
+    k = min(count, out_px.shape[1])
+    for j in range(k):
+        out_px[step, j] = sign * keys[j]
+        out_sz[step, j] = sizes[j]
+        out_n[step, j] = orders[j]
+    out_count[step] = k
+
+
+@njit(cache=True)  # type: ignore[untyped-decorator]
+def apply_all(
+    bid_keys: Any,
+    bid_sizes: Any,
+    bid_orders: Any,
+    n_bids: int,
+    ask_keys: Any,
+    ask_sizes: Any,
+    ask_orders: Any,
+    n_asks: int,
+    sides: Any,
+    prices: Any,
+    sizes: Any,
+    out_bid_px: Any,
+    out_bid_sz: Any,
+    out_bid_n: Any,
+    out_bid_count: Any,
+    out_ask_px: Any,
+    out_ask_sz: Any,
+    out_ask_n: Any,
+    out_ask_count: Any,
+) -> tuple[int, int]:
+    """
+    Apply sequence-sorted deltas, recording the top levels after each one.
+
+    Side arrays must have spare capacity for every delta. Row 0 of each
+    output holds the initial state and row ``i + 1`` the state after delta
+    ``i``. Returns the final ``(n_bids, n_asks)``; the side arrays are left
+    holding the final book.
+    """
+    _emit_top(bid_keys, bid_sizes, bid_orders, n_bids, -1.0, 0,
+              out_bid_px, out_bid_sz, out_bid_n, out_bid_count)
+    _emit_top(ask_keys, ask_sizes, ask_orders, n_asks, 1.0, 0,
+              out_ask_px, out_ask_sz, out_ask_n, out_ask_count)
+
+    for i in range(sides.shape[0]):
+        if sides[i] == 0:
+            n_bids = _upsert(bid_keys, bid_sizes, bid_orders, n_bids, -prices[i], sizes[i])
+        else:
+            n_asks = _upsert(ask_keys, ask_sizes, ask_orders, n_asks, prices[i], sizes[i])
+        _emit_top(bid_keys, bid_sizes, bid_orders, n_bids, -1.0, i + 1,
+                  out_bid_px, out_bid_sz, out_bid_n, out_bid_count)
+        _emit_top(ask_keys, ask_sizes, ask_orders, n_asks, 1.0, i + 1,
+                  out_ask_px, out_ask_sz, out_ask_n, out_ask_count)
+
+    return n_bids, n_asks
@@ -0,0 +1,62 @@
+"""Timestamp conversion shared by the API resources."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+
+from .types import Timestamp
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _datetime_to_ms(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        # Naive datetimes are local time, as in datetime.timestamp()
+        return int(dt.timestamp() * 1000)
+    # Exact integer arithmetic; timestamp() * 1000 can round down by 1ms
+    return (dt - _EPOCH) // _ONE_MS
+
+
+def _datetime_to_ns(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        return int(dt.timestamp() * 1_000_000) * 1000
+    return (dt - _EPOCH) // _ONE_US * 1000
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    # Integer offset from the epoch keeps full microsecond precision, which
+    # datetime.fromtimestamp(ns / 1e9) loses to float rounding
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+@lru_cache(maxsize=256)
+def _str_to_ms(ts: str) -> int:
+    # Numeric strings (e.g. next_cursor values fed back as cursor) are already
+    # Unix ms; skip the ISO parse and the exception it would raise
+    if ts.isdecimal():
+        return int(ts)
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except ValueError:
+        return int(ts)
+    return _datetime_to_ms(dt)
+
+
+def to_unix_ms(ts: Optional[Timestamp]) -> Optional[int]:
+    """Convert a timestamp (Unix ms, datetime or ISO 8601 string) to Unix milliseconds."""
+    # Exact type check first: plain ints are by far the most common input
+    if type(ts) is int:
+        return ts
+    if ts is None:
+        return None
+    if isinstance(ts, str):
+        return _str_to_ms(ts)
+    if isinstance(ts, datetime):
+        return _datetime_to_ms(ts)
+    if isinstance(ts, (int, float)):
+        return int(ts)
+    return None
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+import httpx
+
 from .http import HttpClient
 from .exchanges import HyperliquidClient, LighterClient
 from .resources import (
@@ -69,6 +71,8 @@ class Client:
         *,
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
     ):
         """
         Create a new 0xarchive client.
@@ -77,6 +81,9 @@ class Client:
             api_key: Your 0xarchive API key
             base_url: Base URL for the API (defaults to https://api.0xarchive.io)
             timeout: Request timeout in seconds (defaults to 30.0)
+            limits: Connection pool limits shared by all requests (defaults to
+                100 connections, 40 kept alive for 60s)
+            http2: Use HTTP/2 (defaults to False; requires ``pip install oxarchive[http2]``)
         """
         if not api_key:
             raise ValueError("API key is required. Get one at https://0xarchive.io/signup")
@@ -85,6 +92,8 @@ class Client:
             base_url=base_url or DEFAULT_BASE_URL,
             api_key=api_key,
             timeout=timeout or DEFAULT_TIMEOUT,
+            limits=limits,
+            http2=http2,
         )
 
         # Exchange-specific clients (recommended)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Optional
 
+from ._envelopes import parse_data, parse_page
+from ._timestamp import to_unix_ms
 from .http import HttpClient
 from .resources import (
     OrderBookResource,
@@ -68,21 +69,7 @@ class HyperliquidClient:
         self.hip3 = Hip3Client(http)
         """HIP-3 builder-deployed perpetuals (February 2026+)"""
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     # -----------------------------------------------------------------
     # Convenience methods (not tied to a specific resource)
@@ -119,14 +106,11 @@ class HyperliquidClient:
             "limit": limit,
             "cursor": cursor,
         }
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"/v1/hyperliquid/liquidations/{coin.upper()}/volume",
             params=params,
         )
-        return CursorResponse(
-            data=[LiquidationVolume.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, LiquidationVolume)
 
     async def aget_liquidation_volume(
         self,
@@ -146,14 +130,11 @@ class HyperliquidClient:
             "limit": limit,
             "cursor": cursor,
         }
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"/v1/hyperliquid/liquidations/{coin.upper()}/volume",
             params=params,
         )
-        return CursorResponse(
-            data=[LiquidationVolume.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, LiquidationVolume)
 
     def get_freshness(self, coin: str) -> CoinFreshness:
         """
@@ -168,13 +149,13 @@ class HyperliquidClient:
         Returns:
             CoinFreshness with per-data-type lag information
         """
-        data = self._http.get(f"/v1/hyperliquid/freshness/{coin.upper()}")
-        return CoinFreshness.model_validate(data["data"])
+        raw = self._http.get_bytes(f"/v1/hyperliquid/freshness/{coin.upper()}")
+        return parse_data(raw, CoinFreshness)
 
     async def aget_freshness(self, coin: str) -> CoinFreshness:
         """Async version of get_freshness()."""
-        data = await self._http.aget(f"/v1/hyperliquid/freshness/{coin.upper()}")
-        return CoinFreshness.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"/v1/hyperliquid/freshness/{coin.upper()}")
+        return parse_data(raw, CoinFreshness)
 
     def get_summary(self, coin: str) -> CoinSummary:
         """
@@ -189,13 +170,13 @@ class HyperliquidClient:
         Returns:
             CoinSummary with all market metrics
         """
-        data = self._http.get(f"/v1/hyperliquid/summary/{coin.upper()}")
-        return CoinSummary.model_validate(data["data"])
+        raw = self._http.get_bytes(f"/v1/hyperliquid/summary/{coin.upper()}")
+        return parse_data(raw, CoinSummary)
 
     async def aget_summary(self, coin: str) -> CoinSummary:
         """Async version of get_summary()."""
-        data = await self._http.aget(f"/v1/hyperliquid/summary/{coin.upper()}")
-        return CoinSummary.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"/v1/hyperliquid/summary/{coin.upper()}")
+        return parse_data(raw, CoinSummary)
 
     def get_price_history(
         self,
@@ -228,14 +209,11 @@ class HyperliquidClient:
             "limit": limit,
             "cursor": cursor,
         }
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"/v1/hyperliquid/prices/{coin.upper()}",
             params=params,
         )
-        return CursorResponse(
-            data=[PriceSnapshot.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, PriceSnapshot)
 
     async def aget_price_history(
         self,
@@ -255,14 +233,11 @@ class HyperliquidClient:
             "limit": limit,
             "cursor": cursor,
         }
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"/v1/hyperliquid/prices/{coin.upper()}",
             params=params,
         )
-        return CursorResponse(
-            data=[PriceSnapshot.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, PriceSnapshot)
 
 
 class Hip3Client:
@@ -301,21 +276,7 @@ class Hip3Client:
         self.candles = CandlesResource(http, base_path, coin_transform=coin_transform)
         """OHLCV candle data"""
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     def get_freshness(self, coin: str) -> CoinFreshness:
         """
@@ -327,13 +288,13 @@ class Hip3Client:
         Returns:
             CoinFreshness with per-data-type lag information
         """
-        data = self._http.get(f"/v1/hyperliquid/hip3/freshness/{coin}")
-        return CoinFreshness.model_validate(data["data"])
+        raw = self._http.get_bytes(f"/v1/hyperliquid/hip3/freshness/{coin}")
+        return parse_data(raw, CoinFreshness)
 
     async def aget_freshness(self, coin: str) -> CoinFreshness:
         """Async version of get_freshness()."""
-        data = await self._http.aget(f"/v1/hyperliquid/hip3/freshness/{coin}")
-        return CoinFreshness.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"/v1/hyperliquid/hip3/freshness/{coin}")
+        return parse_data(raw, CoinFreshness)
 
     def get_summary(self, coin: str) -> CoinSummary:
         """
@@ -345,13 +306,13 @@ class Hip3Client:
         Returns:
             CoinSummary with all market metrics
         """
-        data = self._http.get(f"/v1/hyperliquid/hip3/summary/{coin}")
-        return CoinSummary.model_validate(data["data"])
+        raw = self._http.get_bytes(f"/v1/hyperliquid/hip3/summary/{coin}")
+        return parse_data(raw, CoinSummary)
 
     async def aget_summary(self, coin: str) -> CoinSummary:
         """Async version of get_summary()."""
-        data = await self._http.aget(f"/v1/hyperliquid/hip3/summary/{coin}")
-        return CoinSummary.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"/v1/hyperliquid/hip3/summary/{coin}")
+        return parse_data(raw, CoinSummary)
 
     def get_price_history(
         self,
@@ -384,14 +345,11 @@ class Hip3Client:
             "limit": limit,
             "cursor": cursor,
         }
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"/v1/hyperliquid/hip3/prices/{coin}",
             params=params,
         )
-        return CursorResponse(
-            data=[PriceSnapshot.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, PriceSnapshot)
 
     async def aget_price_history(
         self,
@@ -411,14 +369,11 @@ class Hip3Client:
             "limit": limit,
             "cursor": cursor,
         }
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"/v1/hyperliquid/hip3/prices/{coin}",
             params=params,
         )
-        return CursorResponse(
-            data=[PriceSnapshot.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, PriceSnapshot)
 
 
 class LighterClient:
@@ -457,21 +412,7 @@ class LighterClient:
         self.candles = CandlesResource(http, base_path)
         """OHLCV candle data"""
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     def get_freshness(self, coin: str) -> CoinFreshness:
         """
@@ -483,13 +424,13 @@ class LighterClient:
         Returns:
             CoinFreshness with per-data-type lag information
         """
-        data = self._http.get(f"/v1/lighter/freshness/{coin.upper()}")
-        return CoinFreshness.model_validate(data["data"])
+        raw = self._http.get_bytes(f"/v1/lighter/freshness/{coin.upper()}")
+        return parse_data(raw, CoinFreshness)
 
     async def aget_freshness(self, coin: str) -> CoinFreshness:
         """Async version of get_freshness()."""
-        data = await self._http.aget(f"/v1/lighter/freshness/{coin.upper()}")
-        return CoinFreshness.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"/v1/lighter/freshness/{coin.upper()}")
+        return parse_data(raw, CoinFreshness)
 
     def get_summary(self, coin: str) -> CoinSummary:
         """
@@ -501,13 +442,13 @@ class LighterClient:
         Returns:
             CoinSummary with all market metrics
         """
-        data = self._http.get(f"/v1/lighter/summary/{coin.upper()}")
-        return CoinSummary.model_validate(data["data"])
+        raw = self._http.get_bytes(f"/v1/lighter/summary/{coin.upper()}")
+        return parse_data(raw, CoinSummary)
 
     async def aget_summary(self, coin: str) -> CoinSummary:
         """Async version of get_summary()."""
-        data = await self._http.aget(f"/v1/lighter/summary/{coin.upper()}")
-        return CoinSummary.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"/v1/lighter/summary/{coin.upper()}")
+        return parse_data(raw, CoinSummary)
 
     def get_price_history(
         self,
@@ -540,14 +481,11 @@ class LighterClient:
             "limit": limit,
             "cursor": cursor,
         }
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"/v1/lighter/prices/{coin.upper()}",
             params=params,
         )
-        return CursorResponse(
-            data=[PriceSnapshot.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, PriceSnapshot)
 
     async def aget_price_history(
         self,
@@ -567,11 +505,8 @@ class LighterClient:
             "limit": limit,
             "cursor": cursor,
         }
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"/v1/lighter/prices/{coin.upper()}",
             params=params,
         )
-        return CursorResponse(
-            data=[PriceSnapshot.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, PriceSnapshot)
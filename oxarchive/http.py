@@ -2,24 +2,82 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, TypeVar, Type
+import asyncio
+import json
+import threading
+from collections.abc import Coroutine
+from importlib.util import find_spec
+from typing import Any, Callable, Optional, TypeVar, Type, Union
 import httpx
 from pydantic import BaseModel
 
 from .types import OxArchiveError
 
+_json_loads: Callable[[Union[str, bytes]], Any]
+_json_dumps: Callable[[Any], bytes]
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        # Same compact encoding httpx uses for json=
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+_HAS_HTTP2 = find_spec("h2") is not None
+
+# One pool is shared by every resource of a Client, so size it for
+# concurrent use across resources and keep idle connections warm. Idle
+# connections live for 60s so paginated loops that process each page
+# between requests still reuse the TLS session instead of reconnecting.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=40,
+    keepalive_expiry=60.0,
+)
+
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
 
 
 class HttpClient:
     """Internal HTTP client for making API requests."""
 
-    def __init__(self, base_url: str, api_key: str, timeout: float):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        # One keep-alive pool per client, reused by every resource and request
+        self.limits = limits or DEFAULT_LIMITS
+        # HTTP/2 multiplexes requests over one connection; opt-in, needs h2
+        if http2 and not _HAS_HTTP2:
+            raise ImportError(
+                "HTTP/2 support requires the 'h2' package. "
+                "Install with: pip install oxarchive[http2]"
+            )
+        self.http2 = http2
         self._client: Optional[httpx.Client] = None
         self._async_client: Optional[httpx.AsyncClient] = None
+        # Background event loop for run_sync(), started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_client: Optional[httpx.AsyncClient] = None
+        self._loop_lock = threading.Lock()
 
     def _get_headers(self) -> dict[str, str]:
         return {
@@ -35,20 +93,85 @@ class HttpClient:
                 base_url=self.base_url,
                 headers=self._get_headers(),
                 timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
             )
         return self._client
 
+    def _new_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._get_headers(),
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+        )
+
     @property
     def async_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
+        if self._loop is not None and self._on_background_loop():
+            # Async connections are bound to their event loop, so requests
+            # made by run_sync() get their own client on the background loop
+            if self._loop_client is None:
+                self._loop_client = self._new_async_client()
+            return self._loop_client
         if self._async_client is None:
-            self._async_client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=self._get_headers(),
-                timeout=self.timeout,
-            )
+            self._async_client = self._new_async_client()
         return self._async_client
 
+    def _on_background_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """Get or start the event loop thread used by run_sync()."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="oxarchive-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def run_sync(self, *coros: Coroutine[Any, Any, R]) -> list[R]:
+        """
+        Run coroutines concurrently on a background event loop and wait for them.
+
+        Lets synchronous callers overlap several async requests without
+        managing an event loop. Results are returned in argument order; the
+        first exception raised is propagated once every coroutine has finished.
+        """
+        loop = self._background_loop()
+        futures = [asyncio.run_coroutine_threadsafe(coro, loop) for coro in coros]
+        results: list[R] = []
+        error: Optional[BaseException] = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except BaseException as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return results
+
+    def _stop_background_loop(self) -> None:
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            if loop is None or thread is None:
+                return
+            if self._loop_client is not None:
+                asyncio.run_coroutine_threadsafe(self._loop_client.aclose(), loop).result()
+                self._loop_client = None
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            self._loop = self._loop_thread = None
+
     def close(self) -> None:
         """Close the HTTP clients.
 
@@ -70,17 +193,20 @@ class HttpClient:
                 # No running loop, close synchronously (httpx supports this)
                 self._async_client.close()
             self._async_client = None
+        self._stop_background_loop()
 
     async def aclose(self) -> None:
         """Close the async HTTP client."""
         if self._async_client is not None:
             await self._async_client.aclose()
             self._async_client = None
+        self._stop_background_loop()
 
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Handle the API response and raise errors if needed."""
         try:
-            data = response.json()
+            # orjson (when installed) parses large tick payloads several times faster
+            data = _json_loads(response.content)
         except Exception:
             raise OxArchiveError(
                 f"Invalid JSON response: {response.text[:200]}",
@@ -120,13 +246,90 @@ class HttpClient:
         response = await self.async_client.get(path, params=params)
         return self._handle_response(response)
 
+    def _handle_raw_response(self, response: httpx.Response) -> bytes:
+        """Return the raw body of a successful response, raising like _handle_response."""
+        if not response.is_success:
+            self._handle_response(response)
+        return response.content
+
+    def get_bytes(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Make a synchronous GET request and return the raw JSON body.
+
+        Lets callers validate straight from JSON (e.g. ``TypeAdapter.validate_json``)
+        without first building an intermediate dict.
+        """
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        response = self.client.get(path, params=params)
+        return self._handle_raw_response(response)
+
+    async def aget_bytes(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> bytes:
+        """Make an asynchronous GET request and return the raw JSON body."""
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        response = await self.async_client.get(path, params=params)
+        return self._handle_raw_response(response)
+
+    def _handle_conditional_response(
+        self, response: httpx.Response, etag: Optional[str]
+    ) -> tuple[Optional[bytes], Optional[str]]:
+        if response.status_code == 304:
+            return None, etag
+        return self._handle_raw_response(response), response.headers.get("etag")
+
+    def get_bytes_if_modified(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        etag: Optional[str] = None,
+    ) -> tuple[Optional[bytes], Optional[str]]:
+        """
+        Make a conditional synchronous GET request.
+
+        Sends ``If-None-Match`` when ``etag`` is given and returns
+        ``(body, etag)``; ``body`` is None when the server answers
+        304 Not Modified.
+        """
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.client.get(path, params=params, headers=headers)
+        return self._handle_conditional_response(response, etag)
+
+    async def aget_bytes_if_modified(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        etag: Optional[str] = None,
+    ) -> tuple[Optional[bytes], Optional[str]]:
+        """Make a conditional asynchronous GET request (see get_bytes_if_modified)."""
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        headers = {"If-None-Match": etag} if etag else None
+        response = await self.async_client.get(path, params=params, headers=headers)
+        return self._handle_conditional_response(response, etag)
+
     def post(
         self,
         path: str,
         json: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Make a synchronous POST request."""
-        response = self.client.post(path, json=json)
+        content = _json_dumps(json) if json is not None else None
+        response = self.client.post(path, content=content)
         return self._handle_response(response)
 
     async def apost(
@@ -135,5 +338,6 @@ class HttpClient:
         json: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Make an asynchronous POST request."""
-        response = await self.async_client.post(path, json=json)
+        content = _json_dumps(json) if json is not None else None
+        response = await self.async_client.post(path, content=content)
         return self._handle_response(response)
@@ -0,0 +1,206 @@
+"""
+Liquidations as a struct of NumPy arrays.
+
+``LiquidationArrays`` holds one float64/int64 column per numeric field
+instead of one ``Liquidation`` model (and its price/size strings) per
+event, for rolling sums and other analytics over large histories.
+Requires numpy (``pip install oxarchive[fast]``).
+
+Example:
+    >>> page = client.hyperliquid.liquidations.history_arrays("BTC", start=start, end=end)
+    >>> notional = (page.data.price * page.data.size).sum()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Optional, Sequence
+
+from ._envelopes import parse_page
+from ._timestamp import _EPOCH, _datetime_to_ms
+from .resample import _bucket_starts
+from .types import CandleInterval, CursorResponse, Liquidation, LiquidationVolume
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(
+        "LiquidationArrays requires numpy. Install with: pip install oxarchive[fast]"
+    )
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+SIDE_BUY = 0
+SIDE_SELL = 1
+
+
+if _HAS_MSGSPEC:
+    # Only the columns LiquidationArrays keeps; other fields are skipped
+    class _MsgLiquidation(msgspec.Struct, gc=False):
+        coin: str
+        timestamp: datetime
+        price: float
+        size: float
+        side: str
+        mark_price: Optional[float] = None
+        closed_pnl: Optional[float] = None
+
+    class _MsgMeta(msgspec.Struct):
+        next_cursor: Optional[str] = None
+
+    class _MsgPage(msgspec.Struct):
+        data: list[_MsgLiquidation]
+        meta: Optional[_MsgMeta] = None
+
+    # strict=False parses the string prices and sizes as floats
+    _PAGE_DECODER = msgspec.json.Decoder(_MsgPage, strict=False)
+
+
+def _optional_column(values: list[Optional[float]]) -> Any:
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+@dataclass
+class LiquidationArrays:
+    """
+    Liquidation events as parallel NumPy arrays, in response order.
+
+    Missing ``mark_price``/``closed_pnl`` values are NaN.
+    """
+
+    __slots__ = ("coin", "timestamp", "price", "size", "side", "mark_price", "closed_pnl")
+
+    coin: list[str]
+    """Trading pair symbol per event"""
+
+    timestamp: Any
+    """int64 timestamps in milliseconds"""
+
+    price: Any
+    """float64 execution prices"""
+
+    size: Any
+    """float64 sizes"""
+
+    side: Any
+    """uint8 sides: SIDE_BUY (0) for 'B', SIDE_SELL (1) for 'S'"""
+
+    mark_price: Any
+    """float64 mark prices"""
+
+    closed_pnl: Any
+    """float64 realized PnL"""
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def volume(self, interval: CandleInterval) -> list[LiquidationVolume]:
+        """
+        Aggregate into per-interval USD volume buckets, like liquidations.volume().
+
+        Notional is ``price * size``. Sells ('S', a long position being
+        closed out) count as long liquidations and buys as short ones. Each
+        sum is one ``reduceat`` over the time-sorted columns; only intervals
+        containing liquidations produce a bucket.
+
+        Args:
+            interval: Bucket width (e.g., '1h', '1d')
+
+        Returns:
+            LiquidationVolume buckets in time order
+        """
+        n = len(self)
+        if not n:
+            return []
+        coins = set(self.coin)
+        if len(coins) > 1:
+            raise ValueError("volume() needs liquidations for a single coin")
+        (coin,) = coins
+
+        order = np.argsort(self.timestamp, kind="stable")
+        notional = (self.price * self.size)[order]
+        is_long = self.side[order] == SIDE_SELL
+
+        buckets, starts = _bucket_starts(self.timestamp[order], interval)
+        totals = np.add.reduceat(notional, starts)
+        longs = np.add.reduceat(np.where(is_long, notional, 0.0), starts)
+        counts = np.diff(np.append(starts, n))
+        long_counts = np.add.reduceat(is_long.astype(np.int64), starts)
+
+        return [
+            LiquidationVolume(
+                coin=coin,
+                timestamp=_EPOCH + timedelta(milliseconds=ts),
+                total_usd=total,
+                long_usd=long_usd,
+                short_usd=total - long_usd,
+                count=count,
+                long_count=long_count,
+                short_count=count - long_count,
+            )
+            for ts, total, long_usd, count, long_count in zip(
+                buckets[starts].tolist(),
+                totals.tolist(),
+                longs.tolist(),
+                counts.tolist(),
+                long_counts.tolist(),
+            )
+        ]
+
+    @classmethod
+    def from_liquidations(cls, liquidations: Sequence[Liquidation]) -> LiquidationArrays:
+        """Convert validated Liquidation models to columns."""
+        n = len(liquidations)
+        return cls(
+            [liq.coin for liq in liquidations],
+            np.fromiter(
+                (_datetime_to_ms(liq.timestamp) for liq in liquidations), dtype=np.int64, count=n
+            ),
+            np.array([liq.price for liq in liquidations], dtype=np.float64),
+            np.array([liq.size for liq in liquidations], dtype=np.float64),
+            np.fromiter(
+                (liq.side == "S" for liq in liquidations), dtype=np.uint8, count=n
+            ),
+            _optional_column(
+                [None if liq.mark_price is None else float(liq.mark_price) for liq in liquidations]
+            ),
+            _optional_column(
+                [None if liq.closed_pnl is None else float(liq.closed_pnl) for liq in liquidations]
+            ),
+        )
+
+    @classmethod
+    def page_from_json(cls, raw: bytes) -> CursorResponse[LiquidationArrays]:
+        """
+        Build from a raw paginated liquidations response body.
+
+        With msgspec installed the body is decoded straight into float
+        fields, skipping the Liquidation models; otherwise it is validated
+        as a page of Liquidation first.
+        """
+        if not _HAS_MSGSPEC:
+            page = parse_page(raw, Liquidation)
+            return CursorResponse(
+                data=cls.from_liquidations(page.data), next_cursor=page.next_cursor
+            )
+
+        decoded = _PAGE_DECODER.decode(raw)
+        rows = decoded.data
+        n = len(rows)
+        arrays = cls(
+            [row.coin for row in rows],
+            np.fromiter((_datetime_to_ms(row.timestamp) for row in rows), dtype=np.int64, count=n),
+            np.fromiter((row.price for row in rows), dtype=np.float64, count=n),
+            np.fromiter((row.size for row in rows), dtype=np.float64, count=n),
+            np.fromiter((row.side == "S" for row in rows), dtype=np.uint8, count=n),
+            _optional_column([row.mark_price for row in rows]),
+            _optional_column([row.closed_pnl for row in rows]),
+        )
+        next_cursor = decoded.meta.next_cursor if decoded.meta is not None else None
+        return CursorResponse(data=arrays, next_cursor=next_cursor)
@@ -24,22 +24,71 @@ Example:
 
 from __future__ import annotations
 
+import gc
+import time
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Iterator, Optional
+from decimal import Decimal
+from importlib.util import find_spec
+from itertools import islice
+from operator import attrgetter, le
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional, Union
 
-from .types import OrderBook, PriceLevel
+from pydantic import TypeAdapter
+
+from ._timestamp import _datetime_to_ns, _ns_to_datetime
+from .types import _DEFER_BUILD, OrderBook, PriceLevel
+
+try:
+    from sortedcontainers import SortedDict
+
+    _HAS_SORTEDCONTAINERS = True
+except ImportError:
+    _HAS_SORTEDCONTAINERS = False
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+# numpy and numba are only located here and imported on first use: importing
+# numba alone takes longer than the rest of the SDK, and most callers never
+# reconstruct a book.
+_HAS_NUMPY = find_spec("numpy") is not None
+_HAS_NUMBA = _HAS_NUMPY and find_spec("numba") is not None
+
+SIDE_BID = 0
+SIDE_ASK = 1
+
+# C-implemented field getters for sort keys and array extraction; unlike a
+# lambda or generator expression they run no Python frame per delta.
+_SEQ_KEY = attrgetter("sequence")
+_PRICE_KEY = attrgetter("price")
 
 
 @dataclass
 class OrderbookDelta:
     """A single orderbook delta/change."""
 
+    # Declared by hand (dataclass(slots=True) needs Python 3.10+): deltas are
+    # created by the million, and dropping the per-instance __dict__ roughly
+    # halves their footprint and speeds up attribute reads.
+    __slots__ = ("timestamp", "side", "price", "size", "sequence")
+
+    SIDE_BID = SIDE_BID
+    SIDE_ASK = SIDE_ASK
+
     timestamp: int
     """Timestamp in milliseconds"""
 
-    side: str
-    """Side: 'bid' or 'ask'"""
+    side: int
+    """Side: SIDE_BID (0) or SIDE_ASK (1). 'bid'/'ask' strings are accepted and converted."""
 
     price: float
     """Price level"""
@@ -50,17 +99,270 @@ class OrderbookDelta:
     sequence: int
     """Sequence number for ordering"""
 
+    def __post_init__(self) -> None:
+        if self.side.__class__ is str:  # type: ignore[comparison-overlap]
+            self.side = SIDE_BID if self.side == "bid" else SIDE_ASK
+
+
+@dataclass
+class DeltaArrays:
+    """
+    Deltas as a struct of NumPy arrays, one array per field (requires numpy).
+
+    Column-wise storage takes a fraction of the memory of OrderbookDelta
+    objects and lets whole-array operations (sorting, gap checks, filtering)
+    run in C instead of walking Python objects.
+    """
+
+    __slots__ = ("timestamp", "side", "price", "size", "sequence")
+
+    timestamp: Any
+    """int64 timestamps in milliseconds"""
+
+    side: Any
+    """uint8 sides: SIDE_BID (0) or SIDE_ASK (1)"""
+
+    price: Any
+    """float64 price levels"""
+
+    size: Any
+    """float64 new sizes (0 = level removed)"""
+
+    sequence: Any
+    """int64 sequence numbers"""
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    @classmethod
+    def from_deltas(cls, deltas: list[OrderbookDelta]) -> DeltaArrays:
+        """Unpack a list of deltas into arrays, keeping their order."""
+        return cls(*OrderBookReconstructor._deltas_to_arrays(deltas))
+
+
+@dataclass
+class SnapshotArrays:
+    """
+    Reconstructed states as a struct of NumPy arrays (requires numpy).
+
+    Row ``i`` is the state after the ``i``-th delta, row 0 the checkpoint.
+    The level arrays have shape ``(states, depth)`` with the best level in
+    column 0; levels missing from a state are NaN. No Python object is
+    created per state or level.
+    """
+
+    __slots__ = ("timestamp", "sequence", "bid_px", "bid_sz", "ask_px", "ask_sz")
+
+    timestamp: Any
+    """int64 timestamps in milliseconds"""
+
+    sequence: Any
+    """int64 sequence numbers (0 for the checkpoint)"""
+
+    bid_px: Any
+    """float64 bid prices, best first"""
+
+    bid_sz: Any
+    """float64 bid sizes"""
+
+    ask_px: Any
+    """float64 ask prices, best first"""
+
+    ask_sz: Any
+    """float64 ask sizes"""
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+
+@dataclass
+class OrderBookArray:
+    """
+    Order book as NumPy arrays of scaled integers (requires numpy).
+
+    Prices are stored as ``int64`` multiples of ``10 ** -price_decimals`` and
+    sizes as multiples of ``10 ** -size_decimals``, so spreads, mids and
+    depth sums are exact integer arithmetic on whole arrays instead of
+    per-level string parsing. Use the instrument's decimals (e.g.
+    ``LighterInstrument.price_decimals``) so no precision is lost. The
+    timestamp is kept as integer nanoseconds; ``timestamp`` builds the
+    ``datetime`` on access.
+    """
+
+    __slots__ = (
+        "coin", "timestamp_ns", "bid_px", "bid_sz", "ask_px", "ask_sz", "price_scale", "size_scale"
+    )
+
+    coin: str
+    timestamp_ns: int
+    """Snapshot timestamp in nanoseconds since the Unix epoch (UTC)"""
+
+    bid_px: Any
+    """int64 scaled bid prices, best first"""
+
+    bid_sz: Any
+    """int64 scaled bid sizes"""
+
+    ask_px: Any
+    """int64 scaled ask prices, best first"""
+
+    ask_sz: Any
+    """int64 scaled ask sizes"""
+
+    price_scale: int
+    """Multiplier applied to prices (``10 ** price_decimals``)"""
+
+    size_scale: int
+    """Multiplier applied to sizes (``10 ** size_decimals``)"""
+
+    @classmethod
+    def from_orderbook(
+        cls, book: OrderBook, price_decimals: int, size_decimals: int
+    ) -> OrderBookArray:
+        """Parse an OrderBook's string levels into scaled integer arrays."""
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "OrderBookArray requires numpy. Install with: pip install oxarchive[fast]"
+            )
+        import numpy as np
+
+        price_scale = 10**price_decimals
+        size_scale = 10**size_decimals
+
+        def scaled(values: list[str], scale: int) -> Any:
+            return np.rint(np.array(values, dtype=np.float64) * scale).astype(np.int64)
+
+        return cls(
+            book.coin,
+            _datetime_to_ns(book.timestamp),
+            scaled([level.px for level in book.bids], price_scale),
+            scaled([level.sz for level in book.bids], size_scale),
+            scaled([level.px for level in book.asks], price_scale),
+            scaled([level.sz for level in book.asks], size_scale),
+            price_scale,
+            size_scale,
+        )
+
+    @classmethod
+    def from_json(cls, raw: bytes, price_decimals: int, size_decimals: int) -> OrderBookArray:
+        """
+        Build from a raw ``{"data": <order book>}`` response body.
+
+        With msgspec installed the body is decoded straight into float
+        levels in one pass, skipping the OrderBook/PriceLevel models;
+        otherwise it is validated as an OrderBook first.
+        """
+        if not _HAS_MSGSPEC:
+            from ._envelopes import parse_data
+
+            return cls.from_orderbook(parse_data(raw, OrderBook), price_decimals, size_decimals)
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "OrderBookArray requires numpy. Install with: pip install oxarchive[fast]"
+            )
+        import numpy as np
+
+        book = _BOOK_DECODER.decode(raw).data
+        price_scale = 10**price_decimals
+        size_scale = 10**size_decimals
+
+        def scaled(values: list[float], scale: int) -> Any:
+            return np.rint(np.array(values, dtype=np.float64) * scale).astype(np.int64)
+
+        return cls(
+            book.coin,
+            _datetime_to_ns(book.timestamp),
+            scaled([level.px for level in book.bids], price_scale),
+            scaled([level.sz for level in book.bids], size_scale),
+            scaled([level.px for level in book.asks], price_scale),
+            scaled([level.sz for level in book.asks], size_scale),
+            price_scale,
+            size_scale,
+        )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Snapshot timestamp as a UTC datetime."""
+        return _ns_to_datetime(self.timestamp_ns)
+
+    @property
+    def spread(self) -> Optional[int]:
+        """Best ask minus best bid, in scaled price units."""
+        if not len(self.bid_px) or not len(self.ask_px):
+            return None
+        return int(self.ask_px[0] - self.bid_px[0])
+
+    @property
+    def mid_price(self) -> Optional[int]:
+        """Midpoint of the best bid and ask, in scaled price units (rounded down)."""
+        if not len(self.bid_px) or not len(self.ask_px):
+            return None
+        return int(self.bid_px[0] + self.ask_px[0]) // 2
+
+
+if _HAS_MSGSPEC:
+    # Order book response decoded straight to float levels for OrderBookArray
+    class _MsgLevel(msgspec.Struct, gc=False):
+        px: float
+        sz: float
+        n: int
+
+    class _MsgBook(msgspec.Struct):
+        coin: str
+        timestamp: datetime
+        bids: list[_MsgLevel]
+        asks: list[_MsgLevel]
+
+    class _MsgBookEnvelope(msgspec.Struct):
+        data: _MsgBook
+
+    # strict=False parses the string prices and sizes as floats
+    _BOOK_DECODER = msgspec.json.Decoder(_MsgBookEnvelope, strict=False)
+
+    # Tick history pages (see OrderBookResource.history_tick) decode into
+    # gc-untracked structs several times faster than through pydantic
+    class _MsgDelta(msgspec.Struct, frozen=True, gc=False):
+        timestamp: int
+        side: Literal["bid", "ask"]
+        price: float
+        size: float
+        sequence: int
+
+    class _MsgTickPage(msgspec.Struct):
+        # Kept raw and validated by pydantic, which owns the OrderBook model
+        checkpoint: msgspec.Raw = msgspec.Raw()
+        deltas: list[_MsgDelta] = []
+
+    class _MsgTickEnvelope(msgspec.Struct):
+        data: Union[_MsgTickPage, list[Any], None] = None
+        error: Optional[str] = None
+        message: Optional[str] = None
+
+    # strict=False accepts prices and sizes sent as numeric strings
+    _TICK_DECODER = msgspec.json.Decoder(_MsgTickEnvelope, strict=False)
+
 
 @dataclass
 class TickData:
     """Raw tick data from the API (checkpoint + deltas)."""
 
+    __slots__ = ("checkpoint", "deltas", "_delta_arrays")
+
     checkpoint: OrderBook
     """Initial orderbook state"""
 
     deltas: list[OrderbookDelta]
     """Incremental changes to apply"""
 
+    @property
+    def delta_arrays(self) -> DeltaArrays:
+        """``deltas`` as a DeltaArrays struct of NumPy arrays, built on first access."""
+        try:
+            return self._delta_arrays
+        except AttributeError:
+            self._delta_arrays: DeltaArrays = DeltaArrays.from_deltas(self.deltas)
+            return self._delta_arrays
+
 
 @dataclass
 class ReconstructedOrderBook:
@@ -76,6 +378,34 @@ class ReconstructedOrderBook:
     sequence: Optional[int] = None
 
 
+@dataclass
+class NumericPriceLevel:
+    """Price level with float price and size (see ``ReconstructOptions.numeric``)."""
+
+    __slots__ = ("px", "sz", "n")
+
+    px: float
+    sz: float
+    n: int
+
+
+@dataclass
+class NumericReconstructedOrderBook:
+    """Reconstructed orderbook snapshot with float prices, sizes and spread metrics."""
+
+    coin: str
+    timestamp: str
+    bids: list[NumericPriceLevel]
+    asks: list[NumericPriceLevel]
+    mid_price: Optional[float] = None
+    spread: Optional[float] = None
+    spread_bps: Optional[float] = None
+    sequence: Optional[int] = None
+
+
+AnyReconstructedOrderBook = Union[ReconstructedOrderBook, NumericReconstructedOrderBook]
+
+
 @dataclass
 class ReconstructOptions:
     """Options for reconstruction."""
@@ -86,14 +416,270 @@ class ReconstructOptions:
     emit_all: bool = True
     """If True, yield a snapshot after every delta. If False, only return final state."""
 
+    numeric: bool = False
+    """If True, emit NumericReconstructedOrderBook with floats instead of strings."""
 
-@dataclass
-class InternalLevel:
-    """Price level stored internally with numeric values."""
 
-    price: float
-    size: float
-    orders: int = 1
+# Below this many deltas the array setup costs more than the Python loop saves
+_NUMPY_MIN_DELTAS = 512
+_NUMBA_MIN_DELTAS = 512
+
+
+def _format_timestamp_ms(ms: int) -> str:
+    """Format a millisecond epoch timestamp as ISO 8601 UTC without building a datetime."""
+    secs, millis = divmod(ms, 1000)
+    tm = time.gmtime(secs)
+    base = (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+    # Match datetime.isoformat(): microsecond precision, omitted when zero
+    if millis:
+        return f"{base}.{millis:03d}000Z"
+    return f"{base}Z"
+
+
+# Validates a whole side of API-format levels in one call instead of one
+# PriceLevel(...) per level
+_validate_levels = TypeAdapter(list[PriceLevel], config=_DEFER_BUILD).validate_python
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector for a bulk allocation.
+
+    Snapshots hold no reference cycles, but allocating millions of them
+    triggers repeated full collections over the growing result list.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _ensure_sorted(deltas: list[OrderbookDelta]) -> list[OrderbookDelta]:
+    """
+    Return deltas ordered by sequence.
+
+    The API already delivers deltas in sequence order, so check that with a
+    single C-level scan and only sort (into a new list) when it is not.
+    """
+    sequences = list(map(_SEQ_KEY, deltas))
+    if all(map(le, sequences, islice(sequences, 1, None))):
+        return deltas
+    return sorted(deltas, key=_SEQ_KEY)
+
+
+class _ArrayBookSide:
+    """
+    Sorted key -> size map kept in two parallel ``array('d')`` columns.
+
+    Used for book sides when sortedcontainers is not installed. Lookups are
+    a C-level bisect and inserts/removals a memmove of the tail, which for
+    books of a few hundred levels is as fast as a tree. Implements the
+    subset of the SortedDict API the reconstructor relies on.
+    """
+
+    __slots__ = ("_keys", "_sizes")
+
+    def __init__(self, items: Iterable[tuple[float, float]] = ()) -> None:
+        self._keys = array("d")
+        self._sizes = array("d")
+        for key, size in sorted(items):
+            self._keys.append(key)
+            self._sizes.append(size)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __setitem__(self, key: float, size: float) -> None:
+        keys = self._keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            self._sizes[i] = size
+        else:
+            keys.insert(i, key)
+            self._sizes.insert(i, size)
+
+    def pop(self, key: float, default: Optional[float] = None) -> Optional[float]:
+        keys = self._keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            size = self._sizes[i]
+            del keys[i]
+            del self._sizes[i]
+            return size
+        return default
+
+    def peekitem(self, index: int = -1) -> tuple[float, float]:
+        return self._keys[index], self._sizes[index]
+
+    def items(self) -> Iterator[tuple[float, float]]:
+        return zip(self._keys, self._sizes)
+
+    def clear(self) -> None:
+        del self._keys[:]
+        del self._sizes[:]
+
+
+try:
+    # Optional compiled std::map book side, see _creconstruct.pyx
+    from ._creconstruct import CBookSide
+
+    _BookSide: Any = CBookSide
+except ImportError:
+    _BookSide = SortedDict if _HAS_SORTEDCONTAINERS else _ArrayBookSide
+
+
+def _spread_metrics(
+    best_bid: Optional[float], best_ask: Optional[float]
+) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """Calculate (mid price, spread, spread in bps) from the best prices."""
+    if best_bid is None or best_ask is None:
+        return None, None, None
+    mid_price = (best_bid + best_ask) / 2
+    spread = best_ask - best_bid
+    spread_bps = (spread / mid_price) * 10000 if mid_price else None
+    return mid_price, spread, spread_bps
+
+
+class ReconstructedOrderBookView:
+    """
+    Lazy view of the reconstructor's current state.
+
+    Yielded by ``OrderBookReconstructor.iterate_views()``. Nothing is built
+    until a field is read, and then only that field (e.g. reading ``bids``
+    does not format the asks). A view is only valid until the reconstructor
+    applies the next delta; reading it afterwards raises ``RuntimeError``.
+    Call ``freeze()`` to keep a durable ``ReconstructedOrderBook``.
+    """
+
+    __slots__ = ("_reconstructor", "_depth", "_version", "_bids", "_asks")
+
+    def __init__(self, reconstructor: OrderBookReconstructor, depth: Optional[int]) -> None:
+        self._reconstructor = reconstructor
+        self._depth = depth
+        self._version = reconstructor._version
+        self._bids: Optional[list[PriceLevel]] = None
+        self._asks: Optional[list[PriceLevel]] = None
+
+    def _live(self) -> OrderBookReconstructor:
+        reconstructor = self._reconstructor
+        if reconstructor._version != self._version:
+            raise RuntimeError(
+                "Orderbook view is stale: the reconstructor has moved on. "
+                "Call freeze() on views you need to keep."
+            )
+        return reconstructor
+
+    @property
+    def coin(self) -> str:
+        return self._live()._coin
+
+    @property
+    def timestamp(self) -> str:
+        return self._live()._current_timestamp()
+
+    @property
+    def sequence(self) -> int:
+        return self._live()._last_sequence
+
+    @property
+    def bids(self) -> list[PriceLevel]:
+        reconstructor = self._live()
+        if self._bids is None:
+            self._bids = reconstructor._bid_levels(self._depth)
+        return self._bids
+
+    @property
+    def asks(self) -> list[PriceLevel]:
+        reconstructor = self._live()
+        if self._asks is None:
+            self._asks = reconstructor._ask_levels(self._depth)
+        return self._asks
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self._live()._best_bid
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self._live()._best_ask
+
+    @property
+    def mid_price(self) -> Optional[str]:
+        reconstructor = self._live()
+        mid_price, _, _ = _spread_metrics(reconstructor._best_bid, reconstructor._best_ask)
+        return str(mid_price) if mid_price is not None else None
+
+    @property
+    def spread(self) -> Optional[str]:
+        reconstructor = self._live()
+        _, spread, _ = _spread_metrics(reconstructor._best_bid, reconstructor._best_ask)
+        return str(spread) if spread is not None else None
+
+    @property
+    def spread_bps(self) -> Optional[str]:
+        reconstructor = self._live()
+        _, _, spread_bps = _spread_metrics(reconstructor._best_bid, reconstructor._best_ask)
+        return f"{spread_bps:.2f}" if spread_bps is not None else None
+
+    def freeze(self) -> ReconstructedOrderBook:
+        """Materialize this state as a standalone ReconstructedOrderBook."""
+        reconstructor = self._live()
+        return reconstructor._make_snapshot(  # type: ignore[return-value]
+            reconstructor._current_timestamp(),
+            self.bids,
+            self.asks,
+            reconstructor._best_bid,
+            reconstructor._best_ask,
+            reconstructor._last_sequence,
+        )
+
+
+def _checked_stream(deltas: Iterable[OrderbookDelta]) -> Iterator[OrderbookDelta]:
+    """Pass through streamed deltas, rejecting any that arrive out of sequence order."""
+    last_sequence: Optional[int] = None
+    for delta in deltas:
+        if last_sequence is not None and delta.sequence < last_sequence:
+            raise ValueError(
+                f"Streamed deltas must be in sequence order "
+                f"(got {delta.sequence} after {last_sequence})"
+            )
+        last_sequence = delta.sequence
+        yield delta
+
+
+def _ordered(deltas: Iterable[OrderbookDelta]) -> Iterable[OrderbookDelta]:
+    """Lists are sorted if needed; any other iterable is streamed and must be pre-sorted."""
+    if isinstance(deltas, list):
+        return _ensure_sorted(deltas)
+    return _checked_stream(deltas)
+
+
+def _tick_snapper(tick_size: float) -> Callable[[float], float]:
+    """
+    Build a function that snaps prices onto the ``tick_size`` grid.
+
+    The integer tick index is computed with a multiply by the precomputed
+    reciprocal, then mapped back and rounded to the tick's decimal places so
+    that every price on the same tick yields the identical float key.
+    """
+    if tick_size <= 0:
+        raise ValueError("tick_size must be positive")
+    tick_size = float(tick_size)
+    inv_tick = 1.0 / tick_size
+    exponent = Decimal(str(tick_size)).as_tuple().exponent
+    decimals = max(0, -exponent) if isinstance(exponent, int) else 0
+
+    def snap(price: float) -> float:
+        return round(round(price * inv_tick) * tick_size, decimals)
+
+    return snap
 
 
 class OrderBookReconstructor:
@@ -101,7 +687,14 @@ class OrderBookReconstructor:
     Orderbook Reconstructor.
 
     Maintains orderbook state and efficiently applies delta updates.
-    Uses dictionaries with sorted output for O(1) updates.
+    Each side is a sorted map (a SortedDict, or parallel bisect-maintained
+    arrays when sortedcontainers is not installed), so reading the top
+    levels walks only ``depth`` entries instead of re-sorting the book.
+    Bids are keyed by negated price so both sides iterate best-first.
+
+    Sides map price to size only. Order counts are known just for checkpoint
+    levels, so they live in a separate price -> count map that deltas clear
+    (a level touched by a delta reports 1 order).
 
     Example:
         >>> reconstructor = OrderBookReconstructor()
@@ -110,106 +703,208 @@ class OrderBookReconstructor:
         >>> # Or iterate for memory efficiency
         >>> for snapshot in reconstructor.iterate(checkpoint, deltas):
         ...     process(snapshot)
+
+    Pass ``tick_size`` (e.g. ``10 ** -instrument.price_decimals``) to snap
+    every price onto the instrument's tick grid, so float noise in the feed
+    can never split one level into two.
     """
 
-    def __init__(self) -> None:
-        self._bids: dict[float, InternalLevel] = {}
-        self._asks: dict[float, InternalLevel] = {}
+    def __init__(self, tick_size: Optional[float] = None) -> None:
+        self._snap: Optional[Callable[[float], float]] = (
+            _tick_snapper(tick_size) if tick_size is not None else None
+        )
+        self._bids: Any = _BookSide()
+        self._asks: Any = _BookSide()
+        self._bid_orders: dict[float, int] = {}
+        self._ask_orders: dict[float, int] = {}
         self._coin: str = ""
         self._last_timestamp: str = ""
+        # Raw delta timestamp (ms); formatted lazily in get_snapshot()
+        self._last_timestamp_ms: Optional[int] = None
         self._last_sequence: int = 0
+        # Bumped on every state change so views can detect that they are stale
+        self._version: int = 0
+
+        # Best prices are maintained incrementally in apply_delta()
+        self._best_bid: Optional[float] = None
+        self._best_ask: Optional[float] = None
+
+        # Cached top-of-book levels for the last requested depth. A side's cache
+        # is dropped only when a delta lands inside the cached range.
+        self._bid_top: Optional[list[tuple[float, float]]] = None
+        self._ask_top: Optional[list[tuple[float, float]]] = None
+        self._bid_top_depth: int = 0
+        self._ask_top_depth: int = 0
 
     def initialize(self, checkpoint: OrderBook) -> None:
         """Initialize or reset the reconstructor with a checkpoint."""
         self._bids.clear()
         self._asks.clear()
+        self._bid_orders.clear()
+        self._ask_orders.clear()
         self._coin = checkpoint.coin
         self._last_timestamp = checkpoint.timestamp
+        self._last_timestamp_ms = None
         self._last_sequence = 0
+        self._version += 1
+
+        snap = self._snap
 
         # Parse checkpoint bids
         for level in checkpoint.bids:
-            price = float(level.px)
-            self._bids[price] = InternalLevel(
-                price=price,
-                size=float(level.sz),
-                orders=level.n,
-            )
+            price = float(level.px) if snap is None else snap(float(level.px))
+            self._bids[-price] = float(level.sz)
+            self._bid_orders[price] = level.n
 
         # Parse checkpoint asks
         for level in checkpoint.asks:
-            price = float(level.px)
-            self._asks[price] = InternalLevel(
-                price=price,
-                size=float(level.sz),
-                orders=level.n,
-            )
+            price = float(level.px) if snap is None else snap(float(level.px))
+            self._asks[price] = float(level.sz)
+            self._ask_orders[price] = level.n
+
+        self._best_bid = -self._bids.peekitem(0)[0] if self._bids else None
+        self._best_ask = self._asks.peekitem(0)[0] if self._asks else None
+        self._bid_top = None
+        self._ask_top = None
 
     def apply_delta(self, delta: OrderbookDelta) -> None:
         """Apply a single delta to the current state."""
-        book = self._bids if delta.side == "bid" else self._asks
-
-        if delta.size == 0:
-            # Remove level
-            book.pop(delta.price, None)
+        price = delta.price if self._snap is None else self._snap(delta.price)
+
+        if delta.side == SIDE_BID:
+            book = self._bids
+            top = self._bid_top
+            if top is not None and (len(top) < self._bid_top_depth or price >= top[-1][0]):
+                self._bid_top = None
+            # Deltas don't include order count
+            self._bid_orders.pop(price, None)
+
+            if delta.size == 0:
+                # Remove level
+                book.pop(-price, None)
+                if price == self._best_bid:
+                    self._best_bid = -book.peekitem(0)[0] if book else None
+            else:
+                # Insert or update level
+                book[-price] = delta.size
+                if self._best_bid is None or price > self._best_bid:
+                    self._best_bid = price
         else:
-            # Insert or update level
-            book[delta.price] = InternalLevel(
-                price=delta.price,
-                size=delta.size,
-                orders=1,  # Deltas don't include order count
-            )
-
-        # Convert timestamp to ISO format (timezone-aware)
-        self._last_timestamp = datetime.fromtimestamp(delta.timestamp / 1000, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+            book = self._asks
+            top = self._ask_top
+            if top is not None and (len(top) < self._ask_top_depth or price <= top[-1][0]):
+                self._ask_top = None
+            self._ask_orders.pop(price, None)
+
+            if delta.size == 0:
+                book.pop(price, None)
+                if price == self._best_ask:
+                    self._best_ask = book.peekitem(0)[0] if book else None
+            else:
+                book[price] = delta.size
+                if self._best_ask is None or price < self._best_ask:
+                    self._best_ask = price
+
+        self._last_timestamp_ms = delta.timestamp
         self._last_sequence = delta.sequence
+        self._version += 1
 
-    def get_snapshot(self, depth: Optional[int] = None) -> ReconstructedOrderBook:
-        """Get the current orderbook state as a snapshot."""
-        # Sort bids descending (best bid first)
-        sorted_bids = sorted(self._bids.values(), key=lambda x: x.price, reverse=True)
+    def get_snapshot(
+        self, depth: Optional[int] = None, numeric: bool = False
+    ) -> AnyReconstructedOrderBook:
+        """
+        Get the current orderbook state as a snapshot.
 
-        # Sort asks ascending (best ask first)
-        sorted_asks = sorted(self._asks.values(), key=lambda x: x.price)
+        With ``numeric=True`` prices, sizes and spread metrics are returned as
+        floats (NumericReconstructedOrderBook) rather than strings.
+        """
+        return self._make_snapshot(
+            self._current_timestamp(),
+            self._bid_levels(depth, numeric),
+            self._ask_levels(depth, numeric),
+            self._best_bid,
+            self._best_ask,
+            self._last_sequence,
+            numeric,
+        )
 
-        # Apply depth limit
+    def _bid_levels(self, depth: Optional[int], numeric: bool = False) -> list[Any]:
+        # Both sides are kept sorted best-first, so only walk the levels we need
         if depth:
-            sorted_bids = sorted_bids[:depth]
-            sorted_asks = sorted_asks[:depth]
-
-        bids_output = [self._to_level(level) for level in sorted_bids]
-        asks_output = [self._to_level(level) for level in sorted_asks]
-
-        # Calculate mid price and spread
-        best_bid = sorted_bids[0].price if sorted_bids else None
-        best_ask = sorted_asks[0].price if sorted_asks else None
-
-        mid_price = None
-        spread = None
-        spread_bps = None
-
-        if best_bid is not None and best_ask is not None:
-            mid_price = (best_bid + best_ask) / 2
-            spread = best_ask - best_bid
-            spread_bps = (spread / mid_price) * 10000 if mid_price else None
+            sorted_bids = self._top_bids(depth)
+        else:
+            sorted_bids = [(-key, size) for key, size in self._bids.items()]
+        bid_orders = self._bid_orders
+        level: Any = NumericPriceLevel if numeric else self._to_level
+        return [level(px, sz, bid_orders.get(px, 1)) for px, sz in sorted_bids]
+
+    def _ask_levels(self, depth: Optional[int], numeric: bool = False) -> list[Any]:
+        sorted_asks = self._top_asks(depth) if depth else list(self._asks.items())
+        ask_orders = self._ask_orders
+        level: Any = NumericPriceLevel if numeric else self._to_level
+        return [level(px, sz, ask_orders.get(px, 1)) for px, sz in sorted_asks]
+
+    def _current_timestamp(self) -> str:
+        if self._last_timestamp_ms is not None:
+            self._last_timestamp = _format_timestamp_ms(self._last_timestamp_ms)
+            self._last_timestamp_ms = None
+        return self._last_timestamp
+
+    def _make_snapshot(
+        self,
+        timestamp: str,
+        bids: list[Any],
+        asks: list[Any],
+        best_bid: Optional[float],
+        best_ask: Optional[float],
+        sequence: int,
+        numeric: bool = False,
+    ) -> AnyReconstructedOrderBook:
+        mid_price, spread, spread_bps = _spread_metrics(best_bid, best_ask)
+
+        if numeric:
+            return NumericReconstructedOrderBook(
+                coin=self._coin,
+                timestamp=timestamp,
+                bids=bids,
+                asks=asks,
+                mid_price=mid_price,
+                spread=spread,
+                spread_bps=spread_bps,
+                sequence=sequence,
+            )
 
         return ReconstructedOrderBook(
             coin=self._coin,
-            timestamp=self._last_timestamp,
-            bids=bids_output,
-            asks=asks_output,
+            timestamp=timestamp,
+            bids=bids,
+            asks=asks,
             mid_price=str(mid_price) if mid_price is not None else None,
             spread=str(spread) if spread is not None else None,
             spread_bps=f"{spread_bps:.2f}" if spread_bps is not None else None,
-            sequence=self._last_sequence,
+            sequence=sequence,
         )
 
-    def _to_level(self, level: InternalLevel) -> PriceLevel:
+    def _top_bids(self, depth: int) -> list[tuple[float, float]]:
+        """Best ``depth`` bid (price, size) pairs, served from cache when still valid."""
+        if self._bid_top is None or self._bid_top_depth != depth:
+            self._bid_top = [(-key, size) for key, size in islice(self._bids.items(), depth)]
+            self._bid_top_depth = depth
+        return self._bid_top
+
+    def _top_asks(self, depth: int) -> list[tuple[float, float]]:
+        """Best ``depth`` ask (price, size) pairs, served from cache when still valid."""
+        if self._ask_top is None or self._ask_top_depth != depth:
+            self._ask_top = list(islice(self._asks.items(), depth))
+            self._ask_top_depth = depth
+        return self._ask_top
+
+    def _to_level(self, price: float, size: float, orders: int) -> PriceLevel:
         """Convert internal level to API format."""
         return PriceLevel(
-            px=str(level.price),
-            sz=str(level.size),
-            n=level.orders,
+            px=str(price),
+            sz=str(size),
+            n=orders,
         )
 
     def reconstruct_all(
@@ -217,7 +912,7 @@ class OrderBookReconstructor:
         checkpoint: OrderBook,
         deltas: list[OrderbookDelta],
         options: Optional[ReconstructOptions] = None,
-    ) -> list[ReconstructedOrderBook]:
+    ) -> list[AnyReconstructedOrderBook]:
         """
         Reconstruct all orderbook states from checkpoint + deltas.
 
@@ -233,43 +928,325 @@ class OrderBookReconstructor:
             Array of reconstructed orderbook snapshots
         """
         options = options or ReconstructOptions()
-        snapshots: list[ReconstructedOrderBook] = []
+        snapshots: list[AnyReconstructedOrderBook] = []
+        depth = options.depth
+        numeric = options.numeric
 
         self.initialize(checkpoint)
 
-        # Sort deltas by sequence to ensure correct order
-        sorted_deltas = sorted(deltas, key=lambda d: d.sequence)
+        if (
+            options.emit_all
+            and options.depth
+            and _HAS_NUMBA
+            and len(deltas) >= _NUMBA_MIN_DELTAS
+        ):
+            return self._reconstruct_all_numba(deltas, options.depth, numeric)
 
         if options.emit_all:
-            # Emit initial state
-            snapshots.append(self.get_snapshot(options.depth))
+            # Sort deltas by sequence to ensure correct order
+            sorted_deltas = _ensure_sorted(deltas)
 
-        for delta in sorted_deltas:
-            self.apply_delta(delta)
-            if options.emit_all:
-                snapshots.append(self.get_snapshot(options.depth))
+            # Emit initial state
+            snapshots.append(self.get_snapshot(depth, numeric))
 
-        if not options.emit_all:
+            for delta in sorted_deltas:
+                self.apply_delta(delta)
+                snapshots.append(self.get_snapshot(depth, numeric))
+        else:
             # Only return final state
-            snapshots.append(self.get_snapshot(options.depth))
+            self._apply_deltas_bulk(deltas)
+            snapshots.append(self.get_snapshot(depth, numeric))
 
         return snapshots
 
-    def iterate(
+    def _reconstruct_all_numba(
+        self, deltas: list[OrderbookDelta], depth: int, numeric: bool
+    ) -> list[AnyReconstructedOrderBook]:
+        """
+        Compiled equivalent of the ``emit_all`` loop in ``reconstruct_all``.
+
+        The kernel records the top ``depth`` levels after every delta into
+        preallocated arrays; those are wrapped into snapshots afterwards and
+        the reconstructor is left holding the final book.
+        """
+        import numpy as np
+
+        sorted_deltas = _ensure_sorted(deltas)
+        n = len(sorted_deltas)
+
+        out_bid_px = np.empty((n + 1, depth), dtype=np.float64)
+        out_bid_sz = np.empty((n + 1, depth), dtype=np.float64)
+        out_bid_n = np.empty((n + 1, depth), dtype=np.int64)
+        out_bid_count = np.empty(n + 1, dtype=np.int64)
+        out_ask_px = np.empty((n + 1, depth), dtype=np.float64)
+        out_ask_sz = np.empty((n + 1, depth), dtype=np.float64)
+        out_ask_n = np.empty((n + 1, depth), dtype=np.int64)
+        out_ask_count = np.empty(n + 1, dtype=np.int64)
+
+        initial_timestamp = self._last_timestamp
+        self._run_numba_kernel(
+            sorted_deltas,
+            out_bid_px, out_bid_sz, out_bid_n, out_bid_count,
+            out_ask_px, out_ask_sz, out_ask_n, out_ask_count,
+        )
+
+        def levels(px: list[float], sz: list[float], orders: list[int], k: int) -> list[Any]:
+            if numeric:
+                return [NumericPriceLevel(px[j], sz[j], orders[j]) for j in range(k)]
+            return _validate_levels(
+                [{"px": str(px[j]), "sz": str(sz[j]), "n": orders[j]} for j in range(k)]
+            )
+
+        bid_px, bid_sz, bid_n = out_bid_px.tolist(), out_bid_sz.tolist(), out_bid_n.tolist()
+        ask_px, ask_sz, ask_n = out_ask_px.tolist(), out_ask_sz.tolist(), out_ask_n.tolist()
+        bid_count, ask_count = out_bid_count.tolist(), out_ask_count.tolist()
+
+        snapshots: list[AnyReconstructedOrderBook] = []
+        with _gc_paused():
+            for step in range(n + 1):
+                if step == 0:
+                    timestamp, sequence = initial_timestamp, 0
+                else:
+                    delta = sorted_deltas[step - 1]
+                    timestamp = _format_timestamp_ms(delta.timestamp)
+                    sequence = delta.sequence
+                nb, na = bid_count[step], ask_count[step]
+                snapshots.append(
+                    self._make_snapshot(
+                        timestamp,
+                        levels(bid_px[step], bid_sz[step], bid_n[step], nb),
+                        levels(ask_px[step], ask_sz[step], ask_n[step], na),
+                        bid_px[step][0] if nb else None,
+                        ask_px[step][0] if na else None,
+                        sequence,
+                        numeric,
+                    )
+                )
+
+        return snapshots
+
+    def _run_numba_kernel(self, sorted_deltas: list[OrderbookDelta], *outputs: Any) -> None:
+        """
+        Apply sorted deltas with the compiled kernel, filling ``outputs``.
+
+        ``outputs`` are the bid px/sz/orders/count arrays followed by the ask
+        ones, as expected by ``_reconstruct_numba.apply_all``. The
+        reconstructor is left holding the final book, as the Python path does.
+        """
+        import numpy as np
+
+        from . import _reconstruct_numba
+
+        n = len(sorted_deltas)
+        _, sides, prices, sizes, _ = self._deltas_to_arrays(sorted_deltas, self._snap)
+
+        def side_arrays(
+            book: Any, order_counts: dict[float, int], sign: float
+        ) -> tuple[Any, Any, Any]:
+            capacity = len(book) + n
+            keys = np.zeros(capacity, dtype=np.float64)
+            level_sizes = np.zeros(capacity, dtype=np.float64)
+            orders = np.zeros(capacity, dtype=np.int64)
+            for i, (key, size) in enumerate(book.items()):
+                keys[i] = key
+                level_sizes[i] = size
+                orders[i] = order_counts.get(sign * key, 1)
+            return keys, level_sizes, orders
+
+        bid_keys, bid_sizes, bid_orders = side_arrays(self._bids, self._bid_orders, -1.0)
+        ask_keys, ask_sizes, ask_orders = side_arrays(self._asks, self._ask_orders, 1.0)
+
+        n_bids, n_asks = _reconstruct_numba.apply_all(
+            bid_keys, bid_sizes, bid_orders, len(self._bids),
+            ask_keys, ask_sizes, ask_orders, len(self._asks),
+            sides, prices, sizes,
+            *outputs,
+        )
+
+        final_bid_keys = bid_keys[:n_bids].tolist()
+        final_ask_keys = ask_keys[:n_asks].tolist()
+        self._bids = _BookSide(zip(final_bid_keys, bid_sizes[:n_bids].tolist()))
+        self._asks = _BookSide(zip(final_ask_keys, ask_sizes[:n_asks].tolist()))
+        self._bid_orders = {
+            -key: orders
+            for key, orders in zip(final_bid_keys, bid_orders[:n_bids].tolist())
+            if orders != 1
+        }
+        self._ask_orders = {
+            key: orders
+            for key, orders in zip(final_ask_keys, ask_orders[:n_asks].tolist())
+            if orders != 1
+        }
+        if sorted_deltas:
+            last = sorted_deltas[-1]
+            self._settle(last.timestamp, last.sequence)
+
+    def reconstruct_all_arrays(
         self,
         checkpoint: OrderBook,
         deltas: list[OrderbookDelta],
+        depth: int = 10,
+    ) -> SnapshotArrays:
+        """
+        Reconstruct all orderbook states into NumPy arrays.
+
+        Same states as ``reconstruct_all(..., ReconstructOptions(depth=depth))``,
+        but returned as a SnapshotArrays of ``(states, depth)`` float64 level
+        arrays instead of one ReconstructedOrderBook per state. Levels are
+        written straight into preallocated arrays (by the compiled kernel
+        when numba is installed), which makes this the cheapest way to get
+        every intermediate state of a long window.
+
+        Requires numpy (``pip install oxarchive[fast]``).
+
+        Args:
+            checkpoint: Initial orderbook state
+            deltas: Array of delta updates
+            depth: Price levels per side to include
+
+        Returns:
+            SnapshotArrays with one row per reconstructed state
+        """
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "reconstruct_all_arrays() requires numpy. "
+                "Install with: pip install oxarchive[fast]"
+            )
+
+        timestamps, sequences, bid_px, bid_sz, ask_px, ask_sz = self._level_columns(
+            checkpoint, deltas, depth
+        )
+        return SnapshotArrays(timestamps, sequences, bid_px.T, bid_sz.T, ask_px.T, ask_sz.T)
+
+    def reconstruct_all_arrow(
+        self,
+        checkpoint: OrderBook,
+        deltas: list[OrderbookDelta],
+        depth: int = 10,
+    ) -> Any:
+        """
+        Reconstruct all orderbook states into a columnar ``pyarrow.Table``.
+
+        Produces one row per state (the checkpoint, then one per delta) with
+        ``timestamp`` and ``sequence`` columns followed by ``bid_px_{i}``,
+        ``bid_sz_{i}``, ``ask_px_{i}`` and ``ask_sz_{i}`` for ``i`` in
+        ``range(depth)``. Missing levels are NaN. Levels are written straight
+        into preallocated float64 columns, so no per-level Python objects are
+        created, and the columns are handed to Arrow without copying. Use
+        ``polars.from_arrow(table)`` or ``table.to_pandas()`` for dataframes.
+
+        Requires the ``arrow`` extra (``pip install oxarchive[arrow]``).
+
+        Args:
+            checkpoint: Initial orderbook state
+            deltas: Array of delta updates
+            depth: Price levels per side to include
+
+        Returns:
+            pyarrow.Table with one row per reconstructed state
+        """
+        if not _HAS_NUMPY or find_spec("pyarrow") is None:
+            raise ImportError(
+                "reconstruct_all_arrow() requires pyarrow and numpy. "
+                "Install with: pip install oxarchive[arrow]"
+            )
+        import pyarrow as pa
+
+        timestamps, sequences, bid_px, bid_sz, ask_px, ask_sz = self._level_columns(
+            checkpoint, deltas, depth
+        )
+
+        names = ["timestamp", "sequence"]
+        arrays = [
+            pa.array(timestamps, type=pa.timestamp("ms", tz="UTC")),
+            pa.array(sequences),
+        ]
+        for j in range(depth):
+            names += [f"bid_px_{j}", f"bid_sz_{j}", f"ask_px_{j}", f"ask_sz_{j}"]
+            arrays += [
+                pa.array(bid_px[j]),
+                pa.array(bid_sz[j]),
+                pa.array(ask_px[j]),
+                pa.array(ask_sz[j]),
+            ]
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def _level_columns(
+        self, checkpoint: OrderBook, deltas: list[OrderbookDelta], depth: int
+    ) -> tuple[Any, Any, Any, Any, Any, Any]:
+        """
+        Shared core of the columnar outputs.
+
+        Returns timestamp and sequence arrays of length ``states`` and the
+        bid px/sz and ask px/sz arrays, level-major ``(depth, states)`` so
+        each level is a contiguous column. Missing levels are NaN.
+        """
+        import numpy as np
+
+        self.initialize(checkpoint)
+        sorted_deltas = _ensure_sorted(deltas)
+        n = len(sorted_deltas)
+
+        # Level-major so each output column is a contiguous array
+        bid_px = np.full((depth, n + 1), np.nan)
+        bid_sz = np.full((depth, n + 1), np.nan)
+        ask_px = np.full((depth, n + 1), np.nan)
+        ask_sz = np.full((depth, n + 1), np.nan)
+
+        if _HAS_NUMBA and n >= _NUMBA_MIN_DELTAS:
+            orders = np.empty((n + 1, depth), dtype=np.int64)
+            counts = np.empty(n + 1, dtype=np.int64)
+            self._run_numba_kernel(
+                sorted_deltas,
+                bid_px.T, bid_sz.T, orders, counts,
+                ask_px.T, ask_sz.T, orders, counts,
+            )
+        else:
+            for step in range(n + 1):
+                if step:
+                    self.apply_delta(sorted_deltas[step - 1])
+                for j, (px, sz) in enumerate(self._top_bids(depth)):
+                    bid_px[j, step] = px
+                    bid_sz[j, step] = sz
+                for j, (px, sz) in enumerate(self._top_asks(depth)):
+                    ask_px[j, step] = px
+                    ask_sz[j, step] = sz
+
+        timestamps = np.empty(n + 1, dtype=np.int64)
+        sequences = np.empty(n + 1, dtype=np.int64)
+        checkpoint_ts = checkpoint.timestamp
+        if checkpoint_ts.tzinfo is None:
+            checkpoint_ts = checkpoint_ts.replace(tzinfo=timezone.utc)
+        timestamps[0] = round(checkpoint_ts.timestamp() * 1000)
+        sequences[0] = 0
+        if n:
+            timestamps[1:] = np.fromiter(
+                (d.timestamp for d in sorted_deltas), dtype=np.int64, count=n
+            )
+            sequences[1:] = np.fromiter(map(_SEQ_KEY, sorted_deltas), dtype=np.int64, count=n)
+
+        return timestamps, sequences, bid_px, bid_sz, ask_px, ask_sz
+
+    def iterate(
+        self,
+        checkpoint: OrderBook,
+        deltas: Iterable[OrderbookDelta],
         depth: Optional[int] = None,
-    ) -> Iterator[ReconstructedOrderBook]:
+        numeric: bool = False,
+    ) -> Iterator[AnyReconstructedOrderBook]:
         """
         Iterate over reconstructed orderbook states (memory-efficient).
 
-        Yields a snapshot after each delta is applied.
+        Yields a snapshot after each delta is applied. ``deltas`` may be any
+        iterable (e.g. a generator over paged API results); lists are sorted
+        by sequence if needed, other iterables are consumed lazily and must
+        already be in sequence order.
 
         Args:
             checkpoint: Initial orderbook state
-            deltas: Array of delta updates
+            deltas: Delta updates (list, or pre-sorted iterable)
             depth: Maximum price levels to include
+            numeric: Emit float prices/sizes instead of strings
 
         Yields:
             Reconstructed orderbook snapshots
@@ -277,50 +1254,186 @@ class OrderBookReconstructor:
         self.initialize(checkpoint)
 
         # Yield initial state
-        yield self.get_snapshot(depth)
+        yield self.get_snapshot(depth, numeric)
 
-        # Sort deltas by sequence
-        sorted_deltas = sorted(deltas, key=lambda d: d.sequence)
+        for delta in _ordered(deltas):
+            self.apply_delta(delta)
+            yield self.get_snapshot(depth, numeric)
 
-        for delta in sorted_deltas:
+    def iterate_views(
+        self,
+        checkpoint: OrderBook,
+        deltas: Iterable[OrderbookDelta],
+        depth: Optional[int] = None,
+    ) -> Iterator[ReconstructedOrderBookView]:
+        """
+        Iterate over lazy views of each reconstructed state.
+
+        Like ``iterate()``, but yields a ``ReconstructedOrderBookView`` that
+        builds levels only when read, instead of a full snapshot per delta.
+        Each view is valid until the iterator advances; call ``freeze()`` on
+        any view you want to keep.
+
+        Args:
+            checkpoint: Initial orderbook state
+            deltas: Delta updates (list, or pre-sorted iterable)
+            depth: Maximum price levels to include
+
+        Yields:
+            Views of the orderbook state after each delta
+        """
+        self.initialize(checkpoint)
+
+        yield ReconstructedOrderBookView(self, depth)
+
+        for delta in _ordered(deltas):
             self.apply_delta(delta)
-            yield self.get_snapshot(depth)
+            yield ReconstructedOrderBookView(self, depth)
 
     def reconstruct_final(
         self,
         checkpoint: OrderBook,
-        deltas: list[OrderbookDelta],
+        deltas: Iterable[OrderbookDelta],
         depth: Optional[int] = None,
-    ) -> ReconstructedOrderBook:
+        numeric: bool = False,
+    ) -> AnyReconstructedOrderBook:
         """
         Get the final reconstructed state without intermediate snapshots.
 
-        Most efficient when you only need the end result.
+        Most efficient when you only need the end result. Non-list iterables
+        are applied as they are consumed, so memory stays bounded by the book
+        size; they must already be in sequence order.
 
         Args:
             checkpoint: Initial orderbook state
-            deltas: Array of delta updates
+            deltas: Delta updates (list, or pre-sorted iterable)
             depth: Maximum price levels to include
+            numeric: Return float prices/sizes instead of strings
 
         Returns:
             Final orderbook state after all deltas applied
         """
         self.initialize(checkpoint)
 
-        # Sort and apply all deltas
-        sorted_deltas = sorted(deltas, key=lambda d: d.sequence)
-        for delta in sorted_deltas:
-            self.apply_delta(delta)
+        if isinstance(deltas, list):
+            self._apply_deltas_bulk(deltas)
+        else:
+            self._apply_deltas_fast(_checked_stream(deltas))
 
-        return self.get_snapshot(depth)
+        return self.get_snapshot(depth, numeric)
+
+    def _apply_deltas_bulk(self, deltas: list[OrderbookDelta]) -> None:
+        """Sort and apply deltas when no intermediate state will be observed."""
+        if _HAS_NUMPY and len(deltas) >= _NUMPY_MIN_DELTAS:
+            self._apply_deltas_numpy(deltas)
+        else:
+            self._apply_deltas_fast(_ensure_sorted(deltas))
+
+    def _apply_deltas_fast(self, deltas: Iterable[OrderbookDelta]) -> None:
+        """
+        Apply deltas with no per-delta bookkeeping.
+
+        Only the book sides are touched inside the loop; best prices, the
+        top-of-book cache and the last timestamp/sequence are settled once
+        at the end. Use when no intermediate state will be observed.
+        """
+        bids = self._bids
+        asks = self._asks
+        bid_orders = self._bid_orders
+        ask_orders = self._ask_orders
+        snap = self._snap
+        delta = None
+        for delta in deltas:
+            price = delta.price if snap is None else snap(delta.price)
+            if delta.side == SIDE_BID:
+                bid_orders.pop(price, None)
+                if delta.size == 0:
+                    bids.pop(-price, None)
+                else:
+                    bids[-price] = delta.size
+            else:
+                ask_orders.pop(price, None)
+                if delta.size == 0:
+                    asks.pop(price, None)
+                else:
+                    asks[price] = delta.size
+
+        # The loop variable is left holding the last delta applied
+        if delta is not None:
+            self._settle(delta.timestamp, delta.sequence)
+
+    def _apply_deltas_numpy(self, deltas: list[OrderbookDelta]) -> None:
+        """
+        Vectorized equivalent of ``_apply_deltas_fast`` for unsorted deltas.
+
+        Sorts by sequence with a stable argsort, keeps only the last size
+        seen for each price on each side, and then writes just those
+        collapsed levels into the book.
+        """
+        import numpy as np
+
+        ts, side, price, size, sequence = self._deltas_to_arrays(deltas, self._snap)
+        order = np.argsort(sequence, kind="stable")
+        side = side[order]
+        price = price[order]
+        size = size[order]
+
+        books = (
+            (0, self._bids, self._bid_orders, -1.0),
+            (1, self._asks, self._ask_orders, 1.0),
+        )
+        for side_code, book, order_counts, sign in books:
+            mask = side == side_code
+            # Reverse so np.unique's first occurrence is the latest update
+            side_prices = price[mask][::-1]
+            side_sizes = size[mask][::-1]
+            prices, first = np.unique(side_prices, return_index=True)
+            for px, sz in zip(prices.tolist(), side_sizes[first].tolist()):
+                order_counts.pop(px, None)
+                if sz == 0:
+                    book.pop(sign * px, None)
+                else:
+                    book[sign * px] = sz
+
+        last = order[-1]
+        self._settle(int(ts[last]), int(sequence[last]))
+
+    @classmethod
+    def _deltas_to_arrays(
+        cls,
+        deltas: list[OrderbookDelta],
+        snap: Optional[Callable[[float], float]] = None,
+    ) -> tuple[Any, ...]:
+        """Unpack deltas into (timestamp, side, price, size, sequence) arrays."""
+        import numpy as np
+
+        n = len(deltas)
+        prices = map(_PRICE_KEY, deltas) if snap is None else map(snap, map(_PRICE_KEY, deltas))
+        return (
+            np.fromiter((d.timestamp for d in deltas), dtype=np.int64, count=n),
+            np.fromiter((d.side for d in deltas), dtype=np.uint8, count=n),
+            np.fromiter(prices, dtype=np.float64, count=n),
+            np.fromiter((d.size for d in deltas), dtype=np.float64, count=n),
+            np.fromiter(map(_SEQ_KEY, deltas), dtype=np.int64, count=n),
+        )
+
+    def _settle(self, timestamp_ms: int, sequence: int) -> None:
+        """Refresh derived state after deltas were applied in bulk."""
+        self._last_timestamp_ms = timestamp_ms
+        self._last_sequence = sequence
+        self._version += 1
+        self._best_bid = -self._bids.peekitem(0)[0] if self._bids else None
+        self._best_ask = self._asks.peekitem(0)[0] if self._asks else None
+        self._bid_top = None
+        self._ask_top = None
 
     @staticmethod
-    def detect_gaps(deltas: list[OrderbookDelta]) -> list[tuple[int, int]]:
+    def detect_gaps(deltas: Union[list[OrderbookDelta], DeltaArrays]) -> list[tuple[int, int]]:
         """
         Check for sequence gaps in deltas.
 
         Args:
-            deltas: Array of delta updates
+            deltas: Array of delta updates, or their DeltaArrays form
 
         Returns:
             List of (expected_seq, actual_seq) tuples where gaps exist
@@ -328,7 +1441,20 @@ class OrderBookReconstructor:
         if len(deltas) < 2:
             return []
 
-        sorted_deltas = sorted(deltas, key=lambda d: d.sequence)
+        if isinstance(deltas, DeltaArrays) or (_HAS_NUMPY and len(deltas) >= _NUMPY_MIN_DELTAS):
+            import numpy as np
+
+            if isinstance(deltas, DeltaArrays):
+                sequences = np.sort(deltas.sequence)
+            else:
+                sequences = np.fromiter(map(_SEQ_KEY, deltas), dtype=np.int64, count=len(deltas))
+                sequences.sort()
+            gap_idx = np.flatnonzero(np.diff(sequences) != 1)
+            expected = (sequences[gap_idx] + 1).tolist()
+            actual = sequences[gap_idx + 1].tolist()
+            return list(zip(expected, actual))
+
+        sorted_deltas = _ensure_sorted(deltas)
         gaps: list[tuple[int, int]] = []
 
         for i in range(1, len(sorted_deltas)):
@@ -343,7 +1469,7 @@ class OrderBookReconstructor:
 def reconstruct_orderbook(
     tick_data: TickData,
     options: Optional[ReconstructOptions] = None,
-) -> list[ReconstructedOrderBook]:
+) -> list[AnyReconstructedOrderBook]:
     """
     Convenience function for one-shot reconstruction.
 
@@ -363,16 +1489,84 @@ def reconstruct_orderbook(
 def reconstruct_final(
     tick_data: TickData,
     depth: Optional[int] = None,
-) -> ReconstructedOrderBook:
+    numeric: bool = False,
+) -> AnyReconstructedOrderBook:
     """
     Convenience function to get final orderbook state.
 
     Args:
         tick_data: Checkpoint and deltas from API
         depth: Maximum price levels
+        numeric: Return float prices/sizes instead of strings
 
     Returns:
         Final orderbook state
     """
     reconstructor = OrderBookReconstructor()
-    return reconstructor.reconstruct_final(tick_data.checkpoint, tick_data.deltas, depth)
+    return reconstructor.reconstruct_final(tick_data.checkpoint, tick_data.deltas, depth, numeric)
+
+
+# Per-process reconstructor used by reconstruct_many() workers
+_worker_reconstructor: Optional[OrderBookReconstructor] = None
+
+
+def _init_worker(tick_size: Optional[float]) -> None:
+    global _worker_reconstructor
+    _worker_reconstructor = OrderBookReconstructor(tick_size=tick_size)
+
+
+def _reconstruct_final_in_worker(
+    tick_data: TickData, depth: Optional[int], numeric: bool
+) -> AnyReconstructedOrderBook:
+    reconstructor = _worker_reconstructor or OrderBookReconstructor()
+    return reconstructor.reconstruct_final(tick_data.checkpoint, tick_data.deltas, depth, numeric)
+
+
+def reconstruct_many(
+    tick_data_map: dict[str, TickData],
+    depth: Optional[int] = None,
+    workers: Optional[int] = None,
+    *,
+    numeric: bool = False,
+    tick_size: Optional[float] = None,
+) -> dict[str, AnyReconstructedOrderBook]:
+    """
+    Reconstruct the final orderbook for many coins in parallel.
+
+    Each coin is independent, so the work is fanned out to a process pool
+    (sidestepping the GIL for the pure-Python apply loop). Every worker keeps
+    one reconstructor for its lifetime; with numba installed, its compiled
+    kernels are loaded from the on-disk cache rather than recompiled.
+
+    Args:
+        tick_data_map: Checkpoint and deltas keyed by coin
+        depth: Maximum price levels
+        workers: Number of worker processes (default: CPU count)
+        numeric: Return float prices/sizes instead of strings
+        tick_size: Optional price tick passed to each reconstructor
+
+    Returns:
+        Final orderbook state keyed by coin
+    """
+    if len(tick_data_map) <= 1 or workers == 1:
+        reconstructor = OrderBookReconstructor(tick_size=tick_size)
+        return {
+            coin: reconstructor.reconstruct_final(
+                tick_data.checkpoint, tick_data.deltas, depth, numeric
+            )
+            for coin, tick_data in tick_data_map.items()
+        }
+
+    results: dict[str, AnyReconstructedOrderBook] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(tick_size,)
+    ) as pool:
+        futures = {
+            pool.submit(_reconstruct_final_in_worker, tick_data, depth, numeric): coin
+            for coin, tick_data in tick_data_map.items()
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    # Keep the caller's key order
+    return {coin: results[coin] for coin in tick_data_map}
@@ -0,0 +1,195 @@
+"""
+Vectorized OHLCV aggregation.
+
+Builds candles from trades, or coarser candles from finer ones, with one
+NumPy pass per column (``reduceat`` over bucket boundaries) instead of a
+Python callback per bucket. Requires numpy (``pip install oxarchive[fast]``).
+
+Example:
+    >>> from oxarchive.resample import candles_from_trades, resample_candles
+    >>> trades = client.hyperliquid.trades.list("BTC", start=start, end=end).data
+    >>> bars = candles_from_trades(trades, "1m")
+    >>> hourly = resample_candles(bars, "1h")
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any, Sequence
+
+from ._timestamp import _EPOCH, _datetime_to_ms
+from .types import Candle, CandleInterval, Trade
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(
+        "Resampling requires numpy. Install with: pip install oxarchive[fast]"
+    )
+
+_MINUTE_MS = 60_000
+
+_INTERVAL_MS: dict[str, int] = {
+    "1m": _MINUTE_MS,
+    "5m": 5 * _MINUTE_MS,
+    "15m": 15 * _MINUTE_MS,
+    "30m": 30 * _MINUTE_MS,
+    "1h": 60 * _MINUTE_MS,
+    "4h": 240 * _MINUTE_MS,
+    "1d": 1440 * _MINUTE_MS,
+    "1w": 7 * 1440 * _MINUTE_MS,
+}
+
+# The Unix epoch is a Thursday; weekly buckets start on Monday 1970-01-05
+_WEEK_OFFSET_MS = 4 * 1440 * _MINUTE_MS
+
+
+def _bucket_starts(timestamps_ms: Any, interval: CandleInterval) -> tuple[Any, Any]:
+    """Bucket open times per row, and the index of each bucket's first row."""
+    try:
+        width = _INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"Unknown candle interval: {interval!r}")
+    offset = _WEEK_OFFSET_MS if interval == "1w" else 0
+    buckets = (timestamps_ms - offset) // width * width + offset
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    return buckets, starts
+
+
+def _optional_sums(values: Any, starts: Any) -> list[Any]:
+    """Per-bucket sums, or None for buckets containing a missing (NaN) value."""
+    sums = np.add.reduceat(values, starts)
+    return [None if s != s else s for s in sums.tolist()]
+
+
+def _build(
+    buckets: Any,
+    starts: Any,
+    opens: Any,
+    highs: Any,
+    lows: Any,
+    closes: Any,
+    volumes: Any,
+    quote_volumes: list[Any],
+    trade_counts: list[Any],
+) -> list[Candle]:
+    return [
+        Candle(
+            timestamp=_EPOCH + timedelta(milliseconds=ts),
+            open=o,
+            high=h,
+            low=lo,
+            close=c,
+            volume=v,
+            quote_volume=q,
+            trade_count=None if n is None else int(n),
+        )
+        for ts, o, h, lo, c, v, q, n in zip(
+            buckets[starts].tolist(),
+            opens.tolist(),
+            highs.tolist(),
+            lows.tolist(),
+            closes.tolist(),
+            volumes.tolist(),
+            quote_volumes,
+            trade_counts,
+        )
+    ]
+
+
+def candles_from_trades(trades: Sequence[Trade], interval: CandleInterval) -> list[Candle]:
+    """
+    Aggregate trades into OHLCV candles.
+
+    Trades are ordered by timestamp (stable, so same-millisecond trades keep
+    their input order); only intervals that contain trades produce a candle.
+
+    Args:
+        trades: Trades to aggregate
+        interval: Candle interval (e.g., '1m', '1h')
+
+    Returns:
+        Candles in time order, with quote_volume and trade_count filled in
+    """
+    n = len(trades)
+    if not n:
+        return []
+
+    timestamps = np.fromiter(
+        (_datetime_to_ms(t.timestamp) for t in trades), dtype=np.int64, count=n
+    )
+    prices = np.array([t.price for t in trades], dtype=np.float64)
+    sizes = np.array([t.size for t in trades], dtype=np.float64)
+
+    order = np.argsort(timestamps, kind="stable")
+    timestamps, prices, sizes = timestamps[order], prices[order], sizes[order]
+
+    buckets, starts = _bucket_starts(timestamps, interval)
+    ends = np.append(starts[1:], n)
+    return _build(
+        buckets,
+        starts,
+        prices[starts],
+        np.maximum.reduceat(prices, starts),
+        np.minimum.reduceat(prices, starts),
+        prices[ends - 1],
+        np.add.reduceat(sizes, starts),
+        np.add.reduceat(prices * sizes, starts).tolist(),
+        (ends - starts).tolist(),
+    )
+
+
+def resample_candles(candles: Sequence[Candle], interval: CandleInterval) -> list[Candle]:
+    """
+    Aggregate candles into a coarser interval (e.g., '1m' -> '1h').
+
+    quote_volume and trade_count are summed per bucket, and left as None
+    for buckets where any input candle lacks them.
+
+    Args:
+        candles: Candles to aggregate
+        interval: Target candle interval; should be a multiple of the input's
+
+    Returns:
+        Candles in time order
+    """
+    n = len(candles)
+    if not n:
+        return []
+
+    timestamps = np.fromiter(
+        (_datetime_to_ms(c.timestamp) for c in candles), dtype=np.int64, count=n
+    )
+    columns = np.array(
+        [
+            (
+                c.open,
+                c.high,
+                c.low,
+                c.close,
+                c.volume,
+                np.nan if c.quote_volume is None else c.quote_volume,
+                np.nan if c.trade_count is None else c.trade_count,
+            )
+            for c in candles
+        ],
+        dtype=np.float64,
+    )
+
+    order = np.argsort(timestamps, kind="stable")
+    timestamps, columns = timestamps[order], columns[order]
+    opens, highs, lows, closes, volumes, quote_volumes, trade_counts = columns.T
+
+    buckets, starts = _bucket_starts(timestamps, interval)
+    ends = np.append(starts[1:], n)
+    return _build(
+        buckets,
+        starts,
+        opens[starts],
+        np.maximum.reduceat(highs, starts),
+        np.minimum.reduceat(lows, starts),
+        closes[ends - 1],
+        np.add.reduceat(volumes, starts),
+        _optional_sums(quote_volumes, starts),
+        _optional_sums(trade_counts, starts),
+    )
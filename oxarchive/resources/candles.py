@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Optional
 
+from .._envelopes import parse_page
+from .._timestamp import to_unix_ms
 from ..http import HttpClient
 from ..types import Candle, CandleInterval, CursorResponse, Timestamp
 
@@ -31,21 +32,7 @@ class CandlesResource:
         self._base_path = base_path
         self._coin_transform = coin_transform
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     def history(
         self,
@@ -80,7 +67,7 @@ class CandlesResource:
             ...     )
             ...     candles.extend(result.data)
         """
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/candles/{self._coin_transform(coin)}",
             params={
                 "start": self._convert_timestamp(start),
@@ -90,10 +77,7 @@ class CandlesResource:
                 "limit": limit,
             },
         )
-        return CursorResponse(
-            data=[Candle.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, Candle)
 
     async def ahistory(
         self,
@@ -106,7 +90,7 @@ class CandlesResource:
         limit: Optional[int] = None,
     ) -> CursorResponse[list[Candle]]:
         """Async version of history(). start and end are required."""
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"{self._base_path}/candles/{self._coin_transform(coin)}",
             params={
                 "start": self._convert_timestamp(start),
@@ -116,7 +100,4 @@ class CandlesResource:
                 "limit": limit,
             },
         )
-        return CursorResponse(
-            data=[Candle.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, Candle)
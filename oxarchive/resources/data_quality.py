@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Literal, Optional
-
-from ..http import HttpClient
+import asyncio
+import inspect
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Literal, Optional, Sequence, TypeVar, cast
+
+from pydantic import BaseModel, TypeAdapter
+
+from .._timestamp import to_unix_ms
+from ..http import HttpClient, _json_loads
 from ..types import (
     CoverageResponse,
     ExchangeCoverage,
@@ -18,6 +27,81 @@ from ..types import (
     Timestamp,
 )
 
+# Only located here and imported on first use by symbol_coverage(max_gaps=...)
+_HAS_SIMDJSON = find_spec("simdjson") is not None
+
+# Built once per process so each call reuses the compiled validator. Responses
+# are validated straight from the raw JSON body, skipping the intermediate dict.
+_STATUS_ADAPTER = TypeAdapter(StatusResponse)
+_COVERAGE_ADAPTER = TypeAdapter(CoverageResponse)
+_EXCHANGE_COVERAGE_ADAPTER = TypeAdapter(ExchangeCoverage)
+_SYMBOL_COVERAGE_ADAPTER = TypeAdapter(SymbolCoverageResponse)
+_INCIDENTS_ADAPTER = TypeAdapter(IncidentsResponse)
+_INCIDENT_ADAPTER = TypeAdapter(Incident)
+_LATENCY_ADAPTER = TypeAdapter(LatencyResponse)
+_SLA_ADAPTER = TypeAdapter(SlaResponse)
+
+T = TypeVar("T", bound=BaseModel)
+
+_CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+# Bound on the per-resource cache of built coverage URLs
+_MAX_CACHED_URLS = 1024
+
+
+@lru_cache(maxsize=512)
+def _norm(exchange: str, symbol: str = "") -> tuple[str, str]:
+    """Canonical (lowercase exchange, uppercase symbol), interned and shared across resources."""
+    return sys.intern(exchange.lower()), sys.intern(symbol.upper())
+
+
+def _query_params(*pairs: tuple[str, Any]) -> dict[str, Any]:
+    """Build query params, leaving out unset (None) values."""
+    return {key: value for key, value in pairs if value is not None}
+
+
+def _to_python(value: Any) -> Any:
+    """Materialize a lazy simdjson value."""
+    import simdjson
+
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    return value
+
+
+def _decode_symbol_coverage(raw: bytes, max_gaps: int) -> dict[str, Any]:
+    """
+    Decode a symbol coverage body keeping at most ``max_gaps`` gaps per data type.
+
+    With pysimdjson installed the body is parsed lazily and only the kept
+    gaps become Python objects; otherwise it is decoded in full and the gap
+    lists are truncated before validation.
+    """
+    if not _HAS_SIMDJSON:
+        data: dict[str, Any] = _json_loads(raw)
+        for coverage in data.get("data_types", {}).values():
+            del coverage["gaps"][max_gaps:]
+        return data
+
+    import simdjson
+
+    # Indexing keeps values lazy; .items() would materialize every gap
+    doc: Any = simdjson.Parser().parse(raw)
+    data = {key: _to_python(doc[key]) for key in doc.keys() if key != "data_types"}
+    if "data_types" not in doc:
+        return data
+    data_types_doc = doc["data_types"]
+    data_types: dict[str, Any] = {}
+    for name in data_types_doc.keys():
+        coverage = data_types_doc[name]
+        fields = {key: _to_python(coverage[key]) for key in coverage.keys() if key != "gaps"}
+        fields["gaps"] = [_to_python(gap) for gap in coverage["gaps"][:max_gaps]]
+        data_types[name] = fields
+    data["data_types"] = data_types
+    return data
+
 
 class DataQualityResource:
     """
@@ -38,27 +122,112 @@ class DataQualityResource:
         >>> print(f"BTC completeness: {btc.data_types['orderbook'].completeness}%")
         >>> for gap in btc.data_types['orderbook'].gaps[:5]:
         ...     print(f"Gap: {gap.start} - {gap.end} ({gap.duration_minutes} min)")
+        >>>
+        >>> # Reuse status/coverage/latency/SLA results for 5 seconds when polling
+        >>> client.data_quality.cache_ttl = 5.0
     """
 
-    def __init__(self, http: HttpClient, base_path: str = "/v1/data-quality"):
+    def __init__(
+        self,
+        http: HttpClient,
+        base_path: str = "/v1/data-quality",
+        cache_ttl: Optional[float] = None,
+    ):
         self._http = http
         self._base_path = base_path
-
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+        self.cache_ttl = cache_ttl
+        """
+        Seconds to reuse results of the read-only aggregate endpoints (status,
+        coverage, exchange_coverage, latency, sla). None disables caching.
+        Every call returns a fresh copy of the cached result.
+        Expired entries are revalidated with If-None-Match when the server
+        sent an ETag, so an unchanged payload is not downloaded or parsed again.
+        """
+        self._cache: dict[_CacheKey, tuple[float, Optional[str], Any]] = {}
+
+        # Endpoint URLs are fixed per resource, so build them once
+        self._status_url = f"{base_path}/status"
+        self._coverage_url = f"{base_path}/coverage"
+        self._incidents_url = f"{base_path}/incidents"
+        self._latency_url = f"{base_path}/latency"
+        self._sla_url = f"{base_path}/sla"
+        self._coverage_urls: dict[tuple[str, ...], str] = {}
+
+    _convert_timestamp = staticmethod(to_unix_ms)
+
+    def _coverage_url_for(self, *parts: str) -> str:
+        """Coverage URL for an exchange, or an (exchange, symbol) pair, cached by raw input."""
+        url = self._coverage_urls.get(parts)
+        if url is None:
+            if len(self._coverage_urls) >= _MAX_CACHED_URLS:
+                self._coverage_urls.clear()
+            exchange, symbol = _norm(*parts)
+            if len(parts) == 1:
+                url = f"{self._coverage_url}/{exchange}"
+            else:
+                url = f"{self._coverage_url}/{exchange}/{symbol}"
+            self._coverage_urls[parts] = url
+        return url
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+
+    def _cache_lookup(
+        self, path: str, params: Optional[dict[str, Any]]
+    ) -> tuple[_CacheKey, Optional[tuple[float, Optional[str], Any]]]:
+        key = (path, tuple(sorted(params.items())) if params else ())
+        return key, self._cache.get(key)
+
+    def _cached_get(
+        self, path: str, adapter: TypeAdapter[T], params: Optional[dict[str, Any]] = None
+    ) -> T:
+        """GET and validate ``path``, reusing the result for ``cache_ttl`` seconds."""
+        ttl = self.cache_ttl
+        if not ttl:
+            return adapter.validate_json(self._http.get_bytes(path, params=params))
+
+        key, entry = self._cache_lookup(path, params)
+        if entry is not None and entry[0] > time.monotonic():
+            value = cast(T, entry[2])
+        else:
+            body, etag = self._http.get_bytes_if_modified(
+                path, params=params, etag=entry[1] if entry is not None else None
+            )
+            if body is None:
+                # 304 Not Modified, only possible when a cached ETag was sent
+                value = cast(T, entry[2] if entry is not None else None)
+            else:
+                value = adapter.validate_json(body)
+            self._cache[key] = (time.monotonic() + ttl, etag, value)
+        # Each caller gets its own copy, so mutating a result cannot change
+        # what later cache hits return
+        return value.model_copy(deep=True)
+
+    async def _acached_get(
+        self, path: str, adapter: TypeAdapter[T], params: Optional[dict[str, Any]] = None
+    ) -> T:
+        """Async version of _cached_get()."""
+        ttl = self.cache_ttl
+        if not ttl:
+            return adapter.validate_json(await self._http.aget_bytes(path, params=params))
+
+        key, entry = self._cache_lookup(path, params)
+        if entry is not None and entry[0] > time.monotonic():
+            value = cast(T, entry[2])
+        else:
+            body, etag = await self._http.aget_bytes_if_modified(
+                path, params=params, etag=entry[1] if entry is not None else None
+            )
+            if body is None:
+                # 304 Not Modified, only possible when a cached ETag was sent
+                value = cast(T, entry[2] if entry is not None else None)
+            else:
+                value = adapter.validate_json(body)
+            self._cache[key] = (time.monotonic() + ttl, etag, value)
+        # Each caller gets its own copy, so mutating a result cannot change
+        # what later cache hits return
+        return value.model_copy(deep=True)
 
     # =========================================================================
     # Status Endpoints
@@ -78,13 +247,11 @@ class DataQualityResource:
             >>> for exchange, info in status.exchanges.items():
             ...     print(f"{exchange}: {info.status}")
         """
-        data = self._http.get(f"{self._base_path}/status")
-        return StatusResponse.model_validate(data)
+        return self._cached_get(self._status_url, _STATUS_ADAPTER)
 
     async def astatus(self) -> StatusResponse:
         """Async version of status()."""
-        data = await self._http.aget(f"{self._base_path}/status")
-        return StatusResponse.model_validate(data)
+        return await self._acached_get(self._status_url, _STATUS_ADAPTER)
 
     # =========================================================================
     # Coverage Endpoints
@@ -104,13 +271,11 @@ class DataQualityResource:
             ...     for dtype, info in exchange.data_types.items():
             ...         print(f"  {dtype}: {info.total_records} records")
         """
-        data = self._http.get(f"{self._base_path}/coverage")
-        return CoverageResponse.model_validate(data)
+        return self._cached_get(self._coverage_url, _COVERAGE_ADAPTER)
 
     async def acoverage(self) -> CoverageResponse:
         """Async version of coverage()."""
-        data = await self._http.aget(f"{self._base_path}/coverage")
-        return CoverageResponse.model_validate(data)
+        return await self._acached_get(self._coverage_url, _COVERAGE_ADAPTER)
 
     def exchange_coverage(self, exchange: str) -> ExchangeCoverage:
         """
@@ -126,13 +291,11 @@ class DataQualityResource:
             >>> hl = client.data_quality.exchange_coverage("hyperliquid")
             >>> print(f"Orderbook earliest: {hl.data_types['orderbook'].earliest}")
         """
-        data = self._http.get(f"{self._base_path}/coverage/{exchange.lower()}")
-        return ExchangeCoverage.model_validate(data)
+        return self._cached_get(self._coverage_url_for(exchange), _EXCHANGE_COVERAGE_ADAPTER)
 
     async def aexchange_coverage(self, exchange: str) -> ExchangeCoverage:
         """Async version of exchange_coverage()."""
-        data = await self._http.aget(f"{self._base_path}/coverage/{exchange.lower()}")
-        return ExchangeCoverage.model_validate(data)
+        return await self._acached_get(self._coverage_url_for(exchange), _EXCHANGE_COVERAGE_ADAPTER)
 
     def symbol_coverage(
         self,
@@ -141,6 +304,7 @@ class DataQualityResource:
         *,
         from_time: Optional[Timestamp] = None,
         to_time: Optional[Timestamp] = None,
+        max_gaps: Optional[int] = None,
     ) -> SymbolCoverageResponse:
         """
         Get data coverage for a specific symbol on an exchange.
@@ -155,6 +319,9 @@ class DataQualityResource:
                 Accepts Unix ms, datetime, or ISO string.
             to_time: End of gap detection window (default: now).
                 Accepts Unix ms, datetime, or ISO string.
+            max_gaps: Keep only the first N gaps per data type. The rest are
+                skipped before validation (and before decoding, when pysimdjson
+                is installed), which saves time and memory on long gap lists.
 
         Returns:
             SymbolCoverageResponse with per-data-type coverage including gaps,
@@ -177,14 +344,18 @@ class DataQualityResource:
             >>> if btc.data_types["orderbook"].cadence:
             ...     print(f"Cadence: {btc.data_types['orderbook'].cadence.median_interval_seconds}s")
         """
-        data = self._http.get(
-            f"{self._base_path}/coverage/{exchange.lower()}/{symbol.upper()}",
-            params={
-                "from": self._convert_timestamp(from_time),
-                "to": self._convert_timestamp(to_time),
-            },
+        data = self._http.get_bytes(
+            self._coverage_url_for(exchange, symbol),
+            params=_query_params(
+                ("from", self._convert_timestamp(from_time)),
+                ("to", self._convert_timestamp(to_time)),
+            ),
         )
-        return SymbolCoverageResponse.model_validate(data)
+        if max_gaps is not None:
+            return _SYMBOL_COVERAGE_ADAPTER.validate_python(
+                _decode_symbol_coverage(data, max_gaps)
+            )
+        return _SYMBOL_COVERAGE_ADAPTER.validate_json(data)
 
     async def asymbol_coverage(
         self,
@@ -193,16 +364,109 @@ class DataQualityResource:
         *,
         from_time: Optional[Timestamp] = None,
         to_time: Optional[Timestamp] = None,
+        max_gaps: Optional[int] = None,
     ) -> SymbolCoverageResponse:
         """Async version of symbol_coverage()."""
-        data = await self._http.aget(
-            f"{self._base_path}/coverage/{exchange.lower()}/{symbol.upper()}",
-            params={
-                "from": self._convert_timestamp(from_time),
-                "to": self._convert_timestamp(to_time),
-            },
+        data = await self._http.aget_bytes(
+            self._coverage_url_for(exchange, symbol),
+            params=_query_params(
+                ("from", self._convert_timestamp(from_time)),
+                ("to", self._convert_timestamp(to_time)),
+            ),
         )
-        return SymbolCoverageResponse.model_validate(data)
+        if max_gaps is not None:
+            return _SYMBOL_COVERAGE_ADAPTER.validate_python(
+                _decode_symbol_coverage(data, max_gaps)
+            )
+        return _SYMBOL_COVERAGE_ADAPTER.validate_json(data)
+
+    def exchange_coverage_many(
+        self,
+        exchanges: list[str],
+        *,
+        max_workers: int = 10,
+    ) -> dict[str, ExchangeCoverage]:
+        """
+        Get data coverage for several exchanges concurrently.
+
+        Requests are issued from a thread pool over the client's shared
+        connection pool, so total latency is roughly that of the slowest
+        exchange rather than the sum.
+
+        Args:
+            exchanges: Exchange names ('hyperliquid', 'lighter', 'hip3')
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Dict mapping each requested exchange name to its ExchangeCoverage.
+
+        Example:
+            >>> cov = client.data_quality.exchange_coverage_many(["hyperliquid", "lighter"])
+            >>> print(cov["lighter"].data_types["orderbook"].latest)
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(exchanges)))) as pool:
+            return dict(zip(exchanges, pool.map(self.exchange_coverage, exchanges)))
+
+    async def aexchange_coverage_many(self, exchanges: list[str]) -> dict[str, ExchangeCoverage]:
+        """Async version of exchange_coverage_many(); requests run via asyncio.gather."""
+        results = await asyncio.gather(*(self.aexchange_coverage(e) for e in exchanges))
+        return dict(zip(exchanges, results))
+
+    def symbol_coverage_many(
+        self,
+        pairs: list[tuple[str, str]],
+        *,
+        from_time: Optional[Timestamp] = None,
+        to_time: Optional[Timestamp] = None,
+        max_gaps: Optional[int] = None,
+        max_workers: int = 10,
+    ) -> dict[tuple[str, str], SymbolCoverageResponse]:
+        """
+        Get data coverage for several (exchange, symbol) pairs concurrently.
+
+        Args:
+            pairs: (exchange, symbol) tuples, e.g. [("hyperliquid", "BTC"), ("lighter", "ETH")]
+            from_time: Start of gap detection window, applied to every pair
+            to_time: End of gap detection window, applied to every pair
+            max_gaps: Keep only the first N gaps per data type (see symbol_coverage)
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Dict mapping each requested pair to its SymbolCoverageResponse.
+
+        Example:
+            >>> cov = client.data_quality.symbol_coverage_many(
+            ...     [("hyperliquid", "BTC"), ("hyperliquid", "ETH")]
+            ... )
+            >>> print(cov[("hyperliquid", "ETH")].data_types["trades"].completeness)
+        """
+
+        def fetch(pair: tuple[str, str]) -> SymbolCoverageResponse:
+            return self.symbol_coverage(
+                *pair, from_time=from_time, to_time=to_time, max_gaps=max_gaps
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as pool:
+            return dict(zip(pairs, pool.map(fetch, pairs)))
+
+    async def asymbol_coverage_many(
+        self,
+        pairs: list[tuple[str, str]],
+        *,
+        from_time: Optional[Timestamp] = None,
+        to_time: Optional[Timestamp] = None,
+        max_gaps: Optional[int] = None,
+    ) -> dict[tuple[str, str], SymbolCoverageResponse]:
+        """Async version of symbol_coverage_many(); requests run via asyncio.gather."""
+        results = await asyncio.gather(
+            *(
+                self.asymbol_coverage(
+                    exchange, symbol, from_time=from_time, to_time=to_time, max_gaps=max_gaps
+                )
+                for exchange, symbol in pairs
+            )
+        )
+        return dict(zip(pairs, results))
 
     # =========================================================================
     # Incidents Endpoints
@@ -236,17 +500,17 @@ class DataQualityResource:
             >>> for incident in result.incidents:
             ...     print(f"{incident.severity}: {incident.title}")
         """
-        data = self._http.get(
-            f"{self._base_path}/incidents",
-            params={
-                "status": status,
-                "exchange": exchange,
-                "since": self._convert_timestamp(since),
-                "limit": limit,
-                "offset": offset,
-            },
+        data = self._http.get_bytes(
+            self._incidents_url,
+            params=_query_params(
+                ("status", status),
+                ("exchange", exchange),
+                ("since", self._convert_timestamp(since)),
+                ("limit", limit),
+                ("offset", offset),
+            ),
         )
-        return IncidentsResponse.model_validate(data)
+        return _INCIDENTS_ADAPTER.validate_json(data)
 
     async def alist_incidents(
         self,
@@ -258,17 +522,17 @@ class DataQualityResource:
         offset: Optional[int] = None,
     ) -> IncidentsResponse:
         """Async version of list_incidents()."""
-        data = await self._http.aget(
-            f"{self._base_path}/incidents",
-            params={
-                "status": status,
-                "exchange": exchange,
-                "since": self._convert_timestamp(since),
-                "limit": limit,
-                "offset": offset,
-            },
+        data = await self._http.aget_bytes(
+            self._incidents_url,
+            params=_query_params(
+                ("status", status),
+                ("exchange", exchange),
+                ("since", self._convert_timestamp(since)),
+                ("limit", limit),
+                ("offset", offset),
+            ),
         )
-        return IncidentsResponse.model_validate(data)
+        return _INCIDENTS_ADAPTER.validate_json(data)
 
     def get_incident(self, incident_id: str) -> Incident:
         """
@@ -285,13 +549,13 @@ class DataQualityResource:
             >>> print(f"Status: {incident.status}")
             >>> print(f"Root cause: {incident.root_cause}")
         """
-        data = self._http.get(f"{self._base_path}/incidents/{incident_id}")
-        return Incident.model_validate(data)
+        data = self._http.get_bytes(f"{self._incidents_url}/{incident_id}")
+        return _INCIDENT_ADAPTER.validate_json(data)
 
     async def aget_incident(self, incident_id: str) -> Incident:
         """Async version of get_incident()."""
-        data = await self._http.aget(f"{self._base_path}/incidents/{incident_id}")
-        return Incident.model_validate(data)
+        data = await self._http.aget_bytes(f"{self._incidents_url}/{incident_id}")
+        return _INCIDENT_ADAPTER.validate_json(data)
 
     # =========================================================================
     # Latency Endpoints
@@ -312,13 +576,11 @@ class DataQualityResource:
             ...         print(f"  WS current: {metrics.websocket.current_ms}ms")
             ...     print(f"  OB lag: {metrics.data_freshness.orderbook_lag_ms}ms")
         """
-        data = self._http.get(f"{self._base_path}/latency")
-        return LatencyResponse.model_validate(data)
+        return self._cached_get(self._latency_url, _LATENCY_ADAPTER)
 
     async def alatency(self) -> LatencyResponse:
         """Async version of latency()."""
-        data = await self._http.aget(f"{self._base_path}/latency")
-        return LatencyResponse.model_validate(data)
+        return await self._acached_get(self._latency_url, _LATENCY_ADAPTER)
 
     # =========================================================================
     # SLA Endpoints
@@ -347,14 +609,14 @@ class DataQualityResource:
             >>> print(f"Completeness: {sla.actual.data_completeness.overall}%")
             >>> print(f"API P99: {sla.actual.api_latency_p99_ms}ms")
         """
-        data = self._http.get(
-            f"{self._base_path}/sla",
-            params={
-                "year": year,
-                "month": month,
-            },
+        return self._cached_get(
+            self._sla_url,
+            _SLA_ADAPTER,
+            params=_query_params(
+                ("year", year),
+                ("month", month),
+            ),
         )
-        return SlaResponse.model_validate(data)
 
     async def asla(
         self,
@@ -363,11 +625,78 @@ class DataQualityResource:
         month: Optional[int] = None,
     ) -> SlaResponse:
         """Async version of sla()."""
-        data = await self._http.aget(
-            f"{self._base_path}/sla",
-            params={
-                "year": year,
-                "month": month,
-            },
+        return await self._acached_get(
+            self._sla_url,
+            _SLA_ADAPTER,
+            params=_query_params(
+                ("year", year),
+                ("month", month),
+            ),
+        )
+
+    # =========================================================================
+    # Combined Endpoints
+    # =========================================================================
+
+    def dashboard_snapshot(self) -> tuple[StatusResponse, CoverageResponse, LatencyResponse]:
+        """
+        Get status, coverage, and latency together, fetched concurrently.
+
+        The three requests overlap on the shared connection pool, so this takes
+        about as long as the slowest of them instead of their sum.
+
+        Returns:
+            Tuple of (StatusResponse, CoverageResponse, LatencyResponse).
+
+        Example:
+            >>> status, coverage, latency = client.data_quality.dashboard_snapshot()
+            >>> print(f"{status.status}: {len(coverage.exchanges)} exchanges")
+        """
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            status = pool.submit(self.status)
+            coverage = pool.submit(self.coverage)
+            latency = pool.submit(self.latency)
+            return status.result(), coverage.result(), latency.result()
+
+    async def adashboard_snapshot(
+        self,
+    ) -> tuple[StatusResponse, CoverageResponse, LatencyResponse]:
+        """Async version of dashboard_snapshot(); requests run via asyncio.gather."""
+        status, coverage, latency = await asyncio.gather(
+            self.astatus(), self.acoverage(), self.alatency()
+        )
+        return status, coverage, latency
+
+    def batch(self, calls: Sequence[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Run several data quality calls concurrently from synchronous code.
+
+        Each call is a ``(method_name, kwargs)`` pair naming a method of this
+        resource. The async variants are scheduled together on the client's
+        background event loop, so the requests overlap instead of running
+        one after another.
+
+        Args:
+            calls: Sequence of ``(method_name, kwargs)`` pairs
+
+        Returns:
+            List of results, in the same order as ``calls``.
+
+        Example:
+            >>> status, btc, eth = client.data_quality.batch([
+            ...     ("status", {}),
+            ...     ("symbol_coverage", {"exchange": "hyperliquid", "symbol": "BTC"}),
+            ...     ("symbol_coverage", {"exchange": "hyperliquid", "symbol": "ETH"}),
+            ... ])
+        """
+        if not calls:
+            return []
+        methods = []
+        for name, _ in calls:
+            method = getattr(self, f"a{name}", None)
+            if name.startswith("_") or not inspect.iscoroutinefunction(method):
+                raise ValueError(f"Unknown data quality method: {name!r}")
+            methods.append(method)
+        return self._http.run_sync(
+            *(method(**kwargs) for method, (_, kwargs) in zip(methods, calls))
         )
-        return SlaResponse.model_validate(data)
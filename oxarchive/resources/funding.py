@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Optional
 
+from .._envelopes import parse_data, parse_page
+from .._timestamp import to_unix_ms
 from ..http import HttpClient
 from ..types import CursorResponse, FundingRate, Timestamp
 
@@ -26,21 +27,7 @@ class FundingResource:
         self._base_path = base_path
         self._coin_transform = coin_transform
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     def history(
         self,
@@ -84,14 +71,11 @@ class FundingResource:
         }
         if interval:
             params["interval"] = interval
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/funding/{self._coin_transform(coin)}",
             params=params,
         )
-        return CursorResponse(
-            data=[FundingRate.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, FundingRate)
 
     async def ahistory(
         self,
@@ -112,14 +96,11 @@ class FundingResource:
         }
         if interval:
             params["interval"] = interval
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"{self._base_path}/funding/{self._coin_transform(coin)}",
             params=params,
         )
-        return CursorResponse(
-            data=[FundingRate.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, FundingRate)
 
     def current(self, coin: str) -> FundingRate:
         """
@@ -131,10 +112,14 @@ class FundingResource:
         Returns:
             Current funding rate
         """
-        data = self._http.get(f"{self._base_path}/funding/{self._coin_transform(coin)}/current")
-        return FundingRate.model_validate(data["data"])
+        raw = self._http.get_bytes(
+            f"{self._base_path}/funding/{self._coin_transform(coin)}/current"
+        )
+        return parse_data(raw, FundingRate)
 
     async def acurrent(self, coin: str) -> FundingRate:
         """Async version of current()."""
-        data = await self._http.aget(f"{self._base_path}/funding/{self._coin_transform(coin)}/current")
-        return FundingRate.model_validate(data["data"])
+        raw = await self._http.aget_bytes(
+            f"{self._base_path}/funding/{self._coin_transform(coin)}/current"
+        )
+        return parse_data(raw, FundingRate)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .._envelopes import parse_data, parse_list
 from ..http import HttpClient
 from ..types import Hip3Instrument, Instrument, LighterInstrument
 
@@ -29,13 +30,13 @@ class InstrumentsResource:
         Returns:
             List of instruments
         """
-        data = self._http.get(f"{self._base_path}/instruments")
-        return [Instrument.model_validate(item) for item in data["data"]]
+        raw = self._http.get_bytes(f"{self._base_path}/instruments")
+        return parse_list(raw, Instrument)
 
     async def alist(self) -> list[Instrument]:
         """Async version of list()."""
-        data = await self._http.aget(f"{self._base_path}/instruments")
-        return [Instrument.model_validate(item) for item in data["data"]]
+        raw = await self._http.aget_bytes(f"{self._base_path}/instruments")
+        return parse_list(raw, Instrument)
 
     def get(self, coin: str) -> Instrument:
         """
@@ -47,13 +48,13 @@ class InstrumentsResource:
         Returns:
             Instrument details
         """
-        data = self._http.get(f"{self._base_path}/instruments/{coin.upper()}")
-        return Instrument.model_validate(data["data"])
+        raw = self._http.get_bytes(f"{self._base_path}/instruments/{coin.upper()}")
+        return parse_data(raw, Instrument)
 
     async def aget(self, coin: str) -> Instrument:
         """Async version of get()."""
-        data = await self._http.aget(f"{self._base_path}/instruments/{coin.upper()}")
-        return Instrument.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"{self._base_path}/instruments/{coin.upper()}")
+        return parse_data(raw, Instrument)
 
 
 class LighterInstrumentsResource:
@@ -83,13 +84,13 @@ class LighterInstrumentsResource:
         Returns:
             List of Lighter instruments with full market configuration
         """
-        data = self._http.get(f"{self._base_path}/instruments")
-        return [LighterInstrument.model_validate(item) for item in data["data"]]
+        raw = self._http.get_bytes(f"{self._base_path}/instruments")
+        return parse_list(raw, LighterInstrument)
 
     async def alist(self) -> list[LighterInstrument]:
         """Async version of list()."""
-        data = await self._http.aget(f"{self._base_path}/instruments")
-        return [LighterInstrument.model_validate(item) for item in data["data"]]
+        raw = await self._http.aget_bytes(f"{self._base_path}/instruments")
+        return parse_list(raw, LighterInstrument)
 
     def get(self, coin: str) -> LighterInstrument:
         """
@@ -101,13 +102,13 @@ class LighterInstrumentsResource:
         Returns:
             Lighter instrument details with full market configuration
         """
-        data = self._http.get(f"{self._base_path}/instruments/{coin.upper()}")
-        return LighterInstrument.model_validate(data["data"])
+        raw = self._http.get_bytes(f"{self._base_path}/instruments/{coin.upper()}")
+        return parse_data(raw, LighterInstrument)
 
     async def aget(self, coin: str) -> LighterInstrument:
         """Async version of get()."""
-        data = await self._http.aget(f"{self._base_path}/instruments/{coin.upper()}")
-        return LighterInstrument.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"{self._base_path}/instruments/{coin.upper()}")
+        return parse_data(raw, LighterInstrument)
 
 
 class Hip3InstrumentsResource:
@@ -138,13 +139,13 @@ class Hip3InstrumentsResource:
         Returns:
             List of HIP-3 instruments
         """
-        data = self._http.get(f"{self._base_path}/instruments")
-        return [Hip3Instrument.model_validate(item) for item in data["data"]]
+        raw = self._http.get_bytes(f"{self._base_path}/instruments")
+        return parse_list(raw, Hip3Instrument)
 
     async def alist(self) -> list[Hip3Instrument]:
         """Async version of list()."""
-        data = await self._http.aget(f"{self._base_path}/instruments")
-        return [Hip3Instrument.model_validate(item) for item in data["data"]]
+        raw = await self._http.aget_bytes(f"{self._base_path}/instruments")
+        return parse_list(raw, Hip3Instrument)
 
     def get(self, coin: str) -> Hip3Instrument:
         """
@@ -157,11 +158,11 @@ class Hip3InstrumentsResource:
             HIP-3 instrument details with latest market data
         """
         coin = self._coin_transform(coin)
-        data = self._http.get(f"{self._base_path}/instruments/{coin}")
-        return Hip3Instrument.model_validate(data["data"])
+        raw = self._http.get_bytes(f"{self._base_path}/instruments/{coin}")
+        return parse_data(raw, Hip3Instrument)
 
     async def aget(self, coin: str) -> Hip3Instrument:
         """Async version of get()."""
         coin = self._coin_transform(coin)
-        data = await self._http.aget(f"{self._base_path}/instruments/{coin}")
-        return Hip3Instrument.model_validate(data["data"])
+        raw = await self._http.aget_bytes(f"{self._base_path}/instruments/{coin}")
+        return parse_data(raw, Hip3Instrument)
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from .._envelopes import parse_page
+from .._timestamp import to_unix_ms
 from ..http import HttpClient
 from ..types import CursorResponse, Liquidation, LiquidationVolume, Timestamp
 
+if TYPE_CHECKING:
+    from ..liquidation_arrays import LiquidationArrays
+
 
 class LiquidationsResource:
     """
@@ -37,21 +41,7 @@ class LiquidationsResource:
         self._http = http
         self._base_path = base_path
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     def history(
         self,
@@ -84,7 +74,7 @@ class LiquidationsResource:
             ...     )
             ...     liquidations.extend(result.data)
         """
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/liquidations/{coin.upper()}",
             params={
                 "start": self._convert_timestamp(start),
@@ -93,10 +83,7 @@ class LiquidationsResource:
                 "limit": limit,
             },
         )
-        return CursorResponse(
-            data=[Liquidation.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, Liquidation)
 
     async def ahistory(
         self,
@@ -108,7 +95,42 @@ class LiquidationsResource:
         limit: Optional[int] = None,
     ) -> CursorResponse[list[Liquidation]]:
         """Async version of history(). start and end are required."""
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
+            f"{self._base_path}/liquidations/{coin.upper()}",
+            params={
+                "start": self._convert_timestamp(start),
+                "end": self._convert_timestamp(end),
+                "cursor": cursor,
+                "limit": limit,
+            },
+        )
+        return parse_page(raw, Liquidation)
+
+    def history_arrays(
+        self,
+        coin: str,
+        *,
+        start: Timestamp,
+        end: Timestamp,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> CursorResponse[LiquidationArrays]:
+        """
+        Get one page of liquidation history as NumPy columns (requires numpy).
+
+        Same request as history(), but decoded into a LiquidationArrays
+        (float64 price/size columns, int64 ms timestamps) instead of one
+        Liquidation model per event.
+
+        Example:
+            >>> page = client.hyperliquid.liquidations.history_arrays(
+            ...     "BTC", start=start, end=end, limit=1000
+            ... )
+            >>> notional = (page.data.price * page.data.size).sum()
+        """
+        from ..liquidation_arrays import LiquidationArrays
+
+        raw = self._http.get_bytes(
             f"{self._base_path}/liquidations/{coin.upper()}",
             params={
                 "start": self._convert_timestamp(start),
@@ -117,10 +139,30 @@ class LiquidationsResource:
                 "limit": limit,
             },
         )
-        return CursorResponse(
-            data=[Liquidation.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
+        return LiquidationArrays.page_from_json(raw)
+
+    async def ahistory_arrays(
+        self,
+        coin: str,
+        *,
+        start: Timestamp,
+        end: Timestamp,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> CursorResponse[LiquidationArrays]:
+        """Async version of history_arrays()."""
+        from ..liquidation_arrays import LiquidationArrays
+
+        raw = await self._http.aget_bytes(
+            f"{self._base_path}/liquidations/{coin.upper()}",
+            params={
+                "start": self._convert_timestamp(start),
+                "end": self._convert_timestamp(end),
+                "cursor": cursor,
+                "limit": limit,
+            },
         )
+        return LiquidationArrays.page_from_json(raw)
 
     def by_user(
         self,
@@ -159,14 +201,11 @@ class LiquidationsResource:
         if coin:
             params["coin"] = coin.upper()
 
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/liquidations/user/{user_address}",
             params=params,
         )
-        return CursorResponse(
-            data=[Liquidation.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, Liquidation)
 
     async def aby_user(
         self,
@@ -188,14 +227,11 @@ class LiquidationsResource:
         if coin:
             params["coin"] = coin.upper()
 
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"{self._base_path}/liquidations/user/{user_address}",
             params=params,
         )
-        return CursorResponse(
-            data=[Liquidation.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, Liquidation)
 
     def volume(
         self,
@@ -226,7 +262,7 @@ class LiquidationsResource:
             >>> for bucket in result.data:
             ...     print(f"{bucket.timestamp}: ${bucket.total_usd:.0f} ({bucket.count} liquidations)")
         """
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/liquidations/{coin.upper()}/volume",
             params={
                 "start": self._convert_timestamp(start),
@@ -236,10 +272,7 @@ class LiquidationsResource:
                 "cursor": cursor,
             },
         )
-        return CursorResponse(
-            data=[LiquidationVolume.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, LiquidationVolume)
 
     async def avolume(
         self,
@@ -252,7 +285,7 @@ class LiquidationsResource:
         cursor: Optional[str] = None,
     ) -> CursorResponse[list[LiquidationVolume]]:
         """Async version of volume()."""
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"{self._base_path}/liquidations/{coin.upper()}/volume",
             params={
                 "start": self._convert_timestamp(start),
@@ -262,7 +295,4 @@ class LiquidationsResource:
                 "cursor": cursor,
             },
         )
-        return CursorResponse(
-            data=[LiquidationVolume.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, LiquidationVolume)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Optional
 
+from .._envelopes import parse_data, parse_page
+from .._timestamp import to_unix_ms
 from ..http import HttpClient
 from ..types import CursorResponse, OpenInterest, Timestamp
 
@@ -26,21 +27,7 @@ class OpenInterestResource:
         self._base_path = base_path
         self._coin_transform = coin_transform
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     def history(
         self,
@@ -84,14 +71,11 @@ class OpenInterestResource:
         }
         if interval:
             params["interval"] = interval
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/openinterest/{self._coin_transform(coin)}",
             params=params,
         )
-        return CursorResponse(
-            data=[OpenInterest.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, OpenInterest)
 
     async def ahistory(
         self,
@@ -112,14 +96,11 @@ class OpenInterestResource:
         }
         if interval:
             params["interval"] = interval
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"{self._base_path}/openinterest/{self._coin_transform(coin)}",
             params=params,
         )
-        return CursorResponse(
-            data=[OpenInterest.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, OpenInterest)
 
     def current(self, coin: str) -> OpenInterest:
         """
@@ -131,10 +112,14 @@ class OpenInterestResource:
         Returns:
             Current open interest
         """
-        data = self._http.get(f"{self._base_path}/openinterest/{self._coin_transform(coin)}/current")
-        return OpenInterest.model_validate(data["data"])
+        raw = self._http.get_bytes(
+            f"{self._base_path}/openinterest/{self._coin_transform(coin)}/current"
+        )
+        return parse_data(raw, OpenInterest)
 
     async def acurrent(self, coin: str) -> OpenInterest:
         """Async version of current()."""
-        data = await self._http.aget(f"{self._base_path}/openinterest/{self._coin_transform(coin)}/current")
-        return OpenInterest.model_validate(data["data"])
+        raw = await self._http.aget_bytes(
+            f"{self._base_path}/openinterest/{self._coin_transform(coin)}/current"
+        )
+        return parse_data(raw, OpenInterest)
@@ -2,24 +2,183 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import AsyncIterator, Iterator, Optional, Union
+import asyncio
+import threading
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Literal, Optional, Union, cast
 
-from ..http import HttpClient
-from typing import Literal
+from typing_extensions import TypedDict
 
-from ..types import CursorResponse, OrderBook, Timestamp
-from ..orderbook_reconstructor import (
-    OrderBookReconstructor,
-    OrderbookDelta,
-    TickData,
-    ReconstructedOrderBook,
-    ReconstructOptions,
-)
+from .._envelopes import parse_data, parse_page
+from .._timestamp import to_unix_ms
+from ..http import HttpClient
+from ..types import CursorResponse, OrderBook, Timestamp, _Model
+
+if TYPE_CHECKING:
+    from ..orderbook_reconstructor import (
+        OrderBookArray,
+        OrderbookDelta,
+        OrderBookReconstructor,
+        ReconstructedOrderBook,
+        SnapshotArrays,
+        TickData,
+    )
+
+    # String-valued snapshots: these methods never request numeric=True output
+    _Snapshots = list[ReconstructedOrderBook]
+    _SnapshotIterator = Iterator[ReconstructedOrderBook]
+
+# The reconstructor (with sortedcontainers, and msgspec for its tick
+# decoder) is imported on first use, so that `import oxarchive` stays cheap
+# for code that never requests tick data.
+_HAS_MSGSPEC = find_spec("msgspec") is not None
 
 # Lighter orderbook granularity levels (Lighter.xyz only)
 LighterGranularity = Literal["checkpoint", "30s", "10s", "1s", "tick"]
 
+# Bound on the per-resource cache of built coin URLs
+_MAX_CACHED_URLS = 1024
+
+# Deltas returned per tick history request
+_MAX_DELTAS_PER_PAGE = 1000
+
+
+def _fresh_deltas(
+    page: list[OrderbookDelta], cursor: Optional[int], last_sequence: int
+) -> list[OrderbookDelta]:
+    """
+    Drop the leading deltas a page repeats from the previous one.
+
+    Each page restarts at the previous page's last millisecond, so only that
+    overlap is skipped; anything else out of order is passed on for the
+    sequence check to reject.
+    """
+    skip = 0
+    for delta in page:
+        if delta.timestamp != cursor or delta.sequence > last_sequence:
+            break
+        skip += 1
+    return page[skip:] if skip else page
+
+
+def _check_sequence(delta: OrderbookDelta, last_sequence: int) -> None:
+    """Reject a paged delta that arrives out of sequence order."""
+    if delta.sequence < last_sequence:
+        raise ValueError(
+            f"Streamed deltas must be in sequence order "
+            f"(got {delta.sequence} after {last_sequence})"
+        )
+
+
+def _next_cursor(page: list[OrderbookDelta], cursor: Optional[int], end_ts: int) -> Optional[int]:
+    """Start of the next tick history page, or None once the range is exhausted."""
+    if len(page) < _MAX_DELTAS_PER_PAGE:
+        return None
+    last_timestamp = page[-1].timestamp
+    if last_timestamp == cursor:
+        # Restarting at this millisecond again would return the same page,
+        # and skipping it would drop its later deltas
+        raise ValueError(
+            f"More than {_MAX_DELTAS_PER_PAGE} deltas at timestamp "
+            f"{last_timestamp}; cannot paginate past it"
+        )
+    return last_timestamp if last_timestamp < end_ts else None
+
+
+# One schema for the whole delta array: pydantic-core parses, checks and
+# coerces every delta in a single pass over the raw bytes
+class _RawDelta(TypedDict):
+    timestamp: int
+    side: Literal["bid", "ask"]
+    price: float
+    size: float
+    sequence: int
+
+
+class _TickPage(_Model):
+    checkpoint: Optional[OrderBook] = None
+    deltas: list[_RawDelta] = []
+
+
+class _TickEnvelope(_Model):
+    # Lower tiers get a list of plain snapshots, reported as an error by
+    # _tick_data(); malformed tick pages fail validation
+    data: Union[_TickPage, list[Any], None] = None
+    error: Optional[str] = None
+    message: Optional[str] = None
+
+
+def _tick_error(error: Optional[str], message: Optional[str]) -> ValueError:
+    return ValueError(
+        error or message or (
+            "Tick-level orderbook data requires Enterprise tier. "
+            "Upgrade your subscription or use a different granularity."
+        )
+    )
+
+
+def _tick_data_msgspec(raw: bytes) -> TickData:
+    from ..orderbook_reconstructor import (
+        _TICK_DECODER,
+        SIDE_ASK,
+        SIDE_BID,
+        OrderbookDelta,
+        TickData,
+        _MsgTickPage,
+    )
+
+    response = _TICK_DECODER.decode(raw)
+
+    tick_data = response.data
+    if not isinstance(tick_data, _MsgTickPage):
+        raise _tick_error(response.error, response.message)
+    checkpoint = bytes(tick_data.checkpoint)
+    if checkpoint in (b"", b"null"):
+        raise _tick_error(response.error, response.message)
+
+    deltas = [
+        OrderbookDelta(
+            d.timestamp,
+            SIDE_BID if d.side == "bid" else SIDE_ASK,
+            d.price,
+            d.size,
+            d.sequence,
+        )
+        for d in tick_data.deltas
+    ]
+
+    return TickData(checkpoint=OrderBook.model_validate_json(checkpoint), deltas=deltas)
+
+
+def _tick_data(raw: bytes) -> TickData:
+    if _HAS_MSGSPEC:
+        return _tick_data_msgspec(raw)
+
+    from ..orderbook_reconstructor import SIDE_ASK, SIDE_BID, OrderbookDelta, TickData
+
+    response = _TickEnvelope.model_validate_json(raw)
+
+    # Check if tick-level data was returned (nested inside "data" wrapper)
+    tick_data = response.data
+    if not isinstance(tick_data, _TickPage) or tick_data.checkpoint is None:
+        raise _tick_error(response.error, response.message)
+
+    # Fields arrive already coerced, so build deltas with plain positional
+    # __init__ calls (timestamp, side, price, size, sequence); keyword
+    # arguments cost about 1.5x as much at hundreds of thousands of deltas.
+    deltas = [
+        OrderbookDelta(
+            d["timestamp"],
+            SIDE_BID if d["side"] == "bid" else SIDE_ASK,
+            d["price"],
+            d["size"],
+            d["sequence"],
+        )
+        for d in tick_data.deltas
+    ]
+
+    return TickData(checkpoint=tick_data.checkpoint, deltas=deltas)
+
 
 class OrderBookResource:
     """
@@ -43,23 +202,37 @@ class OrderBookResource:
         self._http = http
         self._base_path = base_path
         self._coin_transform = coin_transform
+        self._urls: dict[str, tuple[str, str]] = {}
+        self._local = threading.local()
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            # Try parsing ISO format
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
+
+    def _get_reconstructor(self) -> OrderBookReconstructor:
+        """
+        Per-thread reconstructor reused by the list-returning methods.
+
+        ``reconstruct_all()`` re-initializes it from the checkpoint, and runs
+        to completion without yielding, so one instance per thread is enough.
+        The iterators keep their own, as several may be consumed interleaved.
+        """
+        reconstructor: Optional[OrderBookReconstructor] = getattr(
+            self._local, "reconstructor", None
+        )
+        if reconstructor is None:
+            from ..orderbook_reconstructor import OrderBookReconstructor
+
+            reconstructor = self._local.reconstructor = OrderBookReconstructor()
+        return reconstructor
+
+    def _urls_for(self, coin: str) -> tuple[str, str]:
+        """(snapshot URL, history URL) for a coin, cached by raw input."""
+        urls = self._urls.get(coin)
+        if urls is None:
+            if len(self._urls) >= _MAX_CACHED_URLS:
+                self._urls.clear()
+            snapshot_url = f"{self._base_path}/orderbook/{self._coin_transform(coin)}"
+            urls = self._urls[coin] = (snapshot_url, f"{snapshot_url}/history")
+        return urls
 
     def get(
         self,
@@ -79,14 +252,14 @@ class OrderBookResource:
         Returns:
             Order book snapshot
         """
-        data = self._http.get(
-            f"{self._base_path}/orderbook/{self._coin_transform(coin)}",
+        raw = self._http.get_bytes(
+            self._urls_for(coin)[0],
             params={
                 "timestamp": self._convert_timestamp(timestamp),
                 "depth": depth,
             },
         )
-        return OrderBook.model_validate(data["data"])
+        return parse_data(raw, OrderBook)
 
     async def aget(
         self,
@@ -96,14 +269,71 @@ class OrderBookResource:
         depth: Optional[int] = None,
     ) -> OrderBook:
         """Async version of get()."""
-        data = await self._http.aget(
-            f"{self._base_path}/orderbook/{self._coin_transform(coin)}",
+        raw = await self._http.aget_bytes(
+            self._urls_for(coin)[0],
+            params={
+                "timestamp": self._convert_timestamp(timestamp),
+                "depth": depth,
+            },
+        )
+        return parse_data(raw, OrderBook)
+
+    def get_array(
+        self,
+        coin: str,
+        *,
+        price_decimals: int,
+        size_decimals: int,
+        timestamp: Optional[Timestamp] = None,
+        depth: Optional[int] = None,
+    ) -> OrderBookArray:
+        """
+        Get an order book snapshot as scaled integer NumPy arrays.
+
+        Decodes the response body directly into an OrderBookArray (see
+        ``OrderBookArray.from_json``). Requires numpy.
+
+        Args:
+            coin: The coin symbol (e.g., 'BTC', 'ETH')
+            price_decimals: Decimal places kept in the scaled prices
+            size_decimals: Decimal places kept in the scaled sizes
+            timestamp: Optional timestamp to get historical snapshot
+            depth: Number of price levels to return per side
+
+        Returns:
+            Order book snapshot as an OrderBookArray
+        """
+        from ..orderbook_reconstructor import OrderBookArray
+
+        raw = self._http.get_bytes(
+            self._urls_for(coin)[0],
             params={
                 "timestamp": self._convert_timestamp(timestamp),
                 "depth": depth,
             },
         )
-        return OrderBook.model_validate(data["data"])
+        return OrderBookArray.from_json(raw, price_decimals, size_decimals)
+
+    async def aget_array(
+        self,
+        coin: str,
+        *,
+        price_decimals: int,
+        size_decimals: int,
+        timestamp: Optional[Timestamp] = None,
+        depth: Optional[int] = None,
+    ) -> OrderBookArray:
+        """Async version of get_array()."""
+        from ..orderbook_reconstructor import OrderBookArray
+
+        raw = await self._http.aget_bytes(
+            self._urls_for(coin)[0],
+            params={
+                "timestamp": self._convert_timestamp(timestamp),
+                "depth": depth,
+            },
+        )
+        return OrderBookArray.from_json(raw, price_decimals, size_decimals)
 
     def history(
         self,
@@ -147,8 +377,8 @@ class OrderBookResource:
             ...     "BTC", start=start, end=end, granularity="10s"
             ... )
         """
-        data = self._http.get(
-            f"{self._base_path}/orderbook/{self._coin_transform(coin)}/history",
+        raw = self._http.get_bytes(
+            self._urls_for(coin)[1],
             params={
                 "start": self._convert_timestamp(start),
                 "end": self._convert_timestamp(end),
@@ -158,10 +388,7 @@ class OrderBookResource:
                 "granularity": granularity,
             },
         )
-        return CursorResponse(
-            data=[OrderBook.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, OrderBook)
 
     async def ahistory(
         self,
@@ -175,8 +402,8 @@ class OrderBookResource:
         granularity: Optional[LighterGranularity] = None,
     ) -> CursorResponse[list[OrderBook]]:
         """Async version of history(). start and end are required. See history() for granularity details."""
-        data = await self._http.aget(
-            f"{self._base_path}/orderbook/{self._coin_transform(coin)}/history",
+        raw = await self._http.aget_bytes(
+            self._urls_for(coin)[1],
             params={
                 "start": self._convert_timestamp(start),
                 "end": self._convert_timestamp(end),
@@ -186,11 +413,118 @@ class OrderBookResource:
                 "granularity": granularity,
             },
         )
-        return CursorResponse(
-            data=[OrderBook.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
+        return parse_page(raw, OrderBook)
+
+    def history_all(
+        self,
+        coin: str,
+        *,
+        start: Timestamp,
+        end: Timestamp,
+        limit: int = 1000,
+        depth: Optional[int] = None,
+        granularity: Optional[LighterGranularity] = None,
+        concurrency: int = 8,
+    ) -> list[OrderBook]:
+        """
+        Get every order book snapshot in a time range, fetching sub-ranges concurrently.
+
+        Sync wrapper around ahistory_all(), run on the client's background
+        event loop.
+
+        Example:
+            >>> snapshots = client.hyperliquid.orderbook.history_all(
+            ...     "BTC", start="2024-01-01", end="2024-01-08", concurrency=8
+            ... )
+        """
+        [snapshots] = self._http.run_sync(
+            self.ahistory_all(
+                coin,
+                start=start,
+                end=end,
+                limit=limit,
+                depth=depth,
+                granularity=granularity,
+                concurrency=concurrency,
+            )
+        )
+        return snapshots
+
+    async def ahistory_all(
+        self,
+        coin: str,
+        *,
+        start: Timestamp,
+        end: Timestamp,
+        limit: int = 1000,
+        depth: Optional[int] = None,
+        granularity: Optional[LighterGranularity] = None,
+        concurrency: int = 8,
+    ) -> list[OrderBook]:
+        """
+        Async version of history_all().
+
+        Splits [start, end] into ``concurrency`` equal sub-ranges and pages
+        through them concurrently over the shared connection pool, instead
+        of following next_cursor one round trip at a time. Results are
+        returned in timestamp order, without the duplicates that adjacent
+        sub-ranges share at their boundary.
+
+        Args:
+            coin: The coin symbol (e.g., 'BTC', 'ETH')
+            start: Start timestamp (required)
+            end: End timestamp (required)
+            limit: Page size for each request (max: 1000)
+            depth: Number of price levels per side
+            granularity: Data resolution for Lighter orderbook (see history())
+            concurrency: Number of sub-ranges fetched at the same time
+
+        Returns:
+            All order book snapshots in the range
+        """
+        start_ts = self._convert_timestamp(start)
+        end_ts = self._convert_timestamp(end)
+        if start_ts is None or end_ts is None:
+            raise ValueError("start and end timestamps are required")
+
+        parts = max(1, min(concurrency, end_ts - start_ts))
+        bounds = [start_ts + (end_ts - start_ts) * i // parts for i in range(parts + 1)]
+
+        async def fetch_range(range_start: int, range_end: int) -> list[OrderBook]:
+            snapshots: list[OrderBook] = []
+            cursor: Optional[str] = None
+            while True:
+                result = await self.ahistory(
+                    coin,
+                    start=range_start,
+                    end=range_end,
+                    cursor=cursor,
+                    limit=limit,
+                    depth=depth,
+                    granularity=granularity,
+                )
+                snapshots.extend(result.data)
+                cursor = result.next_cursor
+                if not cursor or not result.data:
+                    return snapshots
+
+        ranges = await asyncio.gather(
+            *(fetch_range(bounds[i], bounds[i + 1]) for i in range(parts))
         )
 
+        # Sub-ranges are in order and adjacent ones share a boundary, so only
+        # the leading snapshots the previous range already returned are
+        # dropped; equal timestamps inside a range are all kept
+        snapshots: list[OrderBook] = []
+        for range_snapshots in ranges:
+            skip = 0
+            if snapshots:
+                seam = snapshots[-1].timestamp
+                while skip < len(range_snapshots) and range_snapshots[skip].timestamp <= seam:
+                    skip += 1
+            snapshots.extend(range_snapshots[skip:])
+        return snapshots
+
     def history_tick(
         self,
         coin: str,
@@ -231,8 +565,8 @@ class OrderBookResource:
             ...     # delta: OrderbookDelta with timestamp, side, price, size, sequence
             ...     pass
         """
-        response = self._http.get(
-            f"{self._base_path}/orderbook/{self._coin_transform(coin)}/history",
+        raw = self._http.get_bytes(
+            self._urls_for(coin)[1],
             params={
                 "start": self._convert_timestamp(start),
                 "end": self._convert_timestamp(end),
@@ -240,29 +574,7 @@ class OrderBookResource:
                 "granularity": "tick",
             },
         )
-
-        # Check if tick-level data was returned (nested inside "data" wrapper)
-        tick_data = response.get("data", {})
-        if not isinstance(tick_data, dict) or "checkpoint" not in tick_data or tick_data.get("checkpoint") is None:
-            error_msg = response.get("error") or response.get("message") or (
-                "Tick-level orderbook data requires Enterprise tier. "
-                "Upgrade your subscription or use a different granularity."
-            )
-            raise ValueError(error_msg)
-
-        checkpoint = OrderBook.model_validate(tick_data["checkpoint"])
-        deltas = [
-            OrderbookDelta(
-                timestamp=d["timestamp"],
-                side=d["side"],
-                price=float(d["price"]),
-                size=float(d["size"]),
-                sequence=d["sequence"],
-            )
-            for d in tick_data.get("deltas", [])
-        ]
-
-        return TickData(checkpoint=checkpoint, deltas=deltas)
+        return _tick_data(raw)
 
     async def ahistory_tick(
         self,
@@ -273,8 +585,8 @@ class OrderBookResource:
         depth: Optional[int] = None,
     ) -> TickData:
         """Async version of history_tick(). See history_tick() for details."""
-        response = await self._http.aget(
-            f"{self._base_path}/orderbook/{self._coin_transform(coin)}/history",
+        raw = await self._http.aget_bytes(
+            self._urls_for(coin)[1],
             params={
                 "start": self._convert_timestamp(start),
                 "end": self._convert_timestamp(end),
@@ -282,29 +594,7 @@ class OrderBookResource:
                 "granularity": "tick",
             },
         )
-
-        # Check if tick-level data was returned (nested inside "data" wrapper)
-        tick_data = response.get("data", {})
-        if not isinstance(tick_data, dict) or "checkpoint" not in tick_data or tick_data.get("checkpoint") is None:
-            error_msg = response.get("error") or response.get("message") or (
-                "Tick-level orderbook data requires Enterprise tier. "
-                "Upgrade your subscription or use a different granularity."
-            )
-            raise ValueError(error_msg)
-
-        checkpoint = OrderBook.model_validate(tick_data["checkpoint"])
-        deltas = [
-            OrderbookDelta(
-                timestamp=d["timestamp"],
-                side=d["side"],
-                price=float(d["price"]),
-                size=float(d["size"]),
-                sequence=d["sequence"],
-            )
-            for d in tick_data.get("deltas", [])
-        ]
-
-        return TickData(checkpoint=checkpoint, deltas=deltas)
+        return _tick_data(raw)
 
     def history_reconstructed(
         self,
@@ -321,8 +611,10 @@ class OrderBookResource:
         Fetches raw tick data and reconstructs full orderbook state at each delta.
         All reconstruction happens client-side for optimal server performance.
 
-        For large time ranges, consider using `history_tick()` with the
-        `OrderBookReconstructor.iterate()` method for memory efficiency.
+        Covers a single page (at most 1,000 deltas). Memory is dominated by the
+        returned snapshots, not the deltas; for large time ranges stream pages
+        with `history_tick_stream()` into `OrderBookReconstructor.iterate()` or
+        `reconstruct_final()` instead.
 
         Args:
             coin: The coin symbol (e.g., 'BTC', 'ETH')
@@ -350,10 +642,15 @@ class OrderBookResource:
             ...     "BTC", start=start, end=end, emit_all=False
             ... )
         """
+        from ..orderbook_reconstructor import ReconstructOptions
+
         tick_data = self.history_tick(coin, start=start, end=end, depth=depth)
-        reconstructor = OrderBookReconstructor()
+        reconstructor = self._get_reconstructor()
         options = ReconstructOptions(depth=depth, emit_all=emit_all)
-        return reconstructor.reconstruct_all(tick_data.checkpoint, tick_data.deltas, options)
+        return cast(
+            "_Snapshots",
+            reconstructor.reconstruct_all(tick_data.checkpoint, tick_data.deltas, options),
+        )
 
     async def ahistory_reconstructed(
         self,
@@ -365,10 +662,65 @@ class OrderBookResource:
         emit_all: bool = True,
     ) -> list[ReconstructedOrderBook]:
         """Async version of history_reconstructed(). See history_reconstructed() for details."""
+        from ..orderbook_reconstructor import ReconstructOptions
+
         tick_data = await self.ahistory_tick(coin, start=start, end=end, depth=depth)
-        reconstructor = OrderBookReconstructor()
+        reconstructor = self._get_reconstructor()
         options = ReconstructOptions(depth=depth, emit_all=emit_all)
-        return reconstructor.reconstruct_all(tick_data.checkpoint, tick_data.deltas, options)
+        return cast(
+            "_Snapshots",
+            reconstructor.reconstruct_all(tick_data.checkpoint, tick_data.deltas, options),
+        )
+
+    def history_reconstructed_arrays(
+        self,
+        coin: str,
+        *,
+        start: Timestamp,
+        end: Timestamp,
+        depth: int = 10,
+    ) -> SnapshotArrays:
+        """
+        Get reconstructed orderbook states as NumPy arrays.
+
+        Fetches one page of tick data (at most 1,000 deltas) like
+        `history_reconstructed()`, but returns every state as rows of
+        ``(states, depth)`` price/size arrays instead of one object per
+        state. Requires numpy (``pip install oxarchive[fast]``).
+
+        Args:
+            coin: The coin symbol (e.g., 'BTC', 'ETH')
+            start: Start timestamp (required)
+            end: End timestamp (required)
+            depth: Price levels per side to include
+
+        Returns:
+            SnapshotArrays with timestamp, sequence and bid/ask px/sz arrays
+
+        Example:
+            >>> states = client.lighter.orderbook.history_reconstructed_arrays(
+            ...     "BTC", start=start, end=end, depth=5
+            ... )
+            >>> spread = states.ask_px[:, 0] - states.bid_px[:, 0]
+        """
+        tick_data = self.history_tick(coin, start=start, end=end, depth=depth)
+        return self._get_reconstructor().reconstruct_all_arrays(
+            tick_data.checkpoint, tick_data.deltas, depth
+        )
+
+    async def ahistory_reconstructed_arrays(
+        self,
+        coin: str,
+        *,
+        start: Timestamp,
+        end: Timestamp,
+        depth: int = 10,
+    ) -> SnapshotArrays:
+        """Async version of history_reconstructed_arrays()."""
+        tick_data = await self.ahistory_tick(coin, start=start, end=end, depth=depth)
+        return self._get_reconstructor().reconstruct_all_arrays(
+            tick_data.checkpoint, tick_data.deltas, depth
+        )
 
     def iterate_reconstructed(
         self,
@@ -381,8 +733,10 @@ class OrderBookResource:
         """
         Iterate over reconstructed orderbook states (memory-efficient).
 
-        Fetches tick data and yields snapshots one at a time.
-        Use this for large time ranges to avoid loading all snapshots into memory.
+        Fetches one page of tick data (at most 1,000 deltas) and yields
+        snapshots one at a time instead of building them all up front. Use
+        `iterate_tick_history()` or `history_tick_stream()` for ranges that
+        span several pages.
 
         Args:
             coin: The coin symbol (e.g., 'BTC', 'ETH')
@@ -401,17 +755,25 @@ class OrderBookResource:
             ...     if some_condition:
             ...         break  # Early exit if needed
         """
+        from ..orderbook_reconstructor import OrderBookReconstructor
+
         tick_data = self.history_tick(coin, start=start, end=end, depth=depth)
         reconstructor = OrderBookReconstructor()
-        yield from reconstructor.iterate(tick_data.checkpoint, tick_data.deltas, depth)
+        yield from cast(
+            "_SnapshotIterator",
+            reconstructor.iterate(tick_data.checkpoint, tick_data.deltas, depth),
+        )
 
-    def create_reconstructor(self) -> OrderBookReconstructor:
+    def create_reconstructor(self, tick_size: Optional[float] = None) -> OrderBookReconstructor:
         """
         Create a reconstructor for streaming tick-level data.
 
         Returns an OrderBookReconstructor instance that you can use
         to process tick data incrementally or with custom logic.
 
+        Args:
+            tick_size: Optional price tick; prices are snapped onto this grid
+
         Returns:
             A new OrderBookReconstructor instance
 
@@ -430,7 +792,9 @@ class OrderBookResource:
             >>> if gaps:
             ...     print("Sequence gaps detected:", gaps)
         """
-        return OrderBookReconstructor()
+        from ..orderbook_reconstructor import OrderBookReconstructor
+
+        return OrderBookReconstructor(tick_size=tick_size)
 
     def iterate_tick_history(
         self,
@@ -472,44 +836,73 @@ class OrderBookResource:
             ...     "BTC", start=start, end=end
             ... ))
         """
+        from ..orderbook_reconstructor import OrderBookReconstructor
+
         start_ts = self._convert_timestamp(start)
         end_ts = self._convert_timestamp(end)
         if start_ts is None or end_ts is None:
             raise ValueError("start and end timestamps are required")
 
-        cursor = start_ts
+        checkpoint, deltas = self.history_tick_stream(coin, start=start_ts, end=end_ts, depth=depth)
         reconstructor = OrderBookReconstructor()
-        max_deltas_per_page = 1000
-        is_first_page = True
+        yield from cast("_SnapshotIterator", reconstructor.iterate(checkpoint, deltas, depth))
+
+    def history_tick_stream(
+        self,
+        coin: str,
+        *,
+        start: Timestamp,
+        end: Timestamp,
+        depth: Optional[int] = None,
+    ) -> tuple[OrderBook, Iterator[OrderbookDelta]]:
+        """
+        Stream tick-level deltas across pages without holding them all (Enterprise tier only).
 
-        while cursor < end_ts:
-            tick_data = self.history_tick(coin, start=cursor, end=end_ts, depth=depth)
+        Fetches the first page immediately to obtain the starting checkpoint,
+        then returns a lazy iterator that yields deltas in sequence order,
+        fetching further pages (up to 1,000 deltas each) as it is consumed.
+        Feed both into `OrderBookReconstructor.reconstruct_final()` or
+        `iterate()` to reconstruct multi-day ranges in bounded memory.
 
-            if len(tick_data.deltas) == 0:
-                # No deltas - yield checkpoint only on first page if no data
-                if is_first_page:
-                    reconstructor.initialize(tick_data.checkpoint)
-                    yield reconstructor.get_snapshot(depth)
-                break
+        Args:
+            coin: The coin symbol (e.g., 'BTC', 'ETH')
+            start: Start timestamp (required)
+            end: End timestamp (required)
+            depth: Number of price levels in the checkpoint
 
-            # Yield each reconstructed snapshot
-            # Skip initial checkpoint on subsequent pages to avoid duplicates
-            skip_first = not is_first_page
-            for snapshot in reconstructor.iterate(tick_data.checkpoint, tick_data.deltas, depth):
-                if skip_first:
-                    skip_first = False
-                    continue
-                yield snapshot
+        Returns:
+            Tuple of (checkpoint, delta iterator)
 
-            is_first_page = False
+        Example:
+            >>> checkpoint, deltas = client.lighter.orderbook.history_tick_stream(
+            ...     "BTC", start=start, end=end
+            ... )
+            >>> final = OrderBookReconstructor().reconstruct_final(checkpoint, deltas)
+        """
+        start_ts = self._convert_timestamp(start)
+        end_ts = self._convert_timestamp(end)
+        if start_ts is None or end_ts is None:
+            raise ValueError("start and end timestamps are required")
 
-            # Move cursor past the last delta
-            last_delta = tick_data.deltas[-1]
-            cursor = last_delta.timestamp + 1
+        first_page = self.history_tick(coin, start=start_ts, end=end_ts, depth=depth)
 
-            # If we got fewer than max deltas, we've reached the end
-            if len(tick_data.deltas) < max_deltas_per_page:
-                break
+        def deltas() -> Iterator[OrderbookDelta]:
+            tick_data = first_page
+            last_sequence = -1
+            cursor: Optional[int] = None
+
+            while True:
+                for delta in _fresh_deltas(tick_data.deltas, cursor, last_sequence):
+                    _check_sequence(delta, last_sequence)
+                    last_sequence = delta.sequence
+                    yield delta
+
+                cursor = _next_cursor(tick_data.deltas, cursor, end_ts)
+                if cursor is None:
+                    break
+                tick_data = self.history_tick(coin, start=cursor, end=end_ts, depth=depth)
+
+        return first_page.checkpoint, deltas()
 
     async def aiterate_tick_history(
         self,
@@ -546,41 +939,29 @@ class OrderBookResource:
             ...     if some_condition:
             ...         break  # Early exit supported
         """
+        from ..orderbook_reconstructor import OrderBookReconstructor
+
         start_ts = self._convert_timestamp(start)
         end_ts = self._convert_timestamp(end)
         if start_ts is None or end_ts is None:
             raise ValueError("start and end timestamps are required")
 
-        cursor = start_ts
+        tick_data = await self.ahistory_tick(coin, start=start_ts, end=end_ts, depth=depth)
         reconstructor = OrderBookReconstructor()
-        max_deltas_per_page = 1000
-        is_first_page = True
-
-        while cursor < end_ts:
-            tick_data = await self.ahistory_tick(coin, start=cursor, end=end_ts, depth=depth)
-
-            if len(tick_data.deltas) == 0:
-                # No deltas - yield checkpoint only on first page if no data
-                if is_first_page:
-                    reconstructor.initialize(tick_data.checkpoint)
-                    yield reconstructor.get_snapshot(depth)
-                break
-
-            # Yield each reconstructed snapshot
-            # Skip initial checkpoint on subsequent pages to avoid duplicates
-            skip_first = not is_first_page
-            for snapshot in reconstructor.iterate(tick_data.checkpoint, tick_data.deltas, depth):
-                if skip_first:
-                    skip_first = False
-                    continue
-                yield snapshot
-
-            is_first_page = False
-
-            # Move cursor past the last delta
-            last_delta = tick_data.deltas[-1]
-            cursor = last_delta.timestamp + 1
-
-            # If we got fewer than max deltas, we've reached the end
-            if len(tick_data.deltas) < max_deltas_per_page:
+        reconstructor.initialize(tick_data.checkpoint)
+        yield cast("ReconstructedOrderBook", reconstructor.get_snapshot(depth))
+
+        # Same paging as history_tick_stream(), applied to one continuous book
+        last_sequence = -1
+        cursor: Optional[int] = None
+        while True:
+            for delta in _fresh_deltas(tick_data.deltas, cursor, last_sequence):
+                _check_sequence(delta, last_sequence)
+                last_sequence = delta.sequence
+                reconstructor.apply_delta(delta)
+                yield cast("ReconstructedOrderBook", reconstructor.get_snapshot(depth))
+
+            cursor = _next_cursor(tick_data.deltas, cursor, end_ts)
+            if cursor is None:
                 break
+            tick_data = await self.ahistory_tick(coin, start=cursor, end=end_ts, depth=depth)
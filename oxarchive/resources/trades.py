@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Literal, Optional
 
+from .._envelopes import parse_list, parse_page
+from .._timestamp import to_unix_ms
 from ..http import HttpClient
 from ..types import CursorResponse, Trade, Timestamp
 
@@ -32,21 +33,7 @@ class TradesResource:
         self._base_path = base_path
         self._coin_transform = coin_transform
 
-    def _convert_timestamp(self, ts: Optional[Timestamp]) -> Optional[int]:
-        """Convert timestamp to Unix milliseconds."""
-        if ts is None:
-            return None
-        if isinstance(ts, int):
-            return ts
-        if isinstance(ts, datetime):
-            return int(ts.timestamp() * 1000)
-        if isinstance(ts, str):
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                return int(dt.timestamp() * 1000)
-            except ValueError:
-                return int(ts)
-        return None
+    _convert_timestamp = staticmethod(to_unix_ms)
 
     def list(
         self,
@@ -87,7 +74,7 @@ class TradesResource:
             ...     )
             ...     trades.extend(result.data)
         """
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/trades/{self._coin_transform(coin)}",
             params={
                 "start": self._convert_timestamp(start),
@@ -97,10 +84,7 @@ class TradesResource:
                 "side": side,
             },
         )
-        return CursorResponse(
-            data=[Trade.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, Trade)
 
     async def alist(
         self,
@@ -117,7 +101,7 @@ class TradesResource:
 
         Uses cursor-based pagination by default.
         """
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"{self._base_path}/trades/{self._coin_transform(coin)}",
             params={
                 "start": self._convert_timestamp(start),
@@ -127,10 +111,7 @@ class TradesResource:
                 "side": side,
             },
         )
-        return CursorResponse(
-            data=[Trade.model_validate(item) for item in data["data"]],
-            next_cursor=data.get("meta", {}).get("next_cursor"),
-        )
+        return parse_page(raw, Trade)
 
     def recent(self, coin: str, limit: Optional[int] = None) -> list[Trade]:
         """
@@ -148,16 +129,16 @@ class TradesResource:
         Returns:
             List of recent trades
         """
-        data = self._http.get(
+        raw = self._http.get_bytes(
             f"{self._base_path}/trades/{self._coin_transform(coin)}/recent",
             params={"limit": limit},
         )
-        return [Trade.model_validate(item) for item in data["data"]]
+        return parse_list(raw, Trade)
 
     async def arecent(self, coin: str, limit: Optional[int] = None) -> list[Trade]:
         """Async version of recent()."""
-        data = await self._http.aget(
+        raw = await self._http.aget_bytes(
             f"{self._base_path}/trades/{self._coin_transform(coin)}/recent",
             params={"limit": limit},
         )
-        return [Trade.model_validate(item) for item in data["data"]]
+        return parse_list(raw, Trade)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from ..http import HttpClient
+from ..http import HttpClient, _json_dumps, _json_loads
 from ..types import (
     OxArchiveError,
     SiweChallenge,
@@ -129,9 +129,9 @@ class Web3Resource:
             Payment details (amount, asset, network, pay-to address).
         """
         response = self._http.client.post(
-            "/v1/web3/subscribe", json={"tier": tier}
+            "/v1/web3/subscribe", content=_json_dumps({"tier": tier})
         )
-        data = response.json()
+        data = _json_loads(response.content)
         if response.status_code == 402:
             return Web3PaymentRequired(**data.get("payment", data))
         raise OxArchiveError(
@@ -142,9 +142,9 @@ class Web3Resource:
     async def asubscribe_quote(self, tier: str) -> Web3PaymentRequired:
         """Async version of :meth:`subscribe_quote`."""
         response = await self._http.async_client.post(
-            "/v1/web3/subscribe", json={"tier": tier}
+            "/v1/web3/subscribe", content=_json_dumps({"tier": tier})
         )
-        data = response.json()
+        data = _json_loads(response.content)
         if response.status_code == 402:
             return Web3PaymentRequired(**data.get("payment", data))
         raise OxArchiveError(
@@ -167,10 +167,10 @@ class Web3Resource:
         """
         response = self._http.client.post(
             "/v1/web3/subscribe",
-            json={"tier": tier},
+            content=_json_dumps({"tier": tier}),
             headers={"payment-signature": payment_signature},
         )
-        data = response.json()
+        data = _json_loads(response.content)
         if not response.is_success:
             raise OxArchiveError(
                 data.get("error", "Subscribe failed"), response.status_code
@@ -181,10 +181,10 @@ class Web3Resource:
         """Async version of :meth:`subscribe`."""
         response = await self._http.async_client.post(
             "/v1/web3/subscribe",
-            json={"tier": tier},
+            content=_json_dumps({"tier": tier}),
             headers={"payment-signature": payment_signature},
         )
-        data = response.json()
+        data = _json_loads(response.content)
         if not response.is_success:
             raise OxArchiveError(
                 data.get("error", "Subscribe failed"), response.status_code
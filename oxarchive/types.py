@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Generic, Literal, Optional, TypeVar, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # =============================================================================
@@ -15,7 +15,18 @@ from pydantic import BaseModel, Field
 T = TypeVar("T")
 
 
-class ApiMeta(BaseModel):
+# Build core schemas on first validation instead of at definition time, so
+# importing the SDK does not pay for models and adapters a program never uses
+_DEFER_BUILD = ConfigDict(defer_build=True)
+
+
+class _Model(BaseModel):
+    """Base for the SDK's response models."""
+
+    model_config = _DEFER_BUILD
+
+
+class ApiMeta(_Model):
     """Response metadata."""
 
     count: int
@@ -23,7 +34,7 @@ class ApiMeta(BaseModel):
     request_id: str
 
 
-class ApiResponse(BaseModel, Generic[T]):
+class ApiResponse(_Model, Generic[T]):
     """Standard API response wrapper."""
 
     success: bool
@@ -36,7 +47,7 @@ class ApiResponse(BaseModel, Generic[T]):
 # =============================================================================
 
 
-class PriceLevel(BaseModel):
+class PriceLevel(_Model):
     """Single price level in the order book."""
 
     px: str
@@ -49,7 +60,7 @@ class PriceLevel(BaseModel):
     """Number of orders at this level."""
 
 
-class OrderBook(BaseModel):
+class OrderBook(_Model):
     """L2 order book snapshot."""
 
     coin: str
@@ -79,7 +90,7 @@ class OrderBook(BaseModel):
 # =============================================================================
 
 
-class Trade(BaseModel):
+class Trade(_Model):
     """Trade/fill record with full execution details."""
 
     coin: str
@@ -139,7 +150,7 @@ class Trade(BaseModel):
 # =============================================================================
 
 
-class Instrument(BaseModel):
+class Instrument(_Model):
     """Trading instrument specification (Hyperliquid)."""
 
     name: str
@@ -161,7 +172,7 @@ class Instrument(BaseModel):
     """Whether the instrument is currently tradeable."""
 
 
-class Hip3Instrument(BaseModel):
+class Hip3Instrument(_Model):
     """HIP-3 Builder Perps instrument with latest market data.
 
     Derived from live open interest data. Useful for discovering
@@ -190,7 +201,7 @@ class Hip3Instrument(BaseModel):
     """Timestamp of latest data point."""
 
 
-class LighterInstrument(BaseModel):
+class LighterInstrument(_Model):
     """Trading instrument specification (Lighter.xyz).
 
     Lighter instruments have a different schema than Hyperliquid with more
@@ -242,7 +253,7 @@ class LighterInstrument(BaseModel):
 # =============================================================================
 
 
-class FundingRate(BaseModel):
+class FundingRate(_Model):
     """Funding rate record."""
 
     coin: str
@@ -263,7 +274,7 @@ class FundingRate(BaseModel):
 # =============================================================================
 
 
-class OpenInterest(BaseModel):
+class OpenInterest(_Model):
     """Open interest snapshot with market context."""
 
     coin: str
@@ -302,7 +313,7 @@ class OpenInterest(BaseModel):
 # =============================================================================
 
 
-class Liquidation(BaseModel):
+class Liquidation(_Model):
     """Liquidation event record."""
 
     coin: str
@@ -347,7 +358,7 @@ class Liquidation(BaseModel):
 # =============================================================================
 
 
-class LiquidationVolume(BaseModel):
+class LiquidationVolume(_Model):
     """Pre-aggregated liquidation volume bucket."""
 
     coin: str
@@ -380,7 +391,7 @@ class LiquidationVolume(BaseModel):
 # =============================================================================
 
 
-class DataTypeFreshness(BaseModel):
+class DataTypeFreshness(_Model):
     """Freshness data for a single data type."""
 
     last_updated: Optional[datetime] = None
@@ -390,7 +401,7 @@ class DataTypeFreshness(BaseModel):
     """Lag in milliseconds from real-time."""
 
 
-class CoinFreshness(BaseModel):
+class CoinFreshness(_Model):
     """Per-coin freshness across all data types."""
 
     coin: str
@@ -423,7 +434,7 @@ class CoinFreshness(BaseModel):
 # =============================================================================
 
 
-class CoinSummary(BaseModel):
+class CoinSummary(_Model):
     """Combined market summary for a coin."""
 
     coin: str
@@ -463,7 +474,7 @@ class CoinSummary(BaseModel):
     """24-hour short liquidation volume in USD."""
 
 
-class PriceSnapshot(BaseModel):
+class PriceSnapshot(_Model):
     """Mark/oracle price at a point in time."""
 
     timestamp: datetime
@@ -488,7 +499,7 @@ CandleInterval = Literal["1m", "5m", "15m", "30m", "1h", "4h", "1d", "1w"]
 """Candle interval for OHLCV data."""
 
 
-class Candle(BaseModel):
+class Candle(_Model):
     """OHLCV candle data."""
 
     timestamp: datetime
@@ -541,7 +552,7 @@ WsConnectionState = Literal["connecting", "connected", "disconnected", "reconnec
 """WebSocket connection state."""
 
 
-class WsSubscribed(BaseModel):
+class WsSubscribed(_Model):
     """Subscription confirmed from server."""
 
     type: Literal["subscribed"]
@@ -549,7 +560,7 @@ class WsSubscribed(BaseModel):
     coin: Optional[str] = None
 
 
-class WsUnsubscribed(BaseModel):
+class WsUnsubscribed(_Model):
     """Unsubscription confirmed from server."""
 
     type: Literal["unsubscribed"]
@@ -557,20 +568,20 @@ class WsUnsubscribed(BaseModel):
     coin: Optional[str] = None
 
 
-class WsPong(BaseModel):
+class WsPong(_Model):
     """Pong response from server."""
 
     type: Literal["pong"]
 
 
-class WsError(BaseModel):
+class WsError(_Model):
     """Error from server."""
 
     type: Literal["error"]
     message: str
 
 
-class WsData(BaseModel):
+class WsData(_Model):
     """Real-time data message from server.
 
     Note: The `data` field can be either a dict (for orderbook) or a list (for trades).
@@ -589,7 +600,7 @@ class WsData(BaseModel):
 # =============================================================================
 
 
-class WsReplayStarted(BaseModel):
+class WsReplayStarted(_Model):
     """Replay started response.
 
     In single-channel mode, ``channel`` is set to the replayed channel.
@@ -611,21 +622,21 @@ class WsReplayStarted(BaseModel):
     """Playback speed multiplier."""
 
 
-class WsReplayPaused(BaseModel):
+class WsReplayPaused(_Model):
     """Replay paused response."""
 
     type: Literal["replay_paused"]
     current_timestamp: int
 
 
-class WsReplayResumed(BaseModel):
+class WsReplayResumed(_Model):
     """Replay resumed response."""
 
     type: Literal["replay_resumed"]
     current_timestamp: int
 
 
-class WsReplayCompleted(BaseModel):
+class WsReplayCompleted(_Model):
     """Replay completed response.
 
     In multi-channel mode, ``channels`` lists all channels that were replayed.
@@ -640,13 +651,13 @@ class WsReplayCompleted(BaseModel):
     snapshots_sent: int
 
 
-class WsReplayStopped(BaseModel):
+class WsReplayStopped(_Model):
     """Replay stopped response."""
 
     type: Literal["replay_stopped"]
 
 
-class WsHistoricalData(BaseModel):
+class WsHistoricalData(_Model):
     """Historical data point (replay mode)."""
 
     type: Literal["historical_data"]
@@ -656,7 +667,7 @@ class WsHistoricalData(BaseModel):
     data: dict[str, Any]
 
 
-class WsReplaySnapshot(BaseModel):
+class WsReplaySnapshot(_Model):
     """Initial state snapshot for a channel in multi-channel replay.
 
     Before the timeline starts, the server sends a replay_snapshot for each
@@ -674,7 +685,7 @@ class WsReplaySnapshot(BaseModel):
     """Initial state data for this channel."""
 
 
-class OrderbookDelta(BaseModel):
+class OrderbookDelta(_Model):
     """Orderbook delta for tick-level data."""
 
     timestamp: int
@@ -693,7 +704,7 @@ class OrderbookDelta(BaseModel):
     """Sequence number for ordering."""
 
 
-class WsHistoricalTickData(BaseModel):
+class WsHistoricalTickData(_Model):
     """Historical tick data (granularity='tick' mode) - checkpoint + deltas.
 
     This message type is sent when using granularity='tick' for Lighter.xyz
@@ -714,7 +725,7 @@ class WsHistoricalTickData(BaseModel):
 # =============================================================================
 
 
-class WsStreamStarted(BaseModel):
+class WsStreamStarted(_Model):
     """Stream started response.
 
     In multi-channel mode, ``channels`` lists all channels being streamed.
@@ -732,21 +743,21 @@ class WsStreamStarted(BaseModel):
     """End timestamp in milliseconds."""
 
 
-class WsStreamProgress(BaseModel):
+class WsStreamProgress(_Model):
     """Stream progress response (sent every ~2 seconds)."""
 
     type: Literal["stream_progress"]
     snapshots_sent: int
 
 
-class TimestampedRecord(BaseModel):
+class TimestampedRecord(_Model):
     """A record with timestamp for batched data."""
 
     timestamp: int
     data: dict[str, Any]
 
 
-class WsHistoricalBatch(BaseModel):
+class WsHistoricalBatch(_Model):
     """Batch of historical data (bulk streaming)."""
 
     type: Literal["historical_batch"]
@@ -755,7 +766,7 @@ class WsHistoricalBatch(BaseModel):
     data: list[TimestampedRecord]
 
 
-class WsStreamCompleted(BaseModel):
+class WsStreamCompleted(_Model):
     """Stream completed response.
 
     In multi-channel mode, ``channels`` lists all channels that were streamed.
@@ -770,14 +781,14 @@ class WsStreamCompleted(BaseModel):
     snapshots_sent: int
 
 
-class WsStreamStopped(BaseModel):
+class WsStreamStopped(_Model):
     """Stream stopped response."""
 
     type: Literal["stream_stopped"]
     snapshots_sent: int
 
 
-class WsGapDetected(BaseModel):
+class WsGapDetected(_Model):
     """Gap detected in historical data stream.
 
     Sent when there's a gap exceeding the threshold between consecutive data points.
@@ -800,7 +811,7 @@ class WsGapDetected(BaseModel):
 # =============================================================================
 
 
-class SiweChallenge(BaseModel):
+class SiweChallenge(_Model):
     """SIWE challenge message returned by the challenge endpoint."""
 
     message: str
@@ -810,7 +821,7 @@ class SiweChallenge(BaseModel):
     """Single-use nonce (expires after 10 minutes)."""
 
 
-class Web3SignupResult(BaseModel):
+class Web3SignupResult(_Model):
     """Result of creating a free-tier account via wallet signature."""
 
     api_key: str
@@ -823,7 +834,7 @@ class Web3SignupResult(BaseModel):
     """The wallet address that owns this key."""
 
 
-class Web3ApiKey(BaseModel):
+class Web3ApiKey(_Model):
     """An API key record returned by the keys endpoint."""
 
     id: str
@@ -845,7 +856,7 @@ class Web3ApiKey(BaseModel):
     """Creation timestamp (ISO 8601)."""
 
 
-class Web3KeysList(BaseModel):
+class Web3KeysList(_Model):
     """List of API keys for a wallet."""
 
     keys: list[Web3ApiKey]
@@ -855,7 +866,7 @@ class Web3KeysList(BaseModel):
     """The wallet address."""
 
 
-class Web3RevokeResult(BaseModel):
+class Web3RevokeResult(_Model):
     """Result of revoking an API key."""
 
     message: str
@@ -865,7 +876,7 @@ class Web3RevokeResult(BaseModel):
     """The wallet address that owned the key."""
 
 
-class Web3PaymentRequired(BaseModel):
+class Web3PaymentRequired(_Model):
     """x402 payment details returned by subscribe (402 response)."""
 
     amount: str
@@ -884,7 +895,7 @@ class Web3PaymentRequired(BaseModel):
     """Token contract address."""
 
 
-class Web3SubscribeResult(BaseModel):
+class Web3SubscribeResult(_Model):
     """Result of a successful x402 subscription."""
 
     api_key: str
@@ -928,7 +939,7 @@ class OxArchiveError(Exception):
 # =============================================================================
 
 
-class CursorResponse(BaseModel, Generic[T]):
+class CursorResponse(_Model, Generic[T]):
     """Response with cursor for pagination."""
 
     data: T
@@ -947,17 +958,20 @@ Timestamp = Union[int, str, datetime]
 # Data Quality Types
 # =============================================================================
 
+StatusValue = Literal["operational", "degraded", "outage", "maintenance"]
+"""Status shared by the system, exchanges and data types."""
+
 
-class SystemStatus(BaseModel):
+class SystemStatus(_Model):
     """System status values: operational, degraded, outage, maintenance."""
 
-    status: Literal["operational", "degraded", "outage", "maintenance"]
+    status: StatusValue
 
 
-class ExchangeStatus(BaseModel):
+class ExchangeStatus(_Model):
     """Status of a single exchange."""
 
-    status: Literal["operational", "degraded", "outage", "maintenance"]
+    status: StatusValue
     """Current status."""
 
     last_data_at: Optional[datetime] = None
@@ -967,20 +981,20 @@ class ExchangeStatus(BaseModel):
     """Current latency in milliseconds."""
 
 
-class DataTypeStatus(BaseModel):
+class DataTypeStatus(_Model):
     """Status of a data type (orderbook, fills, etc.)."""
 
-    status: Literal["operational", "degraded", "outage", "maintenance"]
+    status: StatusValue
     """Current status."""
 
     completeness_24h: float
     """Data completeness over last 24 hours (0-100)."""
 
 
-class StatusResponse(BaseModel):
+class StatusResponse(_Model):
     """Overall system status response."""
 
-    status: Literal["operational", "degraded", "outage", "maintenance"]
+    status: StatusValue
     """Overall system status."""
 
     updated_at: datetime
@@ -996,7 +1010,7 @@ class StatusResponse(BaseModel):
     """Number of active incidents."""
 
 
-class DataTypeCoverage(BaseModel):
+class DataTypeCoverage(_Model):
     """Coverage information for a specific data type."""
 
     earliest: datetime
@@ -1021,7 +1035,7 @@ class DataTypeCoverage(BaseModel):
     """Completeness percentage (0-100)."""
 
 
-class ExchangeCoverage(BaseModel):
+class ExchangeCoverage(_Model):
     """Coverage for a single exchange."""
 
     exchange: str
@@ -1031,14 +1045,14 @@ class ExchangeCoverage(BaseModel):
     """Coverage per data type."""
 
 
-class CoverageResponse(BaseModel):
+class CoverageResponse(_Model):
     """Overall coverage response."""
 
     exchanges: list[ExchangeCoverage]
     """Coverage for all exchanges."""
 
 
-class CoverageGap(BaseModel):
+class CoverageGap(_Model):
     """Gap information for per-symbol coverage."""
 
     start: datetime
@@ -1051,7 +1065,7 @@ class CoverageGap(BaseModel):
     """Duration of the gap in minutes."""
 
 
-class DataCadence(BaseModel):
+class DataCadence(_Model):
     """Empirical data cadence measurement based on last 7 days of data."""
 
     median_interval_seconds: float
@@ -1064,7 +1078,7 @@ class DataCadence(BaseModel):
     """Number of intervals sampled for this measurement."""
 
 
-class SymbolDataTypeCoverage(BaseModel):
+class SymbolDataTypeCoverage(_Model):
     """Coverage for a specific symbol and data type."""
 
     earliest: datetime
@@ -1089,7 +1103,7 @@ class SymbolDataTypeCoverage(BaseModel):
     """Empirical data cadence (present when sufficient data exists)."""
 
 
-class SymbolCoverageResponse(BaseModel):
+class SymbolCoverageResponse(_Model):
     """Per-symbol coverage response."""
 
     exchange: str
@@ -1102,7 +1116,7 @@ class SymbolCoverageResponse(BaseModel):
     """Coverage per data type."""
 
 
-class Incident(BaseModel):
+class Incident(_Model):
     """Data quality incident."""
 
     id: str
@@ -1151,7 +1165,7 @@ class Incident(BaseModel):
     """Number of records recovered."""
 
 
-class Pagination(BaseModel):
+class Pagination(_Model):
     """Pagination info for incident list."""
 
     total: int
@@ -1164,7 +1178,7 @@ class Pagination(BaseModel):
     """Current offset."""
 
 
-class IncidentsResponse(BaseModel):
+class IncidentsResponse(_Model):
     """Incidents list response."""
 
     incidents: list[Incident]
@@ -1174,7 +1188,7 @@ class IncidentsResponse(BaseModel):
     """Pagination info."""
 
 
-class WebSocketLatency(BaseModel):
+class WebSocketLatency(_Model):
     """WebSocket latency metrics."""
 
     current_ms: int
@@ -1190,7 +1204,7 @@ class WebSocketLatency(BaseModel):
     """24-hour P99 latency."""
 
 
-class ApiLatency(BaseModel):
+class ApiLatency(_Model):
     """REST API latency metrics."""
 
     current_ms: int
@@ -1203,7 +1217,7 @@ class ApiLatency(BaseModel):
     """24-hour average latency."""
 
 
-class DataFreshness(BaseModel):
+class DataFreshness(_Model):
     """Data freshness metrics (lag from source)."""
 
     orderbook_lag_ms: Optional[int] = None
@@ -1219,7 +1233,7 @@ class DataFreshness(BaseModel):
     """Open interest data lag."""
 
 
-class ExchangeLatency(BaseModel):
+class ExchangeLatency(_Model):
     """Latency metrics for a single exchange."""
 
     websocket: Optional[WebSocketLatency] = None
@@ -1232,7 +1246,7 @@ class ExchangeLatency(BaseModel):
     """Data freshness metrics."""
 
 
-class LatencyResponse(BaseModel):
+class LatencyResponse(_Model):
     """Overall latency response."""
 
     measured_at: datetime
@@ -1242,7 +1256,7 @@ class LatencyResponse(BaseModel):
     """Per-exchange latency metrics."""
 
 
-class SlaTargets(BaseModel):
+class SlaTargets(_Model):
     """SLA targets."""
 
     uptime: float
@@ -1255,7 +1269,7 @@ class SlaTargets(BaseModel):
     """API P99 latency target in milliseconds."""
 
 
-class CompletenessMetrics(BaseModel):
+class CompletenessMetrics(_Model):
     """Completeness metrics per data type."""
 
     orderbook: float
@@ -1271,7 +1285,7 @@ class CompletenessMetrics(BaseModel):
     """Overall completeness percentage."""
 
 
-class SlaActual(BaseModel):
+class SlaActual(_Model):
     """Actual SLA metrics."""
 
     uptime: float
@@ -1293,7 +1307,7 @@ class SlaActual(BaseModel):
     """'met' or 'missed'."""
 
 
-class SlaResponse(BaseModel):
+class SlaResponse(_Model):
     """SLA compliance response."""
 
     period: str
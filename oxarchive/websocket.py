@@ -37,9 +37,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sys
 from dataclasses import dataclass, field
+from importlib.util import find_spec
 from typing import Any, Callable, Optional, Set, Union
 
+from pydantic import TypeAdapter
+
 try:
     from websockets.asyncio.client import connect as ws_connect, ClientConnection
     from websockets.exceptions import ConnectionClosed
@@ -53,7 +57,6 @@ except ImportError:
 from .types import (
     OrderBook,
     OrderbookDelta,
-    PriceLevel,
     Trade,
     WsChannel,
     WsConnectionState,
@@ -77,7 +80,9 @@ from .types import (
     WsStreamStopped,
     WsGapDetected,
     TimestampedRecord,
+    _DEFER_BUILD,
 )
+from .http import _json_loads
 
 logger = logging.getLogger("oxarchive.websocket")
 
@@ -86,6 +91,19 @@ DEFAULT_PING_INTERVAL = 30
 DEFAULT_RECONNECT_DELAY = 1.0
 DEFAULT_MAX_RECONNECT_ATTEMPTS = 10
 
+# Control messages, validated only when an on_message handler will receive them
+_CONTROL_MESSAGES: dict[str, type[Union[WsSubscribed, WsUnsubscribed, WsPong, WsError]]] = {
+    "subscribed": WsSubscribed,
+    "unsubscribed": WsUnsubscribed,
+    "pong": WsPong,
+    "error": WsError,
+}
+
+# Validates a whole historical_batch in one call rather than one model per record
+_validate_records = TypeAdapter(list[TimestampedRecord], config=_DEFER_BUILD).validate_python
+_validate_trades = TypeAdapter(list[Trade], config=_DEFER_BUILD).validate_python
+
+
 # Server idle timeout is 60 seconds. The SDK sends pings every 30 seconds
 # to keep the connection alive. The websockets library also automatically
 # responds to WebSocket protocol-level ping frames from the server.
@@ -131,6 +149,7 @@ ReplayCompleteHandler = Callable[[WsChannel, str, int], None]  # channel, coin,
 
 # Stream handlers
 BatchHandler = Callable[[str, list[TimestampedRecord]], None]
+ArrowBatchHandler = Callable[[WsChannel, str, Any], None]  # channel, coin, pyarrow.RecordBatch
 StreamStartHandler = Callable[[WsChannel, str, int, int], None]  # channel, coin, start, end
 StreamProgressHandler = Callable[[int], None]  # snapshots_sent
 StreamCompleteHandler = Callable[[WsChannel, str, int], None]  # channel, coin, snapshots_sent
@@ -139,30 +158,33 @@ StreamCompleteHandler = Callable[[WsChannel, str, int], None]  # channel, coin,
 GapHandler = Callable[[WsChannel, str, int, int, int], None]  # channel, coin, gap_start, gap_end, duration_minutes
 
 
-def _transform_trade(coin: str, raw: dict) -> Trade:
-    """Transform raw Hyperliquid trade format to SDK Trade type.
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _trade_fields(coin: str, raw: dict) -> dict[str, Any]:
+    """Map a raw Hyperliquid trade to SDK Trade fields.
 
     Raw WebSocket format: { coin, side, px, sz, time, hash, tid, users: [maker, taker] }
     Historical replay format: { coin, side, price, size, time, hash, tradeId, userAddress, ... }
     SDK format: { coin, side, price, size, timestamp, tx_hash, trade_id, maker_address, taker_address }
     """
-    from datetime import datetime
-
     # Check if already in SDK format (from REST API or historical replay)
     if "price" in raw and "size" in raw:
         # Map camelCase keys from WebSocket to snake_case for Pydantic
-        mapped = {
-            "coin": raw.get("coin", coin),
+        mapped: dict[str, Any] = {
+            "coin": sys.intern(raw.get("coin", coin)),
             "side": raw.get("side", "B"),
             "price": raw.get("price"),
             "size": raw.get("size"),
-            "timestamp": raw.get("timestamp") or (datetime.utcfromtimestamp(raw.get("time", 0) / 1000).isoformat() + "Z" if raw.get("time") else None),
+            # Epoch ms is passed through; pydantic-core converts it to a UTC datetime
+            "timestamp": raw.get("timestamp") or raw.get("time") or None,
             "tx_hash": raw.get("tx_hash") or raw.get("hash"),
             "trade_id": raw.get("trade_id") or raw.get("tradeId"),
             "order_id": raw.get("order_id") or raw.get("orderId"),
             "crossed": raw.get("crossed"),
             "fee": raw.get("fee"),
-            "fee_token": raw.get("fee_token") or raw.get("feeToken"),
+            "fee_token": _intern_optional(raw.get("fee_token") or raw.get("feeToken")),
             "closed_pnl": raw.get("closed_pnl") or raw.get("closedPnl"),
             "direction": raw.get("direction"),
             "start_position": raw.get("start_position") or raw.get("startPosition"),
@@ -171,12 +193,10 @@ def _transform_trade(coin: str, raw: dict) -> Trade:
             "taker_address": raw.get("taker_address"),
         }
         # Remove None values to let Pydantic use defaults
-        mapped = {k: v for k, v in mapped.items() if v is not None}
-        return Trade(**mapped)
+        return {k: v for k, v in mapped.items() if v is not None}
 
     # Transform from Hyperliquid raw format
-    time_ms = raw.get("time")
-    timestamp = datetime.utcfromtimestamp(time_ms / 1000).isoformat() + "Z" if time_ms else None
+    timestamp = raw.get("time") or None
 
     # Extract maker/taker addresses from users array
     # WebSocket trades have: users: [maker_address, taker_address]
@@ -184,26 +204,41 @@ def _transform_trade(coin: str, raw: dict) -> Trade:
     maker_address = users[0] if len(users) > 0 else None
     taker_address = users[1] if len(users) > 1 else None
 
-    return Trade(
-        coin=raw.get("coin", coin),
-        side=raw.get("side", "B"),
-        price=str(raw.get("px", "0")),
-        size=str(raw.get("sz", "0")),
-        timestamp=timestamp,
-        tx_hash=raw.get("hash"),
-        trade_id=raw.get("tid"),
-        maker_address=maker_address,
-        taker_address=taker_address,
+    return {
+        "coin": sys.intern(raw.get("coin", coin)),
+        "side": raw.get("side", "B"),
+        "price": str(raw.get("px", "0")),
+        "size": str(raw.get("sz", "0")),
+        "timestamp": timestamp,
+        "tx_hash": raw.get("hash"),
+        "trade_id": raw.get("tid"),
+        "maker_address": maker_address,
+        "taker_address": taker_address,
         # user_address is for fill-level data (REST API), not market-level WebSocket trades
-        user_address=raw.get("user_address"),
-    )
+        "user_address": raw.get("user_address"),
+    }
+
+
+def _transform_trade(coin: str, raw: dict[str, Any]) -> Trade:
+    """Transform raw Hyperliquid trade format to SDK Trade type."""
+    return Trade(**_trade_fields(coin, raw))
 
 
 def _transform_trades(coin: str, raw_data: list) -> list[Trade]:
     """Transform a list of raw trades to SDK Trade types."""
     if not isinstance(raw_data, list):
         return [_transform_trade(coin, raw_data)]
-    return [_transform_trade(coin, t) for t in raw_data]
+    # One validator call for the whole message rather than one per trade
+    return _validate_trades([_trade_fields(coin, t) for t in raw_data])
+
+
+def _level_dict(level: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a raw {px, sz, n} level for PriceLevel validation."""
+    return {
+        "px": str(level.get("px", "0")),
+        "sz": str(level.get("sz", "0")),
+        "n": int(level.get("n", 0)),
+    }
 
 
 def _transform_orderbook(coin: str, raw: dict) -> OrderBook:
@@ -223,18 +258,19 @@ def _transform_orderbook(coin: str, raw: dict) -> OrderBook:
     levels = raw.get("levels", [[], []])
     time_ms = raw.get("time")
 
-    bids = []
-    asks = []
+    bids: list[dict[str, Any]] = []
+    asks: list[dict[str, Any]] = []
 
     if len(levels) >= 2:
         # levels[0] = bids, levels[1] = asks
         # Each level is already {px, sz, n} object
+        # Levels are validated into PriceLevel together with the OrderBook below
         for level in levels[0] or []:
             if isinstance(level, dict):
-                bids.append(PriceLevel(px=str(level.get("px", "0")), sz=str(level.get("sz", "0")), n=int(level.get("n", 0))))
+                bids.append(_level_dict(level))
         for level in levels[1] or []:
             if isinstance(level, dict):
-                asks.append(PriceLevel(px=str(level.get("px", "0")), sz=str(level.get("sz", "0")), n=int(level.get("n", 0))))
+                asks.append(_level_dict(level))
 
     # Calculate mid price and spread
     mid_price = None
@@ -242,27 +278,36 @@ def _transform_orderbook(coin: str, raw: dict) -> OrderBook:
     spread_bps = None
 
     if bids and asks:
-        best_bid = float(bids[0].px)
-        best_ask = float(asks[0].px)
+        best_bid = float(bids[0]["px"])
+        best_ask = float(asks[0]["px"])
         mid = (best_bid + best_ask) / 2
         mid_price = str(mid)
         spread = str(best_ask - best_bid)
         spread_bps = f"{((best_ask - best_bid) / mid * 10000):.2f}"
 
-    # Convert timestamp
+    # Epoch ms is validated straight into a UTC datetime, without an ISO round trip
     if time_ms:
-        timestamp = datetime.utcfromtimestamp(time_ms / 1000).isoformat() + "Z"
+        timestamp = time_ms
     else:
         timestamp = datetime.utcnow().isoformat() + "Z"
 
-    return OrderBook(
-        coin=coin,
-        timestamp=timestamp,
-        bids=bids,
-        asks=asks,
-        mid_price=mid_price,
-        spread=spread,
-        spread_bps=spread_bps,
+    return OrderBook.model_validate({
+        "coin": coin,
+        "timestamp": timestamp,
+        "bids": bids,
+        "asks": asks,
+        "mid_price": mid_price,
+        "spread": spread,
+        "spread_bps": spread_bps,
+    })
+
+
+def _record_batch(records: list[dict[str, Any]]) -> Any:
+    """Flatten historical_batch records into one pyarrow.RecordBatch."""
+    import pyarrow as pa
+
+    return pa.RecordBatch.from_pylist(
+        [{**record["data"], "timestamp": record["timestamp"]} for record in records]
     )
 
 
@@ -302,6 +347,7 @@ class OxArchiveWs:
 
         # Stream handlers (Option D)
         self._on_batch: Optional[BatchHandler] = None
+        self._on_batch_arrow: Optional[ArrowBatchHandler] = None
         self._on_stream_start: Optional[StreamStartHandler] = None
         self._on_stream_progress: Optional[StreamProgressHandler] = None
         self._on_stream_complete: Optional[StreamCompleteHandler] = None
@@ -735,6 +781,24 @@ class OxArchiveWs:
         """
         self._on_batch = handler
 
+    def on_batch_arrow(self, handler: ArrowBatchHandler) -> None:
+        """Set handler for batched data as Arrow record batches (bulk stream mode).
+
+        Handler receives: (channel, coin, batch) where batch is a
+        ``pyarrow.RecordBatch`` with a ``timestamp`` column plus one column
+        per field of the records' data. Rows are built straight from the
+        decoded message, without a TimestampedRecord per row; use
+        ``batch.to_pandas()`` or ``polars.from_arrow(batch)`` downstream.
+        Can be combined with :meth:`on_batch`.
+
+        Requires pyarrow (``pip install oxarchive[arrow]``).
+        """
+        if find_spec("pyarrow") is None:
+            raise ImportError(
+                "on_batch_arrow() requires pyarrow. Install with: pip install oxarchive[arrow]"
+            )
+        self._on_batch_arrow = handler
+
     def on_stream_start(self, handler: StreamStartHandler) -> None:
         """Set handler for stream started event.
 
@@ -852,37 +916,25 @@ class OxArchiveWs:
     def _handle_message(self, raw: str) -> None:
         """Handle incoming message."""
         try:
-            data = json.loads(raw)
+            data = _json_loads(raw)
             msg_type = data.get("type")
 
-            if msg_type == "subscribed":
-                msg = WsSubscribed(**data)
-                if self._on_message:
-                    self._on_message(msg)
-
-            elif msg_type == "unsubscribed":
-                msg = WsUnsubscribed(**data)
-                if self._on_message:
-                    self._on_message(msg)
-
-            elif msg_type == "pong":
-                msg = WsPong(**data)
-                if self._on_message:
-                    self._on_message(msg)
-
-            elif msg_type == "error":
-                msg = WsError(**data)
+            control = _CONTROL_MESSAGES.get(msg_type)
+            if control is not None:
                 if self._on_message:
-                    self._on_message(msg)
+                    self._on_message(control(**data))
 
             elif msg_type == "data":
-                msg = WsData(**data)
+                # Data messages arrive at the full feed rate; skip building the
+                # WsData model unless a generic handler wants it
                 if self._on_message:
-                    self._on_message(msg)
+                    self._on_message(WsData(**data))
 
                 # Call typed handlers
                 channel = data.get("channel")
-                coin = data.get("coin", "")
+                # A handful of distinct coins arrive in every message; share one
+                # string per coin across the Trade/OrderBook objects built below
+                coin = sys.intern(data.get("coin", ""))
                 raw_data = data.get("data", {})
 
                 if channel == "orderbook" and self._on_orderbook:
@@ -927,9 +979,13 @@ class OxArchiveWs:
             elif msg_type == "stream_progress" and self._on_stream_progress:
                 self._on_stream_progress(data["snapshots_sent"])
 
-            elif msg_type == "historical_batch" and self._on_batch:
-                records = [TimestampedRecord(**r) for r in data["data"]]
-                self._on_batch(data["coin"], records)
+            elif msg_type == "historical_batch":
+                if self._on_batch:
+                    self._on_batch(data["coin"], _validate_records(data["data"]))
+                if self._on_batch_arrow:
+                    self._on_batch_arrow(
+                        data["channel"], data["coin"], _record_batch(data["data"])
+                    )
 
             elif msg_type == "stream_completed" and self._on_stream_complete:
                 channel = data.get("channel") or (data.get("channels", [None])[0])
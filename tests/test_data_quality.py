@@ -0,0 +1,168 @@
+"""Tests for the symbol coverage decoders and batch() in DataQualityResource."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from oxarchive import Client, OxArchiveError
+from oxarchive.resources import data_quality as data_quality_module
+from oxarchive.resources.data_quality import _SYMBOL_COVERAGE_ADAPTER, _decode_symbol_coverage
+
+
+def _gap(hour: int) -> dict[str, Any]:
+    return {
+        "start": f"2024-01-01T{hour:02d}:00:00Z",
+        "end": f"2024-01-01T{hour:02d}:30:00Z",
+        "duration_minutes": 30,
+    }
+
+
+def _coverage(gaps: int) -> dict[str, Any]:
+    return {
+        "earliest": "2023-01-01T00:00:00Z",
+        "latest": "2024-01-02T00:00:00Z",
+        "total_records": 1000,
+        "completeness": 99.5,
+        "historical_coverage": 98.0,
+        "gaps": [_gap(hour) for hour in range(gaps)],
+        "cadence": None,
+    }
+
+
+BODY = json.dumps(
+    {
+        "exchange": "hyperliquid",
+        "symbol": "BTC",
+        "data_types": {"trades": _coverage(12), "orderbook": _coverage(2), "funding": _coverage(0)},
+    }
+).encode()
+
+
+def _decode(monkeypatch: pytest.MonkeyPatch, branch: str, raw: bytes, max_gaps: int) -> Any:
+    if branch == "simdjson":
+        pytest.importorskip("simdjson")
+    monkeypatch.setattr(data_quality_module, "_HAS_SIMDJSON", branch == "simdjson")
+    return _decode_symbol_coverage(raw, max_gaps)
+
+
+@pytest.mark.parametrize("max_gaps", [0, 1, 5, 50])
+def test_decoders_truncate_gaps_identically(monkeypatch: pytest.MonkeyPatch, max_gaps: int) -> None:
+    pytest.importorskip("simdjson")
+    stdlib = _decode(monkeypatch, "stdlib", BODY, max_gaps)
+    simdjson = _decode(monkeypatch, "simdjson", BODY, max_gaps)
+
+    assert simdjson == stdlib
+    assert all(
+        type(gap) is dict for data in simdjson["data_types"].values() for gap in data["gaps"]
+    )
+
+    full = json.loads(BODY)["data_types"]
+    response = _SYMBOL_COVERAGE_ADAPTER.validate_python(simdjson)
+    for name, coverage in response.data_types.items():
+        assert len(coverage.gaps) == min(max_gaps, len(full[name]["gaps"]))
+        assert coverage.total_records == 1000
+
+
+@pytest.mark.parametrize("branch", ["stdlib", "simdjson"])
+def test_missing_data_types_is_tolerated(monkeypatch: pytest.MonkeyPatch, branch: str) -> None:
+    raw = b'{"exchange": "hyperliquid", "symbol": "BTC"}'
+
+    assert _decode(monkeypatch, branch, raw, 3) == {"exchange": "hyperliquid", "symbol": "BTC"}
+
+
+def _incident(incident_id: str) -> dict[str, Any]:
+    return {
+        "id": incident_id,
+        "status": "resolved",
+        "severity": "minor",
+        "data_types": ["trades"],
+        "symbols_affected": ["BTC"],
+        "started_at": "2024-01-01T00:00:00Z",
+        "title": f"Incident {incident_id}",
+    }
+
+
+def _batch_client(finished: list[str]) -> Client:
+    """Client whose background-loop requests go to a mock incidents endpoint."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # "<delay ms>-<ok|bad>": later calls finish first when their delay is shorter
+        incident_id = request.url.path.rsplit("/", 1)[-1]
+        delay, outcome = incident_id.split("-")
+        await asyncio.sleep(int(delay) / 1000)
+        finished.append(incident_id)
+        if outcome == "bad":
+            return httpx.Response(404, json={"error": f"missing {incident_id}"})
+        return httpx.Response(200, json=_incident(incident_id))
+
+    client = Client(api_key="test")
+    http = client._http
+    http._new_async_client = lambda: httpx.AsyncClient(  # type: ignore[method-assign]
+        base_url=http.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_batch_returns_results_in_call_order() -> None:
+    finished: list[str] = []
+    with _batch_client(finished) as client:
+        ids = ["60-ok", "30-ok", "0-ok"]
+
+        results = client.data_quality.batch(
+            [("get_incident", {"incident_id": incident_id}) for incident_id in ids]
+        )
+
+    assert [incident.id for incident in results] == ids
+    # The requests overlapped: the shortest one finished first
+    assert finished == ids[::-1]
+
+
+def test_batch_raises_first_error_after_all_finish() -> None:
+    finished: list[str] = []
+    with _batch_client(finished) as client:
+        calls = [
+            ("get_incident", {"incident_id": "40-bad"}),
+            ("get_incident", {"incident_id": "0-bad"}),
+            ("get_incident", {"incident_id": "80-ok"}),
+        ]
+
+        with pytest.raises(OxArchiveError, match="missing 40-bad"):
+            client.data_quality.batch(calls)
+
+        assert sorted(finished) == ["0-bad", "40-bad", "80-ok"]
+
+
+@pytest.mark.parametrize("name", ["no_such_method", "batch", "get_incident ", "_private"])
+def test_batch_rejects_unknown_methods(name: str) -> None:
+    with _batch_client([]) as client:
+        # "_private" resolves to a coroutine method, so only its prefix rejects it
+        client.data_quality.a_private = client.data_quality.astatus  # type: ignore[attr-defined]
+        with pytest.raises(ValueError, match="Unknown data quality method"):
+            client.data_quality.batch([("status", {}), (name, {})])
+
+        # Nothing was scheduled, so the background loop never started
+        assert client._http._loop_thread is None
+
+
+def test_empty_batch_does_not_start_the_loop() -> None:
+    with _batch_client([]) as client:
+        assert client.data_quality.batch([]) == []
+        assert client._http._loop_thread is None
+
+
+def test_close_stops_the_background_loop() -> None:
+    client = _batch_client([])
+    client.data_quality.batch([("get_incident", {"incident_id": "0-ok"})])
+    thread = client._http._loop_thread
+    assert thread is not None and thread.is_alive()
+
+    client.close()
+
+    assert not thread.is_alive()
+    assert client._http._loop is None and client._http._loop_thread is None
+    assert client._http._loop_client is None
@@ -0,0 +1,145 @@
+"""Tests for LiquidationArrays decoding and volume bucketing."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from oxarchive import liquidation_arrays as liquidation_arrays_module  # noqa: E402
+from oxarchive.liquidation_arrays import SIDE_BUY, SIDE_SELL, LiquidationArrays  # noqa: E402
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+START_MS = 1_704_067_200_000
+
+
+def _liquidation(
+    minutes: int,
+    side: str,
+    price: str,
+    size: str,
+    mark_price: Optional[str] = None,
+    closed_pnl: Optional[str] = None,
+) -> dict[str, Any]:
+    return {
+        "coin": "BTC",
+        "timestamp": (START + timedelta(minutes=minutes)).isoformat().replace("+00:00", "Z"),
+        "liquidated_user": "0xabc",
+        "liquidator_user": "0xdef",
+        "price": price,
+        "size": size,
+        "side": side,
+        "mark_price": mark_price,
+        "closed_pnl": closed_pnl,
+        "direction": "Close Long" if side == "S" else "Close Short",
+        "trade_id": minutes,
+        "tx_hash": "0x01",
+    }
+
+
+# Hour 0: two longs (sells) and one short; hour 2: one short; hour 1 is empty
+LIQUIDATIONS = [
+    _liquidation(5, "S", "100", "2", mark_price="100.5", closed_pnl="-12.25"),
+    _liquidation(20, "B", "101", "1"),
+    _liquidation(59, "S", "99", "0.5", mark_price="99.5"),
+    _liquidation(130, "B", "102", "4", closed_pnl="3.5"),
+]
+
+BODY = json.dumps(
+    {"success": True, "data": LIQUIDATIONS, "meta": {"count": 4, "next_cursor": "next-page"}}
+).encode()
+
+DECODERS = ["msgspec", "pydantic"]
+
+
+def _page(monkeypatch: pytest.MonkeyPatch, decoder: str, raw: bytes) -> Any:
+    if decoder == "msgspec":
+        pytest.importorskip("msgspec")
+        if not hasattr(liquidation_arrays_module, "_PAGE_DECODER"):
+            pytest.skip("msgspec decoder was not built at import time")
+    monkeypatch.setattr(liquidation_arrays_module, "_HAS_MSGSPEC", decoder == "msgspec")
+    return LiquidationArrays.page_from_json(raw)
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_page_from_json_columns(monkeypatch: pytest.MonkeyPatch, decoder: str) -> None:
+    page = _page(monkeypatch, decoder, BODY)
+    arrays = page.data
+
+    assert page.next_cursor == "next-page"
+    assert len(arrays) == 4
+    assert arrays.coin == ["BTC"] * 4
+    assert arrays.timestamp.dtype == np.int64
+    assert arrays.timestamp.tolist() == [START_MS + m * 60_000 for m in (5, 20, 59, 130)]
+    assert arrays.price.tolist() == [100.0, 101.0, 99.0, 102.0]
+    assert arrays.size.tolist() == [2.0, 1.0, 0.5, 4.0]
+    assert arrays.side.tolist() == [SIDE_SELL, SIDE_BUY, SIDE_SELL, SIDE_BUY]
+    np.testing.assert_array_equal(arrays.mark_price, [100.5, np.nan, 99.5, np.nan])
+    np.testing.assert_array_equal(arrays.closed_pnl, [-12.25, np.nan, np.nan, 3.5])
+
+
+def test_decoders_match(monkeypatch: pytest.MonkeyPatch) -> None:
+    fast = _page(monkeypatch, "msgspec", BODY)
+    slow = _page(monkeypatch, "pydantic", BODY)
+
+    assert fast.next_cursor == slow.next_cursor
+    assert fast.data.coin == slow.data.coin
+    for column in ("timestamp", "price", "size", "side", "mark_price", "closed_pnl"):
+        np.testing.assert_array_equal(getattr(fast.data, column), getattr(slow.data, column))
+        assert getattr(fast.data, column).dtype == getattr(slow.data, column).dtype
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_page_without_meta(monkeypatch: pytest.MonkeyPatch, decoder: str) -> None:
+    raw = json.dumps({"success": True, "data": []}).encode()
+
+    page = _page(monkeypatch, decoder, raw)
+
+    assert page.next_cursor is None
+    assert len(page.data) == 0
+
+
+def test_volume_splits_longs_and_shorts() -> None:
+    arrays = LiquidationArrays.page_from_json(BODY).data
+
+    buckets = arrays.volume("1h")
+
+    assert [bucket.timestamp for bucket in buckets] == [START, START + timedelta(hours=2)]
+    first, second = buckets
+    assert (first.total_usd, first.long_usd, first.short_usd) == (350.5, 249.5, 101.0)
+    assert (first.count, first.long_count, first.short_count) == (3, 2, 1)
+    assert (second.total_usd, second.long_usd, second.short_usd) == (408.0, 0.0, 408.0)
+    assert (second.count, second.long_count, second.short_count) == (1, 0, 1)
+    assert {bucket.coin for bucket in buckets} == {"BTC"}
+
+
+def test_volume_sorts_by_timestamp() -> None:
+    arrays = LiquidationArrays.page_from_json(BODY).data
+    order = [3, 1, 0, 2]
+    shuffled = LiquidationArrays(
+        [arrays.coin[i] for i in order],
+        arrays.timestamp[order],
+        arrays.price[order],
+        arrays.size[order],
+        arrays.side[order],
+        arrays.mark_price[order],
+        arrays.closed_pnl[order],
+    )
+
+    assert shuffled.volume("1h") == arrays.volume("1h")
+
+
+def test_volume_rejects_mixed_coins() -> None:
+    arrays = LiquidationArrays.page_from_json(BODY).data
+    arrays.coin[0] = "ETH"
+
+    with pytest.raises(ValueError, match="single coin"):
+        arrays.volume("1h")
+
+
+def test_volume_of_empty_page() -> None:
+    assert LiquidationArrays.page_from_json(b'{"data": []}').data.volume("1h") == []
@@ -0,0 +1,51 @@
+"""Tests for OrderBookResource.ahistory_all() sub-range merging."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from oxarchive import Client
+
+START = 1_704_067_200_000
+END = START + 1_000
+
+
+def _snapshot(timestamp: int, px: str) -> dict[str, Any]:
+    return {
+        "coin": "BTC",
+        "timestamp": datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).isoformat(),
+        "bids": [{"px": px, "sz": "1", "n": 1}],
+        "asks": [],
+    }
+
+
+async def test_equal_timestamps_kept_and_seam_deduplicated() -> None:
+    # Two distinct snapshots share START + 100 inside the first sub-range,
+    # and START + 500 is the boundary returned by both sub-ranges
+    dataset = [
+        (START + 100, "1"),
+        (START + 100, "2"),
+        (START + 500, "3"),
+        (START + 700, "4"),
+        (START + 700, "5"),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        end = int(request.url.params["end"])
+        data = [_snapshot(ts, px) for ts, px in dataset if start <= ts <= end]
+        return httpx.Response(200, json={"success": True, "data": data, "meta": {}})
+
+    client = Client(api_key="test")
+    client._http._async_client = httpx.AsyncClient(
+        base_url=client._http.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    snapshots = await client.hyperliquid.orderbook.ahistory_all(
+        "BTC", start=START, end=END, concurrency=2
+    )
+
+    assert [s.bids[0].px for s in snapshots] == ["1", "2", "3", "4", "5"]
@@ -0,0 +1,183 @@
+"""Equivalence tests for the OrderBookReconstructor fast paths."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from oxarchive import orderbook_reconstructor as reconstructor_module
+from oxarchive.orderbook_reconstructor import (
+    _NUMBA_MIN_DELTAS,
+    _NUMPY_MIN_DELTAS,
+    SIDE_ASK,
+    SIDE_BID,
+    OrderbookDelta,
+    OrderBookReconstructor,
+    ReconstructOptions,
+    _ArrayBookSide,
+)
+from oxarchive.types import OrderBook
+
+DEPTH = 5
+
+# Switches for the accelerated paths; every configuration must match the
+# pure-Python one exactly
+CONFIGS = {
+    "python": {"_HAS_NUMBA": False, "_HAS_NUMPY": False},
+    "numpy": {"_HAS_NUMBA": False, "_HAS_NUMPY": True},
+    "numba": {"_HAS_NUMBA": True, "_HAS_NUMPY": True},
+}
+
+# Input sizes on either side of the bulk-path thresholds
+SIZES = [
+    min(_NUMBA_MIN_DELTAS, _NUMPY_MIN_DELTAS) - 12,
+    max(_NUMBA_MIN_DELTAS, _NUMPY_MIN_DELTAS) + 300,
+]
+
+
+def _checkpoint(rng: random.Random) -> OrderBook:
+    def levels(prices: list[float]) -> list[dict[str, Any]]:
+        return [
+            {"px": str(px), "sz": str(round(rng.uniform(0.1, 10), 3)), "n": rng.randint(1, 9)}
+            for px in prices
+        ]
+
+    return OrderBook.model_validate(
+        {
+            "coin": "BTC",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "bids": levels([100 - 0.5 * i for i in range(1, 21)]),
+            "asks": levels([100 + 0.5 * i for i in range(1, 21)]),
+        }
+    )
+
+
+def _deltas(rng: random.Random, n: int) -> list[OrderbookDelta]:
+    deltas = []
+    timestamp = 1_704_067_200_000
+    for sequence in range(1, n + 1):
+        timestamp += rng.randint(0, 3)
+        side = rng.choice((SIDE_BID, SIDE_ASK))
+        offset = 0.5 * rng.randint(0, 30)
+        price = 100 - offset if side == SIDE_BID else 100 + offset
+        # Roughly a third of the deltas remove a level
+        size = 0.0 if rng.random() < 0.35 else round(rng.uniform(0.1, 10), 3)
+        deltas.append(OrderbookDelta(timestamp, side, price, size, sequence))
+    return deltas
+
+
+def _naive_final(
+    checkpoint: OrderBook, deltas: list[OrderbookDelta]
+) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
+    """Top levels after replaying deltas into plain dicts."""
+    bids = {float(level.px): float(level.sz) for level in checkpoint.bids}
+    asks = {float(level.px): float(level.sz) for level in checkpoint.asks}
+    for delta in sorted(deltas, key=lambda d: d.sequence):
+        book = bids if delta.side == SIDE_BID else asks
+        if delta.size == 0:
+            book.pop(delta.price, None)
+        else:
+            book[delta.price] = delta.size
+    return sorted(bids.items(), reverse=True)[:DEPTH], sorted(asks.items())[:DEPTH]
+
+
+def _outputs(checkpoint: OrderBook, deltas: list[OrderbookDelta]) -> dict[str, Any]:
+    """Results of every reconstruction entry point for one input."""
+    options = ReconstructOptions(depth=DEPTH)
+    outputs: dict[str, Any] = {
+        "reconstruct_all": OrderBookReconstructor().reconstruct_all(checkpoint, deltas, options),
+        "reconstruct_final": OrderBookReconstructor().reconstruct_final(
+            checkpoint, deltas, DEPTH
+        ),
+        "iterate": list(OrderBookReconstructor().iterate(checkpoint, deltas, DEPTH)),
+        "iterate_views": [
+            view.freeze()
+            for view in OrderBookReconstructor().iterate_views(checkpoint, deltas, DEPTH)
+        ],
+    }
+    if reconstructor_module._HAS_NUMPY:
+        arrays = OrderBookReconstructor().reconstruct_all_arrays(checkpoint, deltas, DEPTH)
+        outputs["reconstruct_all_arrays"] = _array_rows(arrays)
+    return outputs
+
+
+def _array_rows(arrays: Any) -> list[Any]:
+    """SnapshotArrays as comparable per-state rows, with NaN padding dropped."""
+    rows = []
+    for i in range(len(arrays)):
+        bids = [(px, sz) for px, sz in zip(arrays.bid_px[i].tolist(), arrays.bid_sz[i].tolist())]
+        asks = [(px, sz) for px, sz in zip(arrays.ask_px[i].tolist(), arrays.ask_sz[i].tolist())]
+        rows.append(
+            (
+                int(arrays.sequence[i]),
+                [level for level in bids if level[0] == level[0]],
+                [level for level in asks if level[0] == level[0]],
+            )
+        )
+    return rows
+
+
+def _snapshot_rows(snapshots: list[Any]) -> list[Any]:
+    """The rows reconstruct_all_arrays() should hold for these snapshots."""
+    return [
+        (
+            snapshot.sequence,
+            [(float(level.px), float(level.sz)) for level in snapshot.bids],
+            [(float(level.px), float(level.sz)) for level in snapshot.asks],
+        )
+        for snapshot in snapshots
+    ]
+
+
+def _sorted_dict() -> Any:
+    return pytest.importorskip("sortedcontainers").SortedDict
+
+
+# _BookSide is picked at import time, so the fallbacks are swapped in here
+BOOK_SIDES = {"array": lambda: _ArrayBookSide, "sorteddict": _sorted_dict}
+
+
+@pytest.mark.parametrize("book_side", sorted(BOOK_SIDES))
+@pytest.mark.parametrize("config", sorted(CONFIGS))
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("shuffled", [False, True], ids=["sorted", "shuffled"])
+def test_fast_paths_match_pure_python(
+    monkeypatch: pytest.MonkeyPatch, book_side: str, config: str, n: int, shuffled: bool
+) -> None:
+    if config != "python":
+        pytest.importorskip("numpy")
+    if config == "numba":
+        pytest.importorskip("numba")
+
+    rng = random.Random(n)
+    checkpoint = _checkpoint(rng)
+    deltas = _deltas(rng, n)
+
+    # Reference: the pure-Python loop over the dependency-free book side
+    with monkeypatch.context() as pure:
+        pure.setattr(reconstructor_module, "_BookSide", _ArrayBookSide)
+        pure.setattr(reconstructor_module, "_HAS_NUMBA", False)
+        pure.setattr(reconstructor_module, "_HAS_NUMPY", False)
+        expected = _outputs(checkpoint, deltas)
+
+    if shuffled:
+        deltas = deltas[:]
+        rng.shuffle(deltas)
+    monkeypatch.setattr(reconstructor_module, "_BookSide", BOOK_SIDES[book_side]())
+    for name, value in CONFIGS[config].items():
+        monkeypatch.setattr(reconstructor_module, name, value)
+    actual = _outputs(checkpoint, deltas)
+
+    snapshots = expected["reconstruct_all"]
+    assert len(snapshots) == n + 1
+    final_bids, final_asks = _naive_final(checkpoint, deltas)
+    assert [(float(level.px), float(level.sz)) for level in snapshots[-1].bids] == final_bids
+    assert [(float(level.px), float(level.sz)) for level in snapshots[-1].asks] == final_asks
+    assert actual["reconstruct_all"] == snapshots
+    assert actual["reconstruct_final"] == snapshots[-1]
+    assert actual["iterate"] == snapshots
+    assert actual["iterate_views"] == snapshots
+    if "reconstruct_all_arrays" in actual:
+        assert actual["reconstruct_all_arrays"] == _snapshot_rows(snapshots)
@@ -0,0 +1,117 @@
+"""Tests for tick history pagination in OrderBookResource."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from oxarchive import Client
+
+CHECKPOINT = {
+    "coin": "BTC",
+    "timestamp": "2024-01-01T00:00:00Z",
+    "bids": [{"px": "100", "sz": "1", "n": 1}],
+    "asks": [{"px": "101", "sz": "1", "n": 1}],
+}
+
+START = 1_704_067_200_000
+END = START + 10_000
+
+
+def _delta(sequence: int, timestamp: int) -> dict[str, Any]:
+    return {
+        "timestamp": timestamp,
+        "side": "bid" if sequence % 2 else "ask",
+        "price": 100 - sequence % 5 if sequence % 2 else 101 + sequence % 5,
+        "size": 1 + sequence % 3,
+        "sequence": sequence,
+    }
+
+
+def _client(handler: Any) -> Client:
+    client = Client(api_key="test")
+    client._http._client = httpx.Client(
+        base_url=client._http.base_url, transport=httpx.MockTransport(handler)
+    )
+    client._http._async_client = httpx.AsyncClient(
+        base_url=client._http.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _sequences(client: Client, method: str) -> list[int]:
+    """Delta sequences delivered by one of the paginating methods."""
+    orderbook = client.lighter.orderbook
+    if method == "history_tick_stream":
+        _, deltas = orderbook.history_tick_stream("BTC", start=START, end=END)
+        return [delta.sequence for delta in deltas]
+    if method == "iterate_tick_history":
+        snapshots = list(orderbook.iterate_tick_history("BTC", start=START, end=END))
+    else:
+
+        async def collect() -> list[Any]:
+            iterator = orderbook.aiterate_tick_history("BTC", start=START, end=END)
+            return [snapshot async for snapshot in iterator]
+
+        snapshots = asyncio.run(collect())
+    # The first snapshot is the checkpoint itself
+    assert snapshots[0].sequence == 0
+    return [snapshot.sequence for snapshot in snapshots[1:]]
+
+
+METHODS = ["history_tick_stream", "iterate_tick_history", "aiterate_tick_history"]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_page_boundary_inside_one_millisecond(method: str) -> None:
+    # Page 1 ends with sequences 999-1000 at millisecond T, but 1001-1002
+    # share T; page 2 (requested from T) repeats 999-1000 before them.
+    boundary_ms = START + 5_000
+    page1 = [_delta(seq, START + seq) for seq in range(1, 999)]
+    page1 += [_delta(999, boundary_ms), _delta(1000, boundary_ms)]
+    page2 = [_delta(seq, boundary_ms) for seq in (999, 1000, 1001, 1002)]
+    page2 += [_delta(seq, boundary_ms + seq) for seq in range(1003, 1010)]
+
+    requested_starts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        requested_starts.append(start)
+        deltas = page1 if start == START else page2
+        return httpx.Response(
+            200, json={"success": True, "data": {"checkpoint": CHECKPOINT, "deltas": deltas}}
+        )
+
+    sequences = _sequences(_client(handler), method)
+
+    assert requested_starts == [START, boundary_ms]
+    assert sequences == list(range(1, 1010))
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_full_page_inside_one_millisecond_raises(method: str) -> None:
+    page = [_delta(seq, START) for seq in range(1, 1001)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"success": True, "data": {"checkpoint": CHECKPOINT, "deltas": page}}
+        )
+
+    with pytest.raises(ValueError, match="cannot paginate"):
+        _sequences(_client(handler), method)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_out_of_order_delta_raises(method: str) -> None:
+    page = [_delta(seq, START + seq) for seq in (1, 2, 4, 3, 5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"success": True, "data": {"checkpoint": CHECKPOINT, "deltas": page}}
+        )
+
+    with pytest.raises(ValueError, match="sequence order"):
+        _sequences(_client(handler), method)
@@ -0,0 +1,125 @@
+"""Tests for the vectorized OHLCV aggregation in oxarchive.resample."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from oxarchive.resample import candles_from_trades, resample_candles  # noqa: E402
+from oxarchive.types import Candle, Trade  # noqa: E402
+
+# A Monday, so daily and weekly buckets both start here
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _trade(seconds: float, price: str, size: str) -> Trade:
+    return Trade(
+        coin="BTC", side="B", price=price, size=size, timestamp=START + timedelta(seconds=seconds)
+    )
+
+
+def _candle(
+    minutes: int,
+    ohlc: tuple[float, float, float, float],
+    volume: float,
+    quote_volume: Optional[float],
+    trade_count: Optional[int],
+) -> Candle:
+    open_, high, low, close = ohlc
+    return Candle(
+        timestamp=START + timedelta(minutes=minutes),
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        volume=volume,
+        quote_volume=quote_volume,
+        trade_count=trade_count,
+    )
+
+
+def _rows(candles: list[Candle]) -> list[tuple[Any, ...]]:
+    return [
+        (
+            candle.timestamp,
+            candle.open,
+            candle.high,
+            candle.low,
+            candle.close,
+            candle.volume,
+            candle.quote_volume,
+            candle.trade_count,
+        )
+        for candle in candles
+    ]
+
+
+def test_candles_from_trades_per_bucket() -> None:
+    trades = [
+        _trade(10, "100", "1"),
+        _trade(30, "105", "2"),
+        _trade(50, "95", "1"),
+        _trade(59.999, "102", "0.5"),
+        # Minute 1 has no trades and so no candle
+        _trade(150, "110", "1"),
+    ]
+    expected = [
+        (START, 100.0, 105.0, 95.0, 102.0, 4.5, 456.0, 4),
+        (START + timedelta(minutes=2), 110.0, 110.0, 110.0, 110.0, 1.0, 110.0, 1),
+    ]
+
+    assert _rows(candles_from_trades(trades, "1m")) == expected
+    # Input order does not matter across distinct timestamps
+    assert _rows(candles_from_trades(trades[::-1], "1m")) == expected
+
+
+def test_same_millisecond_trades_keep_input_order() -> None:
+    first, second = _trade(5, "100", "1"), _trade(5, "101", "1")
+
+    [candle] = candles_from_trades([first, second], "1m")
+    assert (candle.open, candle.close) == (100.0, 101.0)
+
+    [candle] = candles_from_trades([second, first], "1m")
+    assert (candle.open, candle.close) == (101.0, 100.0)
+
+
+def test_weekly_buckets_start_on_monday() -> None:
+    day = 86_400
+    trades = [
+        _trade(2 * day, "100", "1"),  # Wednesday 2024-01-03
+        _trade(7 * day - 1, "101", "1"),  # Sunday 2024-01-07, last second
+        _trade(7 * day, "102", "1"),  # Monday 2024-01-08
+    ]
+
+    candles = candles_from_trades(trades, "1w")
+
+    assert [candle.timestamp for candle in candles] == [START, START + timedelta(days=7)]
+    assert [candle.trade_count for candle in candles] == [2, 1]
+
+
+def test_resample_candles_sums_and_propagates_none() -> None:
+    candles = [
+        _candle(0, (100, 104, 99, 101), 1.0, 100.0, 3),
+        _candle(1, (101, 106, 100, 103), 2.0, 200.0, 5),
+        _candle(4, (103, 103, 97, 98), 0.5, 50.0, 1),
+        # The second bucket has one candle without quote_volume/trade_count
+        _candle(5, (98, 99, 96, 97), 1.0, None, None),
+        _candle(6, (97, 100, 97, 99), 1.5, 150.0, 2),
+    ]
+
+    assert _rows(resample_candles(candles[::-1], "5m")) == [
+        (START, 100.0, 106.0, 97.0, 98.0, 3.5, 350.0, 9),
+        (START + timedelta(minutes=5), 98.0, 100.0, 96.0, 99.0, 2.5, None, None),
+    ]
+
+
+def test_empty_input_and_unknown_interval() -> None:
+    assert candles_from_trades([], "1m") == []
+    assert resample_candles([], "1h") == []
+
+    with pytest.raises(ValueError, match="Unknown candle interval"):
+        candles_from_trades([_trade(0, "100", "1")], "2m")  # type: ignore[arg-type]